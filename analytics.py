@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Vectorized world and continent statistics over the temporal database
+Population and the religion/race percentage columns of countries_temporal are loaded once
+into year x country NumPy matrices (NaN where a value is missing). Totals, coverage,
+year-over-year growth, population-weighted demographic averages per continent and top-N
+rankings are then computed for every year at once instead of per-year SQL or Python loops.
+The matrices are cached per dataset version, so they are rebuilt only when the file changes.
+
+NumPy is optional (requirements-analytics.txt); without it load() raises AnalyticsError.
+
+Usage:
+    python analytics.py [geography_temporal.db]      # summary of every year
+"""
+
+import sqlite3
+import sys
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import db_pool
+from demographics import SCHEMAS, DemographicsBlock
+
+DATABASE = 'geography_temporal.db'
+
+class AnalyticsError(Exception):
+    pass
+
+class PopulationMatrix:
+    """Year x country matrices for one dataset version"""
+
+    def __init__(self, years, country_ids, names, continent_ids, continent_names, population, continent, demographics):
+        self.years = years                      # (Y,) int
+        self.country_ids = country_ids          # (C,) int
+        self.names = names                      # C country names
+        self.continent_ids = continent_ids      # (K,) int
+        self.continent_names = continent_names  # K continent names
+        self.population = population            # (Y, C) float, NaN = missing
+        self.continent = continent              # (Y, C) continent index, -1 = no row that year
+        self.demographics = demographics        # (Y, C, D) percentages in demographics.SCHEMAS layout, NaN = NULL
+
+    def year_index(self, year):
+        positions = np.flatnonzero(self.years == year)
+        if not positions.size:
+            raise AnalyticsError(f"No data for year {year}")
+        return int(positions[0])
+
+def load_matrix(db):
+    """Build a PopulationMatrix from an open connection with one pass over countries_temporal"""
+    if np is None:
+        raise AnalyticsError("Analytics require numpy (pip install -r requirements-analytics.txt)")
+
+    demographic_columns = [column for schema in SCHEMAS for column in schema.columns]
+    existing = {row[1] for row in db.execute('PRAGMA table_info(countries_temporal)')}
+    selected = ', '.join(column if column in existing else 'NULL' for column in demographic_columns)
+    rows = db.execute(f'''
+        SELECT year, country_id, continent_id, name, population, {selected}
+        FROM countries_temporal
+        ORDER BY year, country_id
+    ''').fetchall()
+    continents = db.execute('''
+        SELECT continent_id, name FROM continents_temporal
+        GROUP BY continent_id
+        HAVING year = MAX(year)
+        ORDER BY continent_id
+    ''').fetchall()
+
+    block = DemographicsBlock()
+    for row in rows:
+        block.append(row[5:])
+    year_column = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    country_column = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+    continent_column = np.fromiter((row[2] for row in rows), dtype=np.int64, count=len(rows))
+    population_column = np.fromiter((np.nan if row[4] is None else row[4] for row in rows),
+                                    dtype=np.float64, count=len(rows))
+
+    years, year_positions = np.unique(year_column, return_inverse=True)
+    country_ids, country_positions = np.unique(country_column, return_inverse=True)
+    names = [''] * len(country_ids)
+    for row, position in zip(rows, country_positions):
+        names[position] = row[3]  # rows are ordered by year, so the latest name wins
+
+    continent_ids = np.array([row[0] for row in continents], dtype=np.int64)
+    continent_lookup = {int(cid): i for i, cid in enumerate(continent_ids)}
+
+    shape = (len(years), len(country_ids))
+    population = np.full(shape, np.nan)
+    population[year_positions, country_positions] = population_column
+    continent = np.full(shape, -1, dtype=np.int64)
+    continent[year_positions, country_positions] = [continent_lookup.get(int(cid), -1) for cid in continent_column]
+    demographics = np.full(shape + (block.width,), np.nan)
+    if rows:
+        demographics[year_positions, country_positions] = block.matrix()
+
+    return PopulationMatrix(years, country_ids, names, continent_ids, [row[1] for row in continents],
+                            population, continent, demographics)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def load(path=DATABASE, file=None):
+    """PopulationMatrix for a database, rebuilt only when its dataset version changes
+
+    Reads the file served for path (db_pool.served_file) unless given the file to read.
+    """
+    file = file or db_pool.served_file(path)
+    key = (path, db_pool.dataset_version(file))
+    matrix = _cache.get(key)
+    if matrix is not None:
+        return matrix
+    with _cache_lock:
+        matrix = _cache.get(key)
+        if matrix is None:
+            db = sqlite3.connect(file)
+            try:
+                matrix = load_matrix(db)
+            finally:
+                db.close()
+            # The previous version stays: requests still on the old file during a swap read it
+            for stale in [k for k in _cache if k[0] == path][:-1]:
+                del _cache[stale]
+            _cache[key] = matrix
+    return matrix
+
+# COMPUTATIONS
+# Each returns JSON-ready structures covering every year unless noted otherwise
+
+def _continent_one_hot(matrix):
+    """(Y, C, K) 0/1 membership of each country-year in each continent"""
+    return (matrix.continent[:, :, None] == np.arange(len(matrix.continent_ids))).astype(np.float64)
+
+def _round(values, digits=2):
+    return [None if np.isnan(value) else round(float(value), digits) for value in values]
+
+def totals(matrix):
+    """World and continent population totals and data coverage per year"""
+    has_row = matrix.continent >= 0
+    has_population = ~np.isnan(matrix.population) & (matrix.population > 0)
+    weights = np.where(has_population, matrix.population, 0.0)
+    one_hot = _continent_one_hot(matrix)
+
+    world_total = weights.sum(axis=1)
+    countries = has_row.sum(axis=1)
+    with_population = has_population.sum(axis=1)
+    continent_totals = np.einsum('yc,yck->yk', weights, one_hot)
+    continent_countries = one_hot.sum(axis=1)
+
+    result = []
+    for y, year in enumerate(matrix.years):
+        result.append({
+            'year': int(year),
+            'total_population': int(world_total[y]),
+            'countries': int(countries[y]),
+            'countries_with_population': int(with_population[y]),
+            'coverage_percent': round(float(with_population[y]) * 100 / countries[y], 1) if countries[y] else 0.0,
+            'by_continent': [
+                {
+                    'continent_id': int(cid),
+                    'name': name,
+                    'countries': int(continent_countries[y, k]),
+                    'total_population': int(continent_totals[y, k])
+                }
+                for k, (cid, name) in enumerate(zip(matrix.continent_ids, matrix.continent_names))
+            ]
+        })
+    return result
+
+def growth(matrix, year=None, n=10):
+    """Year-over-year growth of the world and each continent, plus the fastest/slowest countries
+
+    Rates compare countries present with a population in both years, so coverage changes
+    do not show up as growth. The country ranking is for `year` (default: the latest).
+    """
+    if len(matrix.years) < 2:
+        raise AnalyticsError("Growth needs at least two years of data")
+    valid = ~np.isnan(matrix.population) & (matrix.population > 0)
+    both = valid[1:] & valid[:-1]
+    previous = np.where(both, matrix.population[:-1], 0.0)
+    current = np.where(both, matrix.population[1:], 0.0)
+    one_hot = _continent_one_hot(matrix)[1:]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        world_rate = (current.sum(axis=1) / previous.sum(axis=1) - 1) * 100
+        continent_rate = (np.einsum('yc,yck->yk', current, one_hot) /
+                          np.einsum('yc,yck->yk', previous, one_hot) - 1) * 100
+        country_rate = np.where(both, current / np.where(both, previous, 1.0) - 1, np.nan) * 100
+
+    y = matrix.year_index(year) if year is not None else len(matrix.years) - 1
+    if y == 0:
+        raise AnalyticsError(f"No previous year to compare {int(matrix.years[0])} with")
+    rates = country_rate[y - 1]
+    ranked = np.flatnonzero(~np.isnan(rates))
+    ranked = ranked[np.argsort(-rates[ranked], kind='stable')]
+
+    def country(c):
+        return {
+            'country_id': int(matrix.country_ids[c]),
+            'name': matrix.names[c],
+            'population': int(matrix.population[y, c]),
+            'previous_population': int(matrix.population[y - 1, c]),
+            'growth_percent': round(float(rates[c]), 3)
+        }
+
+    return {
+        'years': [
+            {
+                'year': int(matrix.years[i + 1]),
+                'world_growth_percent': _round([world_rate[i]], 3)[0],
+                'by_continent': {name: rate for name, rate in zip(matrix.continent_names, _round(continent_rate[i], 3))}
+            }
+            for i in range(len(matrix.years) - 1)
+        ],
+        'year': int(matrix.years[y]),
+        'fastest_growing': [country(c) for c in ranked[:n]],
+        'fastest_shrinking': [country(c) for c in ranked[::-1][:n]]
+    }
+
+def demographic_averages(matrix, year=None):
+    """Population-weighted religion and race/ethnicity shares per continent and for the world
+
+    Each category is averaged over the countries that report it, weighted by population;
+    `countries` and `population_covered` say how much of the region the figures describe.
+    """
+    years = range(len(matrix.years)) if year is None else [matrix.year_index(year)]
+    years = list(years)
+    shares = matrix.demographics[years]
+    reported = ~np.isnan(shares)
+    weights = np.where(~np.isnan(matrix.population[years]) & (matrix.population[years] > 0),
+                       matrix.population[years], 0.0)
+    one_hot = _continent_one_hot(matrix)[years]
+    # Last "continent" is the whole world
+    regions = np.concatenate([one_hot, (matrix.continent[years] >= 0)[:, :, None].astype(np.float64)], axis=2)
+
+    weighted = np.einsum('yc,ycr,ycd->yrd', weights, regions, np.where(reported, shares, 0.0))
+    covered = np.einsum('yc,ycr,ycd->yrd', weights, regions, reported.astype(np.float64))
+    counts = np.einsum('ycr,ycd->yrd', regions, reported.astype(np.float64))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        averages = weighted / covered
+
+    region_names = list(matrix.continent_names) + ['World']
+    region_ids = [int(cid) for cid in matrix.continent_ids] + [None]
+    result = []
+    for i, y in enumerate(years):
+        regions_out = []
+        for r, (rid, name) in enumerate(zip(region_ids, region_names)):
+            entry = {'continent_id': rid, 'name': name}
+            offset = 0
+            for schema in SCHEMAS:
+                width = len(schema.keys)
+                # Coverage is reported from the first category; a distribution's columns are filled together
+                entry[schema.name] = dict(zip(schema.keys, _round(averages[i, r, offset:offset + width])))
+                entry[schema.name]['countries'] = int(counts[i, r, offset])
+                entry[schema.name]['population_covered'] = int(covered[i, r, offset])
+                offset += width
+            regions_out.append(entry)
+        result.append({'year': int(matrix.years[y]), 'regions': regions_out})
+    return result
+
+def top_countries(matrix, n=10, year=None):
+    """The n most populous countries of every year (or one year)"""
+    filled = np.where(np.isnan(matrix.population), -1.0, matrix.population)
+    order = np.argsort(-filled, axis=1, kind='stable')[:, :n]
+    years = range(len(matrix.years)) if year is None else [matrix.year_index(year)]
+    result = []
+    for y in years:
+        ranking = [c for c in order[y] if filled[y, c] > 0]
+        result.append({
+            'year': int(matrix.years[y]),
+            'countries': [
+                {'rank': rank, 'country_id': int(matrix.country_ids[c]), 'name': matrix.names[c],
+                 'population': int(matrix.population[y, c])}
+                for rank, c in enumerate(ranking, 1)
+            ]
+        })
+    return result
+
+def main(argv):
+    path = argv[0] if argv else DATABASE
+    try:
+        matrix = load(path)
+    except AnalyticsError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("📊 POPULATION DATA BY YEAR")
+    print("=" * 60)
+    for entry in totals(matrix):
+        print(f"{entry['year']}: {entry['countries_with_population']}/{entry['countries']} countries "
+              f"({entry['coverage_percent']}%) - Total: {entry['total_population']:,}")
+
+    if len(matrix.years) > 1:
+        print("\n📈 WORLD GROWTH")
+        print("-" * 60)
+        for entry in growth(matrix)['years']:
+            print(f"{entry['year']}: {entry['world_growth_percent']:+.3f}%")
+
+    latest = top_countries(matrix, 10)[-1] if len(matrix.years) else None
+    if latest:
+        print(f"\n🏆 TOP 10 COUNTRIES BY POPULATION - {latest['year']}")
+        print("-" * 60)
+        for country in latest['countries']:
+            print(f"   {country['rank']:2d}. {country['name']}: {country['population']:,}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the API blueprints
+app.py, temporal_app.py and query_app.py each define their routes on a Blueprint named api.
+create_app() builds a Flask app around one or more of them with the shared config, metrics,
+content negotiation and query tracing; each module mounts its own blueprint at / for the
+standalone servers, and gateway.py mounts all of them under versioned prefixes in one app.
+"""
+
+import os
+import threading
+
+from flask import Flask, current_app, request, url_for
+
+import metrics
+import migrate
+import query_tracer
+import response_formats
+
+# Database files by config key; the same keys are used standalone and in the gateway
+DEFAULT_CONFIG = {
+    'GEOGRAPHY_DATABASE': 'geography.db',
+    'TEMPORAL_DATABASE': 'geography_temporal.db'
+}
+
+# Largest page a client may request from the paginated list endpoints
+MAX_PAGE_SIZE = 1000
+
+def create_app(import_name, blueprints):
+    """Flask app with the shared config and hooks and the given (blueprint, url_prefix) pairs"""
+    app = Flask(import_name)
+    app.config.update(DEFAULT_CONFIG)
+    metrics.init_app(app)
+    response_formats.init_app(app)
+    query_tracer.install_from_env()
+    for blueprint, url_prefix in blueprints:
+        app.register_blueprint(blueprint, url_prefix=url_prefix or None)
+    return app
+
+def database(key):
+    """Configured path of a database (GEOGRAPHY_DATABASE or TEMPORAL_DATABASE) for the current app"""
+    return current_app.config[key]
+
+# Real paths of the database files this process has brought up to the latest schema
+_migrated = set()
+_migrated_lock = threading.Lock()
+
+def ensure_migrated(path):
+    """Apply pending schema migrations to a temporal database file once per process; returns the names applied
+
+    The committed geography_temporal.db and build.py releases are already current, so this
+    only writes to a deployed file with an older schema.
+    """
+    real = os.path.realpath(path)
+    if real in _migrated:
+        return []
+    with _migrated_lock:
+        if real in _migrated or not os.path.exists(real):
+            return []
+        applied = [] if migrate.is_current(real) else migrate.upgrade(real)
+        for name in applied:
+            print(f"🏗️  Applied schema migration {name} to {path}")
+        _migrated.add(real)
+    return applied
+
+def temporal_database():
+    """Configured temporal database path, migrated the first time this process serves the file it points to"""
+    path = database('TEMPORAL_DATABASE')
+    ensure_migrated(path)
+    return path
+
+def get_page_args():
+    """Get optional offset/limit pagination arguments (limit -1 means no limit)"""
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = request.args.get('limit', type=int)
+    if limit is None:
+        return offset, -1
+    return offset, min(max(limit, 1), MAX_PAGE_SIZE)
+
+def api_base():
+    """URL prefix the current blueprint is mounted under ('' at the root), for its web interface's fetches"""
+    return url_for('.index').rstrip('/')
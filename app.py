@@ -6,22 +6,25 @@ Hierarchical structure: Continents > Countries > States/Provinces > Cities/Towns
 
 import sqlite3
 import os
-from flask import Flask, request, jsonify, render_template_string
+from flask import Blueprint, request, jsonify, render_template_string
 from datetime import datetime
 import json
+import api_common
+import db_pool
+from api_common import get_page_args
+from row_shaping import shape_countries
+from ui_scripts import VIRTUAL_LIST_CSS, VIRTUAL_LIST_JS, SEARCH_CLIENT_JS
 
-app = Flask(__name__)
-app.config['DATABASE'] = 'geography.db'
+# Routes of the geography API (mounted at / by this module's app, at /v1/geography by gateway.py)
+api = Blueprint('geography', __name__)
 
 def get_db():
-    """Get database connection"""
-    db = sqlite3.connect(app.config['DATABASE'])
-    db.row_factory = sqlite3.Row  # Enable dict-like access to rows
-    return db
+    """Get a pooled database connection (rows support dict-like access; close() returns it to the pool)"""
+    return db_pool.serve(api_common.database('GEOGRAPHY_DATABASE')).connect()
 
-def init_database():
+def init_database(path=api_common.DEFAULT_CONFIG['GEOGRAPHY_DATABASE']):
     """Initialize the database with schema and sample data"""
-    if os.path.exists(app.config['DATABASE']):
+    if os.path.exists(path):
         print("Database already exists. Skipping initialization.")
         return
     
@@ -29,7 +32,7 @@ def init_database():
     with open('database_schema.sql', 'r') as f:
         schema = f.read()
     
-    db = get_db()
+    db = sqlite3.connect(path)
     db.executescript(schema)
     db.commit()
     db.close()
@@ -37,7 +40,7 @@ def init_database():
 
 # API ENDPOINTS
 
-@app.route('/api/continents', methods=['GET'])
+@api.route('/api/continents', methods=['GET'])
 def get_continents():
     """Get all continents"""
     db = get_db()
@@ -50,46 +53,37 @@ def get_continents():
         'count': len(continents)
     })
 
-@app.route('/api/countries', methods=['GET'])
+@api.route('/api/countries', methods=['GET'])
 def get_all_countries():
     """Get all countries with continent info and religious distribution"""
+    offset, limit = get_page_args()
+    
     db = get_db()
     cursor = db.execute('''
         SELECT c.*, cont.name as continent_name 
         FROM countries c 
         JOIN continents cont ON c.continent_id = cont.id 
         ORDER BY cont.name, c.name
-    ''')
+        LIMIT ? OFFSET ?
+    ''', (limit, offset))
     
-    countries = []
-    for row in cursor.fetchall():
-        country = dict(row)
-        # Group religious data into a nested object for cleaner API response
-        if 'religion_christian_percent' in country:
-            country['religious_distribution'] = {
-                'christian_percent': country.get('religion_christian_percent', 0),
-                'muslim_percent': country.get('religion_muslim_percent', 0),
-                'hindu_percent': country.get('religion_hindu_percent', 0),
-                'buddhist_percent': country.get('religion_buddhist_percent', 0),
-                'jewish_percent': country.get('religion_jewish_percent', 0),
-                'other_percent': country.get('religion_other_percent', 0),
-                'nonreligious_percent': country.get('religion_nonreligious_percent', 0)
-            }
-            # Remove individual religion fields to clean up response
-            for key in list(country.keys()):
-                if key.startswith('religion_'):
-                    del country[key]
-        
-        countries.append(country)
+    # Religion (and race/ethnicity, territories) columns become nested objects, as in the temporal API
+    countries = shape_countries(cursor)
     
+    if limit < 0 and offset == 0:
+        total = len(countries)
+    else:
+        total = db.execute('SELECT COUNT(*) FROM countries').fetchone()[0]
     db.close()
     
     return jsonify({
         'countries': countries,
-        'count': len(countries)
+        'count': len(countries),
+        'total': total,
+        'offset': offset
     })
 
-@app.route('/api/continents/<int:continent_id>/countries', methods=['GET'])
+@api.route('/api/continents/<int:continent_id>/countries', methods=['GET'])
 def get_countries_by_continent(continent_id):
     """Get all countries in a continent"""
     db = get_db()
@@ -109,20 +103,29 @@ def get_countries_by_continent(continent_id):
         'count': len(countries)
     })
 
-@app.route('/api/hierarchy', methods=['GET'])
+@api.route('/api/hierarchy', methods=['GET'])
 def get_full_hierarchy():
-    """Get the complete location hierarchy"""
+    """Get the complete location hierarchy (optionally one page of it via offset/limit)"""
+    offset, limit = get_page_args()
+    
     db = get_db()
-    cursor = db.execute('SELECT * FROM location_hierarchy ORDER BY full_path')
+    cursor = db.execute('SELECT * FROM location_hierarchy ORDER BY full_path LIMIT ? OFFSET ?', (limit, offset))
     hierarchy = [dict(row) for row in cursor.fetchall()]
+    
+    if limit < 0 and offset == 0:
+        total = len(hierarchy)
+    else:
+        total = db.execute('SELECT COUNT(*) FROM location_hierarchy').fetchone()[0]
     db.close()
     
     return jsonify({
         'hierarchy': hierarchy,
-        'count': len(hierarchy)
+        'count': len(hierarchy),
+        'total': total,
+        'offset': offset
     })
 
-@app.route('/api/search', methods=['GET'])
+@api.route('/api/search', methods=['GET'])
 def search_locations():
     """Search for locations by name"""
     query = request.args.get('q', '').strip()
@@ -162,7 +165,7 @@ def search_locations():
 
 # ADD/EDIT ENDPOINTS
 
-@app.route('/api/continents', methods=['POST'])
+@api.route('/api/continents', methods=['POST'])
 def add_continent():
     """Add a new continent"""
     data = request.get_json()
@@ -224,6 +227,7 @@ HTML_TEMPLATE = """
         .message { padding: 10px; margin: 10px 0; border-radius: 4px; }
         .success { background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
         .error { background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
+{{ virtual_list_css|safe }}
     </style>
 </head>
 <body>
@@ -254,7 +258,7 @@ HTML_TEMPLATE = """
         
         <div id="search" class="tab">
             <h3>Search Locations</h3>
-            <input type="text" class="search-box" id="searchInput" placeholder="Search for continents, countries, states, or cities..." onkeyup="performSearch()">
+            <input type="text" class="search-box" id="searchInput" placeholder="Search for continents, countries, states, or cities..." oninput="performSearch()">
             <div id="search-results"></div>
         </div>
         
@@ -279,6 +283,11 @@ HTML_TEMPLATE = """
     </div>
     
     <script>
+{{ virtual_list_js|safe }}
+{{ search_client_js|safe }}
+        // Where this page's API is mounted ('' standalone, /v1/geography in the gateway)
+        const API_BASE = {{ api_base|tojson }};
+        
         function showTab(tabName) {
             // Hide all tabs
             document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
@@ -296,71 +305,81 @@ HTML_TEMPLATE = """
         }
         
         function loadHierarchy() {
-            fetch('/api/hierarchy')
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('hierarchy-container');
-                    container.innerHTML = '';
-                    
-                    data.hierarchy.forEach(item => {
-                        const div = document.createElement('div');
-                        div.className = 'location';
-                        div.innerHTML = `
-                            <strong>${item.full_path}</strong><br>
-                            <small>Population: ${item.city_population ? item.city_population.toLocaleString() : 'N/A'} | Type: ${item.city_type}</small>
-                        `;
-                        container.appendChild(div);
-                    });
-                })
-                .catch(error => {
-                    document.getElementById('hierarchy-container').innerHTML = '<div class="error">Error loading hierarchy</div>';
-                });
+            const container = document.getElementById('hierarchy-container');
+            loadPagedList(container, `${API_BASE}/api/hierarchy`, 'hierarchy', {
+                rowHeight: 70,
+                pageSize: 200,
+                renderRow: item => `
+                    <div class="location">
+                        <strong>${item.full_path}</strong><br>
+                        <small>Population: ${item.city_population ? item.city_population.toLocaleString() : 'N/A'} | Type: ${item.city_type}</small>
+                    </div>
+                `
+            }).catch(error => {
+                container.innerHTML = '<div class="error">Error loading hierarchy</div>';
+            });
         }
         
+        const searchClient = new SearchClient({
+            url: query => `${API_BASE}/api/search?q=${encodeURIComponent(query)}`,
+            narrow: (data, query) => {
+                const results = Object.assign({}, data.results, {
+                    continents: data.results.continents.filter(item => matchesQuery(item.name, query)),
+                    cities: data.results.cities.filter(item => matchesQuery(item.city_name, query))
+                });
+                return Object.assign({}, data, {
+                    query: query,
+                    results: results,
+                    total_results: Object.values(results).reduce((total, items) => total + items.length, 0)
+                });
+            }
+        });
+        
         function performSearch() {
             const query = document.getElementById('searchInput').value.trim();
             if (query.length < 2) {
+                searchClient.cancel();
                 document.getElementById('search-results').innerHTML = '';
                 return;
             }
             
-            fetch(`/api/search?q=${encodeURIComponent(query)}`)
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('search-results');
-                    container.innerHTML = '';
-                    
-                    if (data.total_results === 0) {
-                        container.innerHTML = '<div>No results found</div>';
-                        return;
-                    }
+            searchClient.search(query, '', renderSearchResults);
+        }
+        
+        function renderSearchResults(data) {
+            const container = document.getElementById('search-results');
+            container.innerHTML = '';
+            
+            if (data.total_results === 0) {
+                container.innerHTML = '<div>No results found</div>';
+                return;
+            }
+            
+            ['continents', 'cities'].forEach(category => {
+                if (data.results[category].length > 0) {
+                    const section = document.createElement('div');
+                    section.innerHTML = `<h4>${category.toUpperCase()}</h4>`;
                     
-                    ['continents', 'cities'].forEach(category => {
-                        if (data.results[category].length > 0) {
-                            const section = document.createElement('div');
-                            section.innerHTML = `<h4>${category.toUpperCase()}</h4>`;
-                            
-                            data.results[category].forEach(item => {
-                                const div = document.createElement('div');
-                                div.className = 'location';
-                                
-                                if (category === 'cities') {
-                                    div.innerHTML = `
-                                        <strong>${item.full_path}</strong><br>
-                                        <small>Population: ${item.city_population ? item.city_population.toLocaleString() : 'N/A'}</small>
-                                    `;
-                                } else {
-                                    div.innerHTML = `
-                                        <strong>${item.name}</strong><br>
-                                        <small>Code: ${item.code || 'N/A'}</small>
-                                    `;
-                                }
-                                section.appendChild(div);
-                            });
-                            container.appendChild(section);
+                    data.results[category].forEach(item => {
+                        const div = document.createElement('div');
+                        div.className = 'location';
+                        
+                        if (category === 'cities') {
+                            div.innerHTML = `
+                                <strong>${item.full_path}</strong><br>
+                                <small>Population: ${item.city_population ? item.city_population.toLocaleString() : 'N/A'}</small>
+                            `;
+                        } else {
+                            div.innerHTML = `
+                                <strong>${item.name}</strong><br>
+                                <small>Code: ${item.code || 'N/A'}</small>
+                            `;
                         }
+                        section.appendChild(div);
                     });
-                });
+                    container.appendChild(section);
+                }
+            });
         }
         
         function addContinent() {
@@ -372,7 +391,7 @@ HTML_TEMPLATE = """
                 return;
             }
             
-            fetch('/api/continents', {
+            fetch(`${API_BASE}/api/continents`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
@@ -406,58 +425,37 @@ HTML_TEMPLATE = """
         }
         
         function loadCountries() {
-            fetch('/api/countries')
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('countries-container');
-                    container.innerHTML = '';
-                    
-                    // Group countries by continent
-                    const continents = {};
-                    data.countries.forEach(country => {
-                        if (!continents[country.continent_name]) {
-                            continents[country.continent_name] = [];
-                        }
-                        continents[country.continent_name].push(country);
-                    });
+            const container = document.getElementById('countries-container');
+            loadPagedList(container, `${API_BASE}/api/countries`, 'countries', {
+                rowHeight: 90,
+                pageSize: 100,
+                renderRow: country => {
+                    // Build religious distribution display
+                    let religionText = '';
+                    if (country.religious_distribution) {
+                        const religions = [];
+                        const rd = country.religious_distribution;
+                        if (rd.christian_percent > 0) religions.push(`Christian: ${rd.christian_percent}%`);
+                        if (rd.muslim_percent > 0) religions.push(`Muslim: ${rd.muslim_percent}%`);
+                        if (rd.hindu_percent > 0) religions.push(`Hindu: ${rd.hindu_percent}%`);
+                        if (rd.buddhist_percent > 0) religions.push(`Buddhist: ${rd.buddhist_percent}%`);
+                        if (rd.jewish_percent > 0) religions.push(`Jewish: ${rd.jewish_percent}%`);
+                        if (rd.other_percent > 0) religions.push(`Other: ${rd.other_percent}%`);
+                        if (rd.nonreligious_percent > 0) religions.push(`Non-religious: ${rd.nonreligious_percent}%`);
+                        religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
+                    }
                     
-                    // Display by continent
-                    Object.keys(continents).sort().forEach(continentName => {
-                        const section = document.createElement('div');
-                        section.innerHTML = `<h4>${continentName} (${continents[continentName].length} countries)</h4>`;
-                        
-                        continents[continentName].forEach(country => {
-                            const div = document.createElement('div');
-                            div.className = 'location';
-                            
-                            // Build religious distribution display
-                            let religionText = '';
-                            if (country.religious_distribution) {
-                                const religions = [];
-                                const rd = country.religious_distribution;
-                                if (rd.christian_percent > 0) religions.push(`Christian: ${rd.christian_percent}%`);
-                                if (rd.muslim_percent > 0) religions.push(`Muslim: ${rd.muslim_percent}%`);
-                                if (rd.hindu_percent > 0) religions.push(`Hindu: ${rd.hindu_percent}%`);
-                                if (rd.buddhist_percent > 0) religions.push(`Buddhist: ${rd.buddhist_percent}%`);
-                                if (rd.jewish_percent > 0) religions.push(`Jewish: ${rd.jewish_percent}%`);
-                                if (rd.other_percent > 0) religions.push(`Other: ${rd.other_percent}%`);
-                                if (rd.nonreligious_percent > 0) religions.push(`Non-religious: ${rd.nonreligious_percent}%`);
-                                religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
-                            }
-                            
-                            div.innerHTML = `
-                                <strong>${country.name}</strong> (${country.code_iso2})<br>
-                                <small>Capital: ${country.capital || 'N/A'} | Population: ${country.population ? country.population.toLocaleString() : 'N/A'} | Currency: ${country.currency || 'N/A'}</small>
-                                ${religionText}
-                            `;
-                            section.appendChild(div);
-                        });
-                        container.appendChild(section);
-                    });
-                })
-                .catch(error => {
-                    document.getElementById('countries-container').innerHTML = '<div class="error">Error loading countries</div>';
-                });
+                    return `
+                        <div class="location">
+                            <strong>${country.name}</strong> (${country.code_iso2}) <small style="color: #666;">${country.continent_name}</small><br>
+                            <small>Capital: ${country.capital || 'N/A'} | Population: ${country.population ? country.population.toLocaleString() : 'N/A'} | Currency: ${country.currency || 'N/A'}</small>
+                            ${religionText}
+                        </div>
+                    `;
+                }
+            }).catch(error => {
+                container.innerHTML = '<div class="error">Error loading countries</div>';
+            });
         }
         
         // Initialize
@@ -469,17 +467,35 @@ HTML_TEMPLATE = """
 </html>
 """
 
-@app.route('/')
+@api.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return render_template_string(HTML_TEMPLATE, api_base=api_common.api_base(), virtual_list_css=VIRTUAL_LIST_CSS,
+                                  virtual_list_js=VIRTUAL_LIST_JS, search_client_js=SEARCH_CLIENT_JS)
 
-@app.route('/health')
+@api.route('/health')
 def health():
-    return jsonify({'status': 'healthy', 'database': 'connected'})
+    """Check that the database answers queries; report pool state and dataset version"""
+    pool = db_pool.serve(api_common.database('GEOGRAPHY_DATABASE'))
+    try:
+        db = pool.connect()
+        db.execute('SELECT COUNT(*) FROM continents').fetchone()
+        db.close()
+        version = pool.version
+    except (sqlite3.Error, OSError) as e:
+        return jsonify({'status': 'unhealthy', 'database': 'error', 'error': str(e), 'pool': pool.stats()}), 503
+    
+    return jsonify({
+        'status': 'healthy',
+        'database': 'connected',
+        'dataset_version': version,
+        'pool': pool.stats()
+    })
+
+app = api_common.create_app(__name__, [(api, '')])
 
 if __name__ == '__main__':
     print("🌍 Starting Ultimate Geography Database...")
-    init_database()
+    init_database(app.config['GEOGRAPHY_DATABASE'])
     
     print("\n" + "="*60)
     print("🚀 Geography Database Server Ready!")
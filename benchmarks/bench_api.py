@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+API benchmark suite for app.py, temporal_app.py and query_app.py
+Generates synthetic databases per scale, load-tests every GET route of the apps in-process
+(Flask test client) and over HTTP (a threaded werkzeug server), and writes throughput and
+p50/p99 latency as JSON. Results are compared against a stored baseline; any route whose
+p50 latency or throughput regresses past the tolerance fails the run (exit code 1), and so
+does a route the baseline has no entry for - record it with --update-baseline when adding one.
+
+Usage:
+    python benchmarks/bench_api.py                          # scales 1 and 100, both modes
+    python benchmarks/bench_api.py --scales 1,100,10000 --requests 500 --concurrency 8
+    python benchmarks/bench_api.py --update-baseline        # record the current numbers as the baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+import app as geography_app
+import query_app
+import temporal_app
+from synthetic_data import country_name, ensure_datasets
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_DATA_DIR = os.path.join(BENCH_DIR, 'data')
+
+# Query strings exercised per route; routes not listed are requested without one
+ROUTE_QUERIES = {
+    'geography': {
+        '/api/countries': ['', '?limit=100'],
+        '/api/hierarchy': ['', '?limit=200'],
+        '/api/search': ['?q=an', '?q=City%2000000001']
+    },
+    'temporal': {
+        '/api/countries': ['?year=2025', '?year=2025&limit=100', '?year=2019.5&interpolate=1'],
+        '/api/analytics/demographics': ['?year=2025'],
+        '/api/analytics/growth': ['?year=2025'],
+        '/api/analytics/top': ['?n=10'],
+        '/api/changes': ['?metric=population', '?sort=percent&order=asc&limit=100'],
+        '/api/continents': ['?year=2025'],
+        '/api/continents/<int:continent_id>/countries': ['?year=2025'],
+        '/api/export': ['?format=csv&year=2025'],
+        '/api/search': ['?q=an&year=2025', '?q=Country%20000001&year=2025'],
+        '/api/stats': ['?year=2025']
+    },
+    'query': {
+        '/api/countries': ['?year=2025&limit=100', '?year=2025&min_population=100000000'],
+        '/api/countries/<code_iso2>/subdivisions': ['?year=2025'],
+        '/api/subdivisions': ['?year=2025&min_population=100000000&limit=100']
+    }
+}
+
+# Values substituted for URL converters
+PATH_VALUES = {
+    'code_iso2': 'C1',
+    'continent_id': '3',
+    'name': country_name(1).replace(' ', '%20')
+}
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def summarize(latencies, elapsed, errors):
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0
+    }
+
+def route_urls(app_name, flask_app):
+    """Every GET route of an app expanded into concrete request URLs"""
+    urls = []
+    for rule in sorted(flask_app.url_map.iter_rules(), key=lambda rule: rule.rule):
+        if rule.endpoint == 'static' or 'GET' not in rule.methods:
+            continue
+        path = rule.rule
+        for argument in rule.arguments:
+            path = path.replace(f'<int:{argument}>', PATH_VALUES[argument]).replace(f'<{argument}>', PATH_VALUES[argument])
+        for query in ROUTE_QUERIES[app_name].get(rule.rule, ['']):
+            urls.append((rule.rule, path + query))
+    return urls
+
+def bench_in_process(flask_app, url, count, warmup):
+    client = flask_app.test_client()
+    for _ in range(warmup):
+        client.get(url)
+
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(count):
+        request_started = time.perf_counter()
+        response = client.get(url)
+        response.get_data()
+        latencies.append(time.perf_counter() - request_started)
+        if response.status_code >= 400:
+            errors += 1
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+def fetch(base_url, url):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(base_url + url, timeout=60) as response:
+            response.read()
+        failed = False
+    except (urllib.error.URLError, OSError):
+        failed = True
+    return time.perf_counter() - started, failed
+
+def bench_http(base_url, url, count, concurrency, warmup):
+    for _ in range(warmup):
+        fetch(base_url, url)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(lambda _: fetch(base_url, url), range(count)))
+    elapsed = time.perf_counter() - started
+    return summarize([seconds for seconds, _ in outcomes], elapsed, sum(1 for _, failed in outcomes if failed))
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler without per-request access logging"""
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+class BackgroundServer:
+    """Threaded werkzeug server on an ephemeral port"""
+
+    def __init__(self, flask_app):
+        self.server = make_server('127.0.0.1', 0, flask_app, threaded=True, request_handler=QuietRequestHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.thread.join()
+
+def run_scale(scale, args):
+    geography_path, temporal_path = ensure_datasets(args.data_dir, scale)
+    for flask_app in (geography_app.app, temporal_app.app, query_app.app):
+        flask_app.config.update(GEOGRAPHY_DATABASE=geography_path, TEMPORAL_DATABASE=temporal_path)
+
+    results = []
+    for app_name, flask_app in (('geography', geography_app.app), ('temporal', temporal_app.app),
+                                ('query', query_app.app)):
+        for mode in args.modes:
+            with (BackgroundServer(flask_app) if mode == 'http' else nullcontext()) as base_url:
+                for route, url in route_urls(app_name, flask_app):
+                    if mode == 'http':
+                        summary = bench_http(base_url, url, args.requests, args.concurrency, args.warmup)
+                    else:
+                        summary = bench_in_process(flask_app, url, args.requests, args.warmup)
+                    result = dict({'scale': scale, 'app': app_name, 'mode': mode, 'route': route, 'url': url}, **summary)
+                    results.append(result)
+                    print(f"  x{scale:<6} {app_name:<9} {mode:<10} {url:<55} "
+                          f"{summary['throughput_rps']:>9.1f} rps  p50 {summary['p50_ms']:>8.2f} ms  p99 {summary['p99_ms']:>8.2f} ms"
+                          + (f"  ❌ {summary['errors']} errors" if summary['errors'] else ''))
+    return results
+
+def result_key(result):
+    return f"{result['scale']}|{result['app']}|{result['mode']}|{result['url']}"
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Regressions against the baseline: slower p50 or lower throughput beyond the tolerance
+
+    A change must also cost at least min_delta_ms per request, so jitter on sub-millisecond
+    routes does not fail the run. A URL the baseline has no entry for fails too when the
+    baseline measured its scale and mode (a route added without re-recording the baseline);
+    scales and modes the baseline never ran are left to unmeasured().
+    """
+    previous = {result_key(result): result for result in baseline.get('results', [])}
+    measured = {(result['scale'], result['mode']) for result in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result_key(result))
+        if before is None:
+            if (result['scale'], result['mode']) in measured:
+                regressions.append(f"{result_key(result)}: not in the baseline (re-record it with --update-baseline)")
+            continue
+        if result['errors'] > before.get('errors', 0):
+            regressions.append(f"{result_key(result)}: errors {before.get('errors', 0)} -> {result['errors']}")
+        if (result['p50_ms'] > before['p50_ms'] * (1 + tolerance)
+                and result['p50_ms'] - before['p50_ms'] >= min_delta_ms):
+            regressions.append(f"{result_key(result)}: p50 {before['p50_ms']} ms -> {result['p50_ms']} ms")
+        if (0 < result['throughput_rps'] < before['throughput_rps'] * (1 - tolerance)
+                and 1000 / result['throughput_rps'] - 1000 / before['throughput_rps'] >= min_delta_ms):
+            regressions.append(f"{result_key(result)}: throughput {before['throughput_rps']} -> {result['throughput_rps']} rps")
+    return regressions
+
+def unmeasured(results, baseline):
+    """(scale, mode) pairs of the results the baseline has no numbers for at all"""
+    measured = {(result['scale'], result['mode']) for result in baseline.get('results', [])}
+    return sorted({(result['scale'], result['mode']) for result in results} - measured)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every API route of both apps')
+    parser.add_argument('--scales', default='1,100', help='comma-separated dataset scale factors')
+    parser.add_argument('--modes', default='in-process,http', help='in-process and/or http')
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per URL')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests per URL')
+    parser.add_argument('--concurrency', type=int, default=4, help='client threads in http mode')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='where synthetic databases are cached')
+    parser.add_argument('--output', default=None, help='write results JSON here (default: stdout summary only)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.30, help='allowed relative slowdown before failing')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='ignore slowdowns smaller than this per request')
+    parser.add_argument('--update-baseline', action='store_true', help='store these results as the new baseline')
+    args = parser.parse_args()
+    args.modes = [mode.strip() for mode in args.modes.split(',')]
+
+    print("⏱️  API BENCHMARKS")
+    print("=" * 60)
+    results = []
+    for scale in [int(value) for value in args.scales.split(',')]:
+        results.extend(run_scale(scale, args))
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'requests': args.requests,
+            'concurrency': args.concurrency
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("⚠️  No baseline found; run with --update-baseline to record one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    for scale, mode in unmeasured(results, baseline):
+        print(f"⚠️  Baseline has no results for scale {scale} ({mode}); these routes are not compared")
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
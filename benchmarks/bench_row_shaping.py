@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the temporal countries row-shaping and serialization path
+Compares the original per-row reshaping (dict(row), .get() calls, key-deletion loops) with
+candidate implementations, checks that every candidate produces identical output, and
+reports per-row cost as JSON, plus the memory retained per country-year by the shaped
+result (legacy nested dicts vs the compact demographics block).
+
+Candidates:
+    legacy        original implementation from temporal_app.get_all_countries (reference)
+    index_map     row_shaping.shape_countries on sqlite3.Row rows (what the API uses)
+    tuple_rows    the same shaper on plain tuples (no row factory)
+    direct_json   JSON text assembled straight from tuples, without intermediate dicts
+
+Usage:
+    python benchmarks/bench_row_shaping.py                  # committed geography_temporal.db
+    python benchmarks/bench_row_shaping.py --scale 100      # synthetic dataset
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import row_shaping
+from demographics import RACE, RELIGION, DemographicsBlock, Distribution
+from synthetic_data import SOURCE_TEMPORAL_DB, ensure_datasets
+
+COUNTRIES_SQL = '''
+    SELECT c.*, cont.name as continent_name
+    FROM countries_temporal c
+    JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+    ORDER BY c.year, cont.name, c.name
+'''
+
+def encode_default(value):
+    if isinstance(value, Distribution):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# Same settings as the apps' JSON provider (compact, sorted keys, ASCII)
+def encode(obj):
+    return json.dumps(obj, sort_keys=True, ensure_ascii=True, separators=(',', ':'), default=encode_default)
+
+def legacy_shape(rows):
+    """Original row shaping, kept verbatim as the reference implementation"""
+    countries = []
+    for row in rows:
+        country = dict(row)
+        if 'religion_christian_percent' in country:
+            country['religious_distribution'] = {
+                'christian_percent': country.get('religion_christian_percent', 0) or 0,
+                'muslim_percent': country.get('religion_muslim_percent', 0) or 0,
+                'hindu_percent': country.get('religion_hindu_percent', 0) or 0,
+                'buddhist_percent': country.get('religion_buddhist_percent', 0) or 0,
+                'jewish_percent': country.get('religion_jewish_percent', 0) or 0,
+                'other_percent': country.get('religion_other_percent', 0) or 0,
+                'nonreligious_percent': country.get('religion_nonreligious_percent', 0) or 0
+            }
+            for key in list(country.keys()):
+                if key.startswith('religion_'):
+                    del country[key]
+
+        if 'race_white_percent' in country:
+            country['racial_ethnic_distribution'] = {
+                'white_percent': country.get('race_white_percent', 0) or 0,
+                'black_percent': country.get('race_black_percent', 0) or 0,
+                'asian_percent': country.get('race_asian_percent', 0) or 0,
+                'hispanic_percent': country.get('race_hispanic_percent', 0) or 0,
+                'native_american_percent': country.get('race_native_american_percent', 0) or 0,
+                'pacific_islander_percent': country.get('race_pacific_islander_percent', 0) or 0,
+                'other_percent': country.get('race_other_percent', 0) or 0
+            }
+            for key in list(country.keys()):
+                if key.startswith('race_'):
+                    del country[key]
+
+        if 'territories' in country and country['territories']:
+            territories_list = [t.strip() for t in country['territories'].split(',')]
+            country['administrative_divisions'] = {
+                'territories': territories_list,
+                'count': len(territories_list)
+            }
+        elif 'territories' in country:
+            country['administrative_divisions'] = {
+                'territories': [],
+                'count': 0
+            }
+
+        countries.append(country)
+    return countries
+
+def direct_json_encoder(columns):
+    """Encode rows of the given schema straight to a JSON array, keys pre-sorted and pre-escaped"""
+    shape = row_shaping.country_shaper(columns)
+    sample = shape(tuple(None for _ in columns), DemographicsBlock())
+    nested = {'religious_distribution', 'racial_ethnic_distribution', 'administrative_divisions'}
+    flat_keys = sorted(key for key in sample if key not in nested)
+    flat_indexes = [columns.index(key) for key in flat_keys]
+    religion_indexes = [columns.index(f'religion_{name}_percent') for name in sorted(RELIGION.categories)]
+    race_indexes = [columns.index(f'race_{name}_percent') for name in sorted(RACE.categories)]
+    territories_index = columns.index('territories')
+    value = json.JSONEncoder(ensure_ascii=True).encode
+
+    # (sorted output key, encoder) pairs; nested objects slot in at their sorted position
+    def flat(index):
+        return lambda row: value(row[index])
+
+    def distribution(indexes, names):
+        keys = [json.dumps(f'{name}_percent') for name in sorted(names)]
+        return lambda row: '{' + ','.join(f'{key}:{value(row[i] or 0)}' for key, i in zip(keys, indexes)) + '}'
+
+    def divisions(row):
+        territories = row[territories_index]
+        territories_list = [t.strip() for t in territories.split(',')] if territories else []
+        return f'{{"count":{len(territories_list)},"territories":{value(territories_list)}}}'
+
+    fields = [(key, flat(index)) for key, index in zip(flat_keys, flat_indexes)]
+    fields += [('administrative_divisions', divisions),
+               ('racial_ethnic_distribution', distribution(race_indexes, RACE.categories)),
+               ('religious_distribution', distribution(religion_indexes, RELIGION.categories))]
+    fields = [(json.dumps(key) + ':', encoder) for key, encoder in sorted(fields)]
+
+    def encode_rows(rows):
+        return '[' + ','.join('{' + ','.join(key + encoder(row) for key, encoder in fields) + '}' for row in rows) + ']'
+
+    return encode_rows
+
+def fetch(db_path, tuples):
+    db = sqlite3.connect(db_path)
+    if not tuples:
+        db.row_factory = sqlite3.Row
+    cursor = db.execute(COUNTRIES_SQL)
+    columns = [description[0] for description in cursor.description]
+    rows = cursor.fetchall()
+    db.close()
+    return columns, rows
+
+def measure(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+def retained_bytes(function):
+    """(bytes retained by the shaped rows, of which their demographic distributions)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        countries = function()
+        shaped = tracemalloc.get_traced_memory()[0]
+        for country in countries:
+            del country['religious_distribution'], country['racial_ethnic_distribution']
+        stripped = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return shaped - before, shaped - stripped
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark countries row shaping and serialization')
+    parser.add_argument('--db', default=SOURCE_TEMPORAL_DB, help='temporal database to read rows from')
+    parser.add_argument('--scale', type=int, default=None, help='use a synthetic dataset at this scale instead')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--output', default=None, help='write results JSON here')
+    args = parser.parse_args()
+
+    db_path = args.db
+    if args.scale is not None:
+        db_path = ensure_datasets(os.path.join(BENCH_DIR, 'data'), args.scale)[1]
+
+    columns, rows = fetch(db_path, tuples=False)
+    _, tuple_rows = fetch(db_path, tuples=True)
+
+    class FakeCursor:
+        def __init__(self, rows):
+            self.description = [(name,) for name in columns]
+            self._rows = rows
+
+        def fetchall(self):
+            return self._rows
+
+    # legacy_shape only needs dict(row); plain dicts keep sqlite3.Row out of the memory figures
+    tuple_rows_as_dicts = [dict(zip(columns, row)) for row in tuple_rows]
+    encode_direct = direct_json_encoder(columns)
+    candidates = {
+        'legacy': {
+            'shape': lambda: legacy_shape(rows),
+            'shape_and_encode': lambda: encode(legacy_shape(rows))
+        },
+        'index_map': {
+            'shape': lambda: row_shaping.shape_countries(FakeCursor(rows)),
+            'shape_and_encode': lambda: encode(row_shaping.shape_countries(FakeCursor(rows)))
+        },
+        'tuple_rows': {
+            'shape': lambda: row_shaping.shape_countries(FakeCursor(tuple_rows)),
+            'shape_and_encode': lambda: encode(row_shaping.shape_countries(FakeCursor(tuple_rows)))
+        },
+        'direct_json': {
+            'shape_and_encode': lambda: encode_direct(tuple_rows)
+        }
+    }
+
+    # Every candidate must reproduce the reference output exactly
+    reference = legacy_shape(rows)
+    reference_json = encode(reference)
+    for name, functions in candidates.items():
+        if 'shape' in functions and functions['shape']() != reference:
+            raise SystemExit(f"❌ {name} shapes rows differently from the legacy implementation")
+        if json.loads(functions['shape_and_encode']()) != json.loads(reference_json):
+            raise SystemExit(f"❌ {name} encodes rows differently from the legacy implementation")
+
+    print(f"🧪 ROW SHAPING MICRO-BENCHMARKS ({len(rows)} rows from {db_path})")
+    print("=" * 60)
+    results = []
+    for name, functions in candidates.items():
+        for stage, function in functions.items():
+            timings = measure(function, args.repeat)
+            result = {
+                'candidate': name,
+                'stage': stage,
+                'rows': len(rows),
+                'median_ms': round(statistics.median(timings) * 1000, 3),
+                'min_ms': round(min(timings) * 1000, 3),
+                'us_per_row': round(statistics.median(timings) / len(rows) * 1e6, 3) if rows else 0.0
+            }
+            results.append(result)
+            print(f"  {name:<12} {stage:<17} median {result['median_ms']:>9.3f} ms  {result['us_per_row']:>7.3f} µs/row")
+
+    # Memory of the shaped result alone (what the API and bootstrap caches keep alive)
+    memory = {}
+    for name, function in (('legacy', lambda: legacy_shape(tuple_rows_as_dicts)),
+                           ('index_map', lambda: row_shaping.shape_countries(FakeCursor(tuple_rows)))):
+        retained, demographics = retained_bytes(function)
+        memory[name] = {
+            'bytes_per_row': round(retained / len(rows), 1) if rows else 0.0,
+            'demographics_bytes_per_row': round(demographics / len(rows), 1) if rows else 0.0
+        }
+        print(f"  {name:<12} {'memory':<17} {memory[name]['bytes_per_row']:>9.1f} bytes/row retained, "
+              f"{memory[name]['demographics_bytes_per_row']:.1f} of them demographics")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'database': db_path, 'rows': len(rows), 'results': results, 'memory': memory}, f, indent=2)
+        print(f"📄 Results written to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
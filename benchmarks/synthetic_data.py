@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator for the benchmarks
+Builds geography.db / geography_temporal.db look-alikes at a chosen scale, using the schema
+of the committed databases so every route runs against realistic tables, indexes and views.
+
+Scale 1 matches the committed data (7 continents, 250 countries, ~4,700 states, 16 cities,
+6 years). At scale N the largest tables (cities, temporal country rows) grow N-fold and the
+other dimensions (countries, states, years) grow by sqrt(N). 10000x is several GB on disk.
+
+Usage:
+    python benchmarks/synthetic_data.py 100 [output_dir]
+"""
+
+import math
+import os
+import random
+import sqlite3
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_GEOGRAPHY_DB = os.path.join(REPO_DIR, 'geography.db')
+SOURCE_TEMPORAL_DB = os.path.join(REPO_DIR, 'geography_temporal.db')
+
+sys.path.insert(0, REPO_DIR)
+import migrate
+
+CONTINENTS = [
+    (1, 'North America', 'NA'), (2, 'South America', 'SA'), (3, 'Europe', 'EU'),
+    (4, 'Asia', 'AS'), (5, 'Africa', 'AF'), (6, 'Oceania', 'OC'), (7, 'Antarctica', 'AN')
+]
+
+BASE_COUNTRIES = 250
+BASE_STATES = 4674
+BASE_CITIES = 16
+BASE_YEARS = 6
+FIRST_YEAR = 2020
+
+RELIGIONS = ['christian', 'muslim', 'hindu', 'buddhist', 'jewish', 'other', 'nonreligious']
+RACES = ['white', 'black', 'asian', 'hispanic', 'native_american', 'pacific_islander', 'other']
+
+BATCH_SIZE = 10000
+
+def scale_plan(scale):
+    """Row counts for a scale factor"""
+    root = math.sqrt(scale)
+    return {
+        'scale': scale,
+        'countries': max(1, round(BASE_COUNTRIES * root)),
+        'states': max(1, round(BASE_STATES * root)),
+        'cities': max(1, round(BASE_CITIES * scale)),
+        'years': max(1, round(BASE_YEARS * root))
+    }
+
+def dataset_paths(output_dir, scale):
+    return (os.path.join(output_dir, f'geography_x{scale}.db'),
+            os.path.join(output_dir, f'geography_temporal_x{scale}.db'))
+
+def copy_schema(source_path, db):
+    """Replay the CREATE statements of a committed database (not SQLite's internal sqlite_* tables)"""
+    source = sqlite3.connect(source_path)
+    statements = source.execute(
+        "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' ORDER BY rowid"
+    ).fetchall()
+    source.close()
+    for (sql,) in statements:
+        db.execute(sql)
+
+def open_new(path):
+    if os.path.exists(path):
+        os.remove(path)
+    db = sqlite3.connect(path)
+    db.execute('PRAGMA journal_mode = OFF')
+    db.execute('PRAGMA synchronous = OFF')
+    return db
+
+def insert_batches(db, sql, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            db.executemany(sql, batch)
+            batch = []
+    if batch:
+        db.executemany(sql, batch)
+
+def percentages(rng, count):
+    weights = [rng.random() ** 3 for _ in range(count)]
+    total = sum(weights) or 1.0
+    return [round(100.0 * weight / total, 1) for weight in weights]
+
+def country_name(index):
+    return f"Country {index:06d}"
+
+def generate_geography(path, plan, seed=42):
+    """Continents > countries > states > cities with the committed geography.db schema"""
+    rng = random.Random(seed)
+    db = open_new(path)
+    copy_schema(SOURCE_GEOGRAPHY_DB, db)
+
+    db.executemany('INSERT INTO continents (id, name, code) VALUES (?, ?, ?)', CONTINENTS)
+
+    def countries():
+        for i in range(1, plan['countries'] + 1):
+            religion = percentages(rng, len(RELIGIONS))
+            yield ([i, CONTINENTS[i % len(CONTINENTS)][0], country_name(i), f'C{i}', f'CY{i}', f'Capital {i}',
+                    rng.uniform(1e3, 1e7), rng.randint(10000, 300000000), 'XXX', 'Language']
+                   + religion)
+    insert_batches(db, f'''
+        INSERT INTO countries (id, continent_id, name, code_iso2, code_iso3, capital, area_km2, population,
+                               currency, language_primary, {', '.join(f'religion_{r}_percent' for r in RELIGIONS)})
+        VALUES ({', '.join('?' * (10 + len(RELIGIONS)))})
+    ''', countries())
+
+    def states():
+        for i in range(1, plan['states'] + 1):
+            yield (i, (i - 1) % plan['countries'] + 1, f'State {i:07d}', f'S{i}', 'state', f'State Capital {i}',
+                   rng.uniform(100, 1e6), rng.randint(1000, 50000000))
+    insert_batches(db, '''
+        INSERT INTO states_provinces (id, country_id, name, code, type, capital, area_km2, population)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', states())
+
+    def cities():
+        for i in range(1, plan['cities'] + 1):
+            yield ((i - 1) % plan['states'] + 1, f'City {i:08d}', 'city', rng.randint(1000, 20000000),
+                   rng.uniform(1, 5000), rng.randint(0, 3000), rng.uniform(-90, 90), rng.uniform(-180, 180),
+                   i % 5 == 0, rng.randint(800, 2000))
+    insert_batches(db, '''
+        INSERT INTO cities (state_province_id, name, type, population, area_km2, elevation_m,
+                            latitude, longitude, is_capital, founded_year)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', cities())
+
+    db.commit()
+    db.execute('ANALYZE')
+    db.close()
+
+def generate_temporal(path, plan, seed=42):
+    """Per-year continent and country rows with the committed geography_temporal.db schema"""
+    rng = random.Random(seed)
+    db = open_new(path)
+    copy_schema(SOURCE_TEMPORAL_DB, db)
+
+    years = range(FIRST_YEAR, FIRST_YEAR + plan['years'])
+    db.executemany('INSERT INTO continents_temporal (year, continent_id, name, code) VALUES (?, ?, ?, ?)',
+                   [(year, continent_id, name, code) for year in years for continent_id, name, code in CONTINENTS])
+
+    base_populations = [rng.randint(10000, 300000000) for _ in range(plan['countries'])]
+    states_per_country = max(1, plan['states'] // plan['countries'])
+    columns = (['year', 'country_id', 'continent_id', 'name', 'code_iso2', 'code_iso3', 'population', 'capital',
+                'territories'] + [f'religion_{r}_percent' for r in RELIGIONS] + [f'race_{r}_percent' for r in RACES])
+
+    def countries():
+        for year in years:
+            growth = 1.0 + 0.01 * (year - FIRST_YEAR)
+            for i in range(1, plan['countries'] + 1):
+                territories = ', '.join(f'Territory {i}-{t}' for t in range(min(states_per_country, 20)))
+                yield ([year, i, CONTINENTS[i % len(CONTINENTS)][0], country_name(i), f'C{i}', f'CY{i}',
+                        int(base_populations[i - 1] * growth), f'Capital {i}', territories]
+                       + percentages(rng, len(RELIGIONS)) + percentages(rng, len(RACES)))
+    insert_batches(db, f'''
+        INSERT INTO countries_temporal ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+    ''', countries())
+
+    db.commit()
+    db.execute('ANALYZE')
+    db.close()
+
+def ensure_datasets(output_dir, scale, seed=42):
+    """Generate both databases for a scale unless they already exist"""
+    os.makedirs(output_dir, exist_ok=True)
+    geography_path, temporal_path = dataset_paths(output_dir, scale)
+    plan = scale_plan(scale)
+    if not os.path.exists(geography_path):
+        started = time.time()
+        print(f"🏗️  Generating {geography_path} ({plan['countries']} countries, {plan['states']} states, {plan['cities']} cities)")
+        generate_geography(geography_path, plan, seed)
+        print(f"   done in {time.time() - started:.1f}s")
+    if not os.path.exists(temporal_path):
+        started = time.time()
+        print(f"🏗️  Generating {temporal_path} ({plan['years']} years x {plan['countries']} countries)")
+        generate_temporal(temporal_path, plan, seed)
+        print(f"   done in {time.time() - started:.1f}s")
+    # Cached datasets pick up schema changes too
+    migrate.upgrade(temporal_path)
+    return geography_path, temporal_path
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    output = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+    ensure_datasets(output, int(sys.argv[1]))
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Rebuild geography.db and geography_temporal.db from scratch in one run
+Every population stage runs in the order below on one connection and in one transaction,
+against a fresh temp file in releases/ with journaling and syncing off. Secondary indexes
+are dropped while the data loads and created afterwards; the file is then analyzed, vacuumed,
+synced and renamed to a versioned release (releases/geography-<UTC time>.db). Installing
+points the target path at the release by swapping a symlink with os.replace(), so anything
+opening the path sees either the previous database or the complete new one - never a
+half-built file. The newest RELEASES_KEPT releases of each database are kept for rollback.
+
+geography.db
+    schema            database_schema.sql
+    country.io        populate_countries.py
+    REST Countries    fix_database.py
+    mledoze / ISO     comprehensive_populate.py (countries, ISO 3166-2 subdivisions, cities)
+    country facts     data/country_facts.csv (capitals, populations, religion and race/ethnicity
+                      shares, territories)
+geography_temporal.db
+    schema            TEMPORAL_SCHEMA, then migrate.py
+    derive            derive_temporal.py: every country of geography.db for each year in YEARS,
+                      with that year's populations from data/years/<year>.csv
+    rollups           rollups.py
+    check             derive_temporal.check(), indexes.check_hot_queries()
+
+Downloads go through source_cache.py: GEO_SOURCE_SNAPSHOT=<dir> GEO_SOURCE_OFFLINE=1 replays
+a vendored snapshot for a deterministic offline build. Running servers notice the flipped
+symlink (db_pool.serve), warm their caches from the new release and switch to it without a
+restart; requests already running finish on the old release.
+
+Usage:
+    python build.py                           # both databases
+    python build.py --only temporal           # temporal database from the existing geography.db
+                                              # (a geography.db without the country facts columns
+                                              # is first re-released with data/country_facts.csv loaded)
+    python build.py --out-dir build/ --subdivisions subdivisions.csv --quiet
+"""
+
+import argparse
+import contextlib
+import csv
+import logging
+import os
+import sqlite3
+import stat
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from urllib.request import pathname2url
+
+import comprehensive_populate
+import derive_temporal
+import fix_database
+import indexes
+import migrate
+import populate_countries
+import rollups
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+GEOGRAPHY = 'geography.db'
+TEMPORAL = 'geography_temporal.db'
+
+SCHEMA_FILE = os.path.join(HERE, 'database_schema.sql')
+COUNTRY_FACTS_FILE = os.path.join(HERE, 'data', 'country_facts.csv')
+
+# Years held by the temporal database; years without a data/years/ file take geography.db's populations
+YEARS = derive_temporal.YEARS
+
+# Versioned database files live here (relative to the output directory); the targets link to them
+RELEASES_DIR = 'releases'
+RELEASES_KEPT = 3
+
+# Temporal tables before the versioned migrations add their columns and indexes
+TEMPORAL_SCHEMA = '''
+    CREATE TABLE continents_temporal (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        year INTEGER NOT NULL,
+        continent_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        code TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(year, continent_id)
+    );
+    CREATE TABLE countries_temporal (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        year INTEGER NOT NULL,
+        country_id INTEGER NOT NULL,
+        continent_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        code_iso2 TEXT,
+        code_iso3 TEXT,
+        population INTEGER DEFAULT NULL,
+        religion_christian_percent REAL DEFAULT NULL,
+        religion_muslim_percent REAL DEFAULT NULL,
+        religion_hindu_percent REAL DEFAULT NULL,
+        religion_buddhist_percent REAL DEFAULT NULL,
+        religion_jewish_percent REAL DEFAULT NULL,
+        religion_other_percent REAL DEFAULT NULL,
+        religion_nonreligious_percent REAL DEFAULT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(year, country_id),
+        FOREIGN KEY (continent_id) REFERENCES continents_temporal(continent_id)
+    );
+    CREATE INDEX idx_continents_year ON continents_temporal(year);
+    CREATE INDEX idx_countries_continent ON countries_temporal(continent_id);
+    CREATE VIEW year_summary AS
+    SELECT
+        year,
+        COUNT(DISTINCT continent_id) as continents,
+        (SELECT COUNT(*) FROM countries_temporal ct WHERE ct.year = c.year) as countries,
+        (SELECT COUNT(*) FROM countries_temporal ct WHERE ct.year = c.year AND ct.population IS NOT NULL) as countries_with_population
+    FROM continents_temporal c
+    GROUP BY year
+    ORDER BY year;
+'''
+
+class BuildError(Exception):
+    pass
+
+class Stages:
+    """Runs build stages in order and times them (stage output is dropped when quiet)"""
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+        self.timings = []
+
+    def run(self, name, function, *args):
+        started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            if self.quiet:
+                stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+                logging.disable(logging.INFO)
+                stack.callback(logging.disable, logging.NOTSET)
+            result = function(*args)
+        if result is False:
+            raise BuildError(f"Stage '{name}' failed")
+        elapsed = time.perf_counter() - started
+        self.timings.append((name, elapsed))
+        print(f"   ✅ {name} ({elapsed:.2f}s)")
+        return result
+
+def _open(path):
+    """Connection tuned for bulk-loading a file nothing else has open"""
+    db = sqlite3.connect(path, isolation_level=None)
+    db.execute('PRAGMA journal_mode = OFF')
+    db.execute('PRAGMA synchronous = OFF')
+    db.execute('PRAGMA temp_store = MEMORY')
+    db.execute('PRAGMA cache_size = -65536')
+    return db
+
+def _drop_indexes(db):
+    """Drop every secondary index (constraint indexes stay); returns their CREATE statements"""
+    deferred = db.execute('''
+        SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY rowid
+    ''').fetchall()
+    for name, _ in deferred:
+        db.execute(f'DROP INDEX {name}')
+    return [sql for _, sql in deferred]
+
+def _create_indexes(db, statements):
+    for sql in statements:
+        db.execute(sql)
+    db.execute('ANALYZE')
+
+def _finish(db, path, journal_mode):
+    """Check, compact, sync and close a built database file (after the load has committed)"""
+    problems = [row[0] for row in db.execute('PRAGMA quick_check')]
+    if problems != ['ok']:
+        raise BuildError(f"{path} failed its integrity check: {'; '.join(problems[:5])}")
+    db.execute('VACUUM')
+    db.execute(f'PRAGMA journal_mode = {journal_mode}')
+    db.close()
+    with open(path, 'rb+') as f:
+        os.fsync(f.fileno())
+
+# GEOGRAPHY DATABASE
+
+def _country_io(db):
+    continent_mapping = populate_countries.get_continent_mapping(db)
+    country_data = populate_countries.download_country_data()
+    if not country_data.get('names'):
+        raise BuildError("No country.io data (check the network or GEO_SOURCE_SNAPSHOT)")
+    populate_countries.populate_countries(country_data, continent_mapping, db)
+
+def _rest_countries(db):
+    fix_database.remove_fake_antarctica_countries(db)
+    countries = fix_database.get_better_country_data()
+    if not countries:
+        raise BuildError("No REST Countries data (check the network or GEO_SOURCE_SNAPSHOT)")
+    fix_database.add_missing_countries(countries, db)
+
+def _comprehensive(db, subdivisions_source):
+    populator = comprehensive_populate.ComprehensiveGeographyPopulator()
+    countries, subdivisions = populator.download(subdivisions_source)
+    if not countries or not subdivisions:
+        raise BuildError("No mledoze country or ISO 3166-2 subdivision data (check the network or GEO_SOURCE_SNAPSHOT)")
+    populator.populate(db, countries, subdivisions)
+
+def load_country_facts(db, path=COUNTRY_FACTS_FILE):
+    """Set capitals, populations, religion and race/ethnicity shares and territories from the facts file
+
+    Rows are keyed by ISO2 code; these columns are what the temporal database copies into every year.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        columns = [column for column in reader.fieldnames if column not in ('code_iso2', 'name')]
+        rows = [[row[column] or None for column in columns] + [row['code_iso2']] for row in reader]
+    migrate.add_columns(db, 'countries', [(column, 'REAL DEFAULT 0') for column in columns if column.startswith('religion_')])
+    migrate.add_columns(db, 'countries', [(column, 'REAL') for column in columns if column.startswith('race_')])
+    migrate.add_columns(db, 'countries', [('territories', 'TEXT')])
+
+    changes_before = db.total_changes
+    assignments = ', '.join(f'{column} = ?' for column in columns)
+    db.executemany(f'UPDATE countries SET {assignments} WHERE code_iso2 = ?', rows)
+    print(f"✅ Facts for {db.total_changes - changes_before} of {len(rows)} countries in {os.path.basename(path)}")
+
+def missing_country_facts(path):
+    """Columns the temporal database copies from countries that an existing geography.db lacks"""
+    db = sqlite3.connect(f"file:{pathname2url(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        available = {row[1] for row in db.execute('PRAGMA table_info(countries)')}
+    finally:
+        db.close()
+    return [column for column in derive_temporal.COPIED_COLUMNS if column not in available]
+
+def add_country_facts(source, path, stages):
+    """Copy an existing geography.db to path and load data/country_facts.csv into the copy"""
+    db = _open(path)
+    try:
+        original = sqlite3.connect(source)
+        try:
+            original.backup(db)
+        finally:
+            original.close()
+        db.execute('BEGIN')
+        stages.run('country facts', load_country_facts, db)
+        db.execute('COMMIT')
+        _finish(db, path, 'DELETE')
+    except BaseException:
+        db.close()
+        raise
+
+def build_geography(path, stages, subdivisions_source=comprehensive_populate.SUBDIVISIONS_URL):
+    db = _open(path)
+    try:
+        with open(SCHEMA_FILE) as f:
+            db.executescript(f.read())
+        db.execute('BEGIN')
+        deferred = _drop_indexes(db)
+        stages.run('country.io countries', _country_io, db)
+        stages.run('REST Countries fixes', _rest_countries, db)
+        stages.run('mledoze countries, subdivisions and cities', _comprehensive, db, subdivisions_source)
+        stages.run('country facts', load_country_facts, db)
+        stages.run('indexes and statistics', _create_indexes, db, deferred)
+        if not db.execute('SELECT COUNT(*) FROM countries').fetchone()[0]:
+            raise BuildError("geography build produced no countries")
+        db.execute('COMMIT')
+        _finish(db, path, 'DELETE')
+    except BaseException:
+        db.close()
+        raise
+
+# TEMPORAL DATABASE
+
+def _check_temporal(db, years=YEARS):
+    counts = dict(db.execute('SELECT year, COUNT(*) FROM countries_temporal GROUP BY year'))
+    empty = [year for year in years if not counts.get(year)]
+    if empty:
+        raise BuildError(f"temporal build has no countries for {', '.join(map(str, empty))}")
+    differences = derive_temporal.describe(derive_temporal.check(db, years))
+    if differences:
+        raise BuildError(f"temporal build differs from geography.db: {'; '.join(differences[:5])}")
+    failures = indexes.check_hot_queries(db)
+    if failures:
+        raise BuildError(f"hot queries fall back to full scans: {', '.join(description for description, _ in failures)}")
+
+def build_temporal(path, geography_path, stages):
+    if not os.path.exists(geography_path):
+        raise BuildError(f"{geography_path} not found - build it first (python build.py --only geography)")
+    db = _open(path)
+    try:
+        db.executescript(TEMPORAL_SCHEMA)
+        db.execute('ATTACH DATABASE ? AS geography', (geography_path,))
+        db.execute('BEGIN')
+        stages.run('schema migrations', migrate.apply_pending, db)
+        deferred = _drop_indexes(db)
+        stages.run('derive from geography.db and data/years', derive_temporal.derive, db)
+        stages.run('demographic rollups', rollups.refresh, db)
+        stages.run('indexes and statistics', _create_indexes, db, deferred)
+        _check_temporal(db)
+        db.execute('COMMIT')
+        db.execute('DETACH DATABASE geography')
+        _finish(db, path, 'WAL')
+    except BaseException:
+        db.close()
+        raise
+
+# INSTALLATION
+
+def _releases_dir(target):
+    directory = os.path.join(os.path.dirname(os.path.abspath(target)), RELEASES_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def _temporary_path(target):
+    name = os.path.basename(target)
+    fd, path = tempfile.mkstemp(dir=_releases_dir(target), prefix=f'.{name}.', suffix='.build')
+    os.close(fd)
+    return path
+
+def _fsync_directory(path):
+    directory = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
+
+def _releases(target):
+    """Release files of a target, oldest first"""
+    stem = os.path.splitext(os.path.basename(target))[0]
+    directory = _releases_dir(target)
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith(f'{stem}-') and name.endswith('.db') and name[len(stem) + 1:-3][:1].isdigit())
+    return [os.path.join(directory, name) for name in names]
+
+def prune_releases(target, keep=RELEASES_KEPT):
+    """Delete all but the newest keep releases of a target (never the one it points to)"""
+    current = os.path.realpath(target)
+    removed = []
+    for release in _releases(target)[:-keep]:
+        if release == current:
+            continue
+        for path in (release, release + '-wal', release + '-shm'):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+        removed.append(release)
+    return removed
+
+def install(built, target):
+    """Rename a built database file to a versioned release and atomically point the target at it"""
+    stem = os.path.splitext(os.path.basename(target))[0]
+    directory = os.path.dirname(os.path.abspath(target))
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S.%fZ')
+    release = os.path.join(_releases_dir(target), f'{stem}-{stamp}.db')
+    # mkstemp creates owner-only files; give the build the old file's permissions
+    os.chmod(built, stat.S_IMODE(os.stat(target).st_mode) if os.path.exists(target) else 0o644)
+    os.rename(built, release)
+    _fsync_directory(os.path.dirname(release))
+
+    # A symlink can't be overwritten in place: create it beside the target and rename it over
+    # (this also replaces a plain database file left by an older build)
+    link = os.path.join(directory, f'.{os.path.basename(target)}.link')
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(link)
+    os.symlink(os.path.relpath(release, directory), link)
+    os.replace(link, target)
+    _fsync_directory(directory)
+    return release
+
+def build(out_dir='.', only=None, subdivisions_source=comprehensive_populate.SUBDIVISIONS_URL, quiet=False):
+    """Build the databases into new releases and point the files in out_dir at them; returns the Stages run"""
+    geography_target = os.path.join(out_dir, GEOGRAPHY)
+    temporal_target = os.path.join(out_dir, TEMPORAL)
+    stages = Stages(quiet)
+    built = []
+    try:
+        geography_path = geography_target
+        if only in (None, 'geography'):
+            print(f"🌍 Building {geography_target}")
+            geography_path = _temporary_path(geography_target)
+            built.append((geography_path, geography_target))
+            build_geography(geography_path, stages, subdivisions_source)
+        elif os.path.exists(geography_target) and missing_country_facts(geography_target):
+            # The temporal build copies these columns; release geography.db with them so both agree
+            print(f"🌍 Adding country facts to {geography_target}")
+            geography_path = _temporary_path(geography_target)
+            built.append((geography_path, geography_target))
+            add_country_facts(geography_target, geography_path, stages)
+        if only in (None, 'temporal'):
+            print(f"🕐 Building {temporal_target}")
+            temporal_path = _temporary_path(temporal_target)
+            built.append((temporal_path, temporal_target))
+            build_temporal(temporal_path, geography_path, stages)
+    except BaseException:
+        for path, _ in built:
+            for leftover in (path, path + '-journal', path + '-wal', path + '-shm'):
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(leftover)
+        raise
+
+    for path, target in built:
+        release = install(path, target)
+        print(f"📦 Installed {target} -> {os.path.relpath(release, out_dir)} ({os.path.getsize(release):,} bytes)")
+        for old in prune_releases(target):
+            print(f"🗑️  Removed old release {os.path.relpath(old, out_dir)}")
+    return stages
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Rebuild the geography databases from scratch')
+    parser.add_argument('--only', choices=['geography', 'temporal'], help='build just one database')
+    parser.add_argument('--out-dir', default='.', help='directory holding the databases (default: .)')
+    parser.add_argument('--subdivisions', default=comprehensive_populate.SUBDIVISIONS_URL,
+                        help='subdivisions CSV URL or local file')
+    parser.add_argument('--quiet', action='store_true', help='hide the output of the individual stages')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        stages = build(args.out_dir, args.only, args.subdivisions, args.quiet)
+    except (BuildError, derive_temporal.DerivationError) as e:
+        print(f"❌ Build failed: {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print(f"🎉 BUILD COMPLETE in {time.perf_counter() - started:.2f}s")
+    print("=" * 60)
+    for name, elapsed in stages.timings:
+        print(f"   {name:45} {elapsed:7.2f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
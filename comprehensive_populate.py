@@ -7,19 +7,49 @@ Downloads from multiple sources to get 3000+ entries including:
 - Dependencies, overseas territories, etc.
 """
 
-import requests
+import argparse
+import csv
+import io
+import os
 import sqlite3
 import json
 import time
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+import source_cache
+
+COUNTRIES_URL = "https://raw.githubusercontent.com/mledoze/countries/master/countries.json"
+SUBDIVISIONS_URL = "https://raw.githubusercontent.com/stefangabos/world_countries/master/data/subdivisions/subdivisions.csv"
+
+# Rows per executemany() call when bulk-loading subdivisions
+SUBDIVISION_BATCH_SIZE = 1000
+
+# Rows per multi-row INSERT when loading countries (7 parameters each, well under SQLite's limit)
+COUNTRY_BATCH_SIZE = 100
+
+def read_subdivisions(lines: Iterable[str]):
+    """Stream subdivision dicts from CSV lines (country code, code, name, type[, parent]) after a header row"""
+    reader = csv.reader(lines)
+    next(reader, None)
+    for parts in reader:
+        if len(parts) >= 4:
+            yield {
+                'country_code': parts[0],
+                'subdivision_code': parts[1],
+                'subdivision_name': parts[2],
+                'subdivision_type': parts[3],
+                'parent': parts[4] if len(parts) > 4 else None
+            }
 
 class ComprehensiveGeographyPopulator:
     def __init__(self, db_path: str = 'geography.db'):
         self.db_path = db_path
-        self.session = requests.Session()
+        self.session = source_cache.pooled_session()
         self.session.headers.update({
             'User-Agent': 'Geography-Database-Builder/1.0'
         })
+        self.sources = source_cache.from_env(self.session)
         
     def connect_db(self):
         """Connect to the database"""
@@ -27,53 +57,28 @@ class ComprehensiveGeographyPopulator:
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
     
-    def get_continent_id(self, conn: sqlite3.Connection, continent_name: str) -> int:
-        """Get continent ID by name"""
-        cursor = conn.execute("SELECT id FROM continents WHERE name = ?", (continent_name,))
-        result = cursor.fetchone()
-        return result[0] if result else None
+    def get_continent_ids(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        """Map of continent name -> ID, read once"""
+        return {name: continent_id for continent_id, name in conn.execute("SELECT id, name FROM continents")}
     
-    def insert_country(self, conn: sqlite3.Connection, country_data: Dict[str, Any]) -> int:
-        """Insert country and return its ID"""
-        cursor = conn.execute("""
-            INSERT OR IGNORE INTO countries 
-            (name, code_iso3, code_iso2, continent_id, capital, population, area_km2)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            country_data.get('name'),
-            country_data.get('code_iso3'),
-            country_data.get('code_iso2'),
-            country_data.get('continent_id'),
-            country_data.get('capital'),
-            country_data.get('population'),
-            country_data.get('area')
-        ))
-        
-        # Get the ID
-        cursor = conn.execute("SELECT id FROM countries WHERE name = ? AND code_iso3 = ?", 
-                            (country_data.get('name'), country_data.get('code_iso3')))
-        result = cursor.fetchone()
-        return result[0] if result else None
-    
-    def insert_subdivision(self, conn: sqlite3.Connection, subdivision_data: Dict[str, Any]) -> int:
-        """Insert state/province and return its ID"""
-        cursor = conn.execute("""
-            INSERT OR IGNORE INTO states_provinces 
-            (name, code, country_id, type, population, area_km2)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            subdivision_data.get('name'),
-            subdivision_data.get('code'),
-            subdivision_data.get('country_id'),
-            subdivision_data.get('type'),
-            subdivision_data.get('population'),
-            subdivision_data.get('area')
-        ))
-        
-        cursor = conn.execute("SELECT id FROM states_provinces WHERE name = ? AND country_id = ?", 
-                            (subdivision_data.get('name'), subdivision_data.get('country_id')))
-        result = cursor.fetchone()
-        return result[0] if result else None
+    def insert_countries(self, conn: sqlite3.Connection, rows: List[Tuple]) -> List[Tuple[int, str, str]]:
+        """Upsert (name, code_iso3, code_iso2, continent_id, capital, population, area) rows in batches;
+        returns (id, code_iso3, code_iso2) for every new country and every one already stored under its
+        name and ISO3 code (a row whose ISO3 code is stored under another name is left out)"""
+        stored = []
+        for start in range(0, len(rows), COUNTRY_BATCH_SIZE):
+            batch = rows[start:start + COUNTRY_BATCH_SIZE]
+            values = ', '.join(['(?, ?, ?, ?, ?, ?, ?)'] * len(batch))
+            cursor = conn.execute(f"""
+                INSERT INTO countries 
+                (name, code_iso3, code_iso2, continent_id, capital, population, area_km2)
+                VALUES {values}
+                ON CONFLICT (code_iso3) DO UPDATE SET code_iso3 = excluded.code_iso3 WHERE countries.name = excluded.name
+                ON CONFLICT DO NOTHING
+                RETURNING id, code_iso3, code_iso2
+            """, [value for row in batch for value in row])
+            stored.extend(cursor.fetchall())
+        return stored
     
     def map_region_to_continent(self, region: str, subregion: str = None) -> str:
         """Map region/subregion to continent"""
@@ -93,11 +98,7 @@ class ComprehensiveGeographyPopulator:
         
         try:
             # Get the comprehensive dataset with all 249 entries
-            url = "https://raw.githubusercontent.com/mledoze/countries/master/countries.json"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            countries_data = response.json()
+            countries_data = self.sources.get_json(COUNTRIES_URL)
             print(f"✅ Downloaded {len(countries_data)} countries/territories")
             
             processed_countries = []
@@ -134,46 +135,16 @@ class ComprehensiveGeographyPopulator:
             print(f"❌ Error downloading country data: {e}")
             return []
     
-    def download_subdivisions_data(self) -> List[Dict[str, Any]]:
-        """Download ISO 3166-2 subdivision data"""
+    def download_subdivisions_data(self, source: str = SUBDIVISIONS_URL) -> List[Dict[str, Any]]:
+        """Download ISO 3166-2 subdivision data (source may also be a local CSV file)"""
         print("🏛️ Downloading subdivision data...")
         
         try:
-            # Try CSV format from stefangabos
-            url = "https://raw.githubusercontent.com/stefangabos/world_countries/master/data/subdivisions/subdivisions.csv"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse CSV manually
-            lines = response.text.strip().split('\n')
-            subdivisions = []
-            
-            for line in lines[1:]:  # Skip header
-                # Handle CSV parsing with potential commas in quoted fields
-                parts = []
-                current_part = ""
-                in_quotes = False
-                
-                for char in line:
-                    if char == '"':
-                        in_quotes = not in_quotes
-                    elif char == ',' and not in_quotes:
-                        parts.append(current_part.strip('"'))
-                        current_part = ""
-                    else:
-                        current_part += char
-                
-                if current_part:
-                    parts.append(current_part.strip('"'))
-                
-                if len(parts) >= 4:
-                    subdivisions.append({
-                        'country_code': parts[0],
-                        'subdivision_code': parts[1],
-                        'subdivision_name': parts[2],
-                        'subdivision_type': parts[3],
-                        'parent': parts[4] if len(parts) > 4 else None
-                    })
+            if os.path.exists(source):
+                with open(source, newline='', encoding='utf-8') as f:
+                    subdivisions = list(read_subdivisions(f))
+            else:
+                subdivisions = list(read_subdivisions(io.StringIO(self.sources.get_text(source), newline='')))
             
             print(f"✅ Downloaded {len(subdivisions)} subdivisions from CSV")
             return subdivisions
@@ -183,62 +154,69 @@ class ComprehensiveGeographyPopulator:
             return []
     
     def populate_countries(self, conn: sqlite3.Connection, countries_data: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Populate countries table and return mapping of country codes to IDs"""
+        """Load countries in the caller's transaction and return mapping of country codes to IDs"""
         print("🏛️ Populating countries...")
+        started = time.perf_counter()
         
-        country_id_map = {}
-        
+        continent_ids = self.get_continent_ids(conn)
+        rows = []
         for country in countries_data:
-            # Get continent ID
-            continent_id = self.get_continent_id(conn, country['continent_name'])
+            continent_id = continent_ids.get(country['continent_name'])
             if not continent_id:
                 print(f"⚠️ Unknown continent: {country['continent_name']} for {country['name']}")
                 continue
-            
-            country_data = {
-                'name': country['name'],
-                'code_iso3': country['code'],
-                'code_iso2': country['code2'],
-                'continent_id': continent_id,
-                'capital': country['capital'],
-                'population': country['population'],
-                'area': country['area']
-            }
-            
-            country_id = self.insert_country(conn, country_data)
-            if country_id:
-                country_id_map[country['code']] = country_id
-                country_id_map[country.get('code2', '')] = country_id  # Also map 2-letter codes
+            rows.append((country['name'], country['code'], country['code2'], continent_id,
+                         country['capital'], country['population'], country['area']))
         
-        print(f"✅ Populated {len(country_id_map)} countries")
+        country_id_map = {}
+        stored = self.insert_countries(conn, rows)
+        for country_id, code_iso3, code_iso2 in stored:
+            country_id_map[code_iso3] = country_id
+            country_id_map[code_iso2 or ''] = country_id  # Also map 2-letter codes
+        if len(stored) < len(rows):
+            print(f"⚠️ Skipped {len(rows) - len(stored)} countries whose name or codes are stored for another country")
+        
+        print(f"✅ Populated {len(country_id_map)} countries in {time.perf_counter() - started:.2f}s")
         return country_id_map
     
-    def populate_subdivisions(self, conn: sqlite3.Connection, subdivisions_data: List[Dict[str, Any]], country_id_map: Dict[str, int]):
-        """Populate subdivisions table"""
+    def populate_subdivisions(self, conn: sqlite3.Connection, subdivisions_data: Iterable[Dict[str, Any]],
+                              country_id_map: Dict[str, int]) -> Dict[Tuple[int, str], int]:
+        """Bulk-load subdivisions in the caller's transaction; returns {(country_id, name): id}"""
         print("🏛️ Populating subdivisions...")
+        started = time.perf_counter()
         
-        subdivision_count = 0
+        def subdivision_rows():
+            for subdivision in subdivisions_data:
+                country_id = country_id_map.get(subdivision.get('country_code', ''))
+                if country_id:
+                    yield (subdivision.get('subdivision_name', ''), subdivision.get('subdivision_code', ''),
+                           country_id, subdivision.get('subdivision_type', 'subdivision'))
         
-        for subdivision in subdivisions_data:
-            country_code = subdivision.get('country_code', '')
-            country_id = country_id_map.get(country_code)
-            
-            if not country_id:
-                continue
-            
-            subdivision_data = {
-                'name': subdivision.get('subdivision_name', ''),
-                'code': subdivision.get('subdivision_code', ''),
-                'country_id': country_id,
-                'type': subdivision.get('subdivision_type', 'subdivision'),
-                'population': None,  # Not available in this dataset
-                'area': None        # Not available in this dataset
-            }
-            
-            if self.insert_subdivision(conn, subdivision_data):
-                subdivision_count += 1
+        rows = subdivision_rows()
+        
+        changes_before = conn.total_changes
+        while True:
+            batch = list(islice(rows, SUBDIVISION_BATCH_SIZE))
+            if not batch:
+                break
+            conn.executemany("""
+                INSERT OR IGNORE INTO states_provinces 
+                (name, code, country_id, type, population, area_km2)
+                VALUES (?, ?, ?, ?, NULL, NULL)
+            """, batch)
+        inserted = conn.total_changes - changes_before
         
-        print(f"✅ Populated {subdivision_count} subdivisions")
+        # One post-load read resolves the IDs of new and pre-existing subdivisions alike
+        country_ids = set(country_id_map.values())
+        subdivision_ids = {
+            (country_id, name): subdivision_id
+            for subdivision_id, country_id, name in conn.execute("SELECT id, country_id, name FROM states_provinces")
+            if country_id in country_ids
+        }
+        
+        print(f"✅ Populated {inserted} subdivisions ({len(subdivision_ids)} total) "
+              f"in {time.perf_counter() - started:.2f}s")
+        return subdivision_ids
     
     def add_major_cities(self, conn: sqlite3.Connection, country_id_map: Dict[str, int]):
         """Add major world cities"""
@@ -340,13 +318,28 @@ class ComprehensiveGeographyPopulator:
         
         print(f"✅ Added {city_count} major cities")
     
-    def run_comprehensive_population(self):
+    def download(self, subdivisions_source: str = SUBDIVISIONS_URL) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(countries, subdivisions) - both sources fetched concurrently, then parsed from the cache"""
+        self.sources.fetch_many([COUNTRIES_URL] + ([] if os.path.exists(subdivisions_source) else [subdivisions_source]))
+        return self.download_comprehensive_countries(), self.download_subdivisions_data(subdivisions_source)
+    
+    def populate(self, conn: sqlite3.Connection, countries_data: List[Dict[str, Any]],
+                 subdivisions_data: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Load countries, subdivisions and cities in the caller's transaction; returns the country code map"""
+        country_id_map = self.populate_countries(conn, countries_data)
+        
+        # Populate subdivisions if available
+        if subdivisions_data:
+            self.populate_subdivisions(conn, subdivisions_data, country_id_map)
+        
+        self.add_major_cities(conn, country_id_map)
+        return country_id_map
+    
+    def run_comprehensive_population(self, subdivisions_source: str = SUBDIVISIONS_URL):
         """Run the comprehensive population process"""
         print("🚀 Starting comprehensive geography database population...")
         
-        # Download all data
-        countries_data = self.download_comprehensive_countries()
-        subdivisions_data = self.download_subdivisions_data()
+        countries_data, subdivisions_data = self.download(subdivisions_source)
         
         if not countries_data:
             print("❌ No country data available, aborting")
@@ -356,15 +349,7 @@ class ComprehensiveGeographyPopulator:
         conn = self.connect_db()
         
         try:
-            # Populate countries
-            country_id_map = self.populate_countries(conn, countries_data)
-            
-            # Populate subdivisions if available
-            if subdivisions_data:
-                self.populate_subdivisions(conn, subdivisions_data, country_id_map)
-            
-            # Add major cities
-            self.add_major_cities(conn, country_id_map)
+            self.populate(conn, countries_data, subdivisions_data)
             
             # Commit all changes
             conn.commit()
@@ -397,8 +382,13 @@ class ComprehensiveGeographyPopulator:
             conn.close()
 
 def main():
-    populator = ComprehensiveGeographyPopulator()
-    populator.run_comprehensive_population()
+    parser = argparse.ArgumentParser(description='Populate the geography database from public datasets')
+    parser.add_argument('--db', default='geography.db')
+    parser.add_argument('--subdivisions', default=SUBDIVISIONS_URL, help='subdivisions CSV URL or local file')
+    args = parser.parse_args()
+
+    populator = ComprehensiveGeographyPopulator(args.db)
+    populator.run_comprehensive_population(args.subdivisions)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
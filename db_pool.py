@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite connection pool for the web apps
+Connections are opened once per database file and reused across requests.
+Calling close() on a pooled connection hands it back to the pool instead of closing it.
+
+A pool is pinned to the real file its path resolved to when it was created. serve() also
+watches the path: when it is repointed (build.py flips a symlink to a new release file, or
+the file is replaced), a pool for the new file is opened and warmed in the background -
+caches included, through the warmers - and then swapped in for every thread at once. The
+old pool drains: requests already holding its connections finish on the old file, and the
+connections are closed as they come back.
+
+A pool can also ATTACH other databases (read-only) to every connection it opens, for queries
+that join across files; it is pinned to, and switched with, those files as well.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.request import pathname2url
+
+# Callbacks invoked as fn(seconds, rows) after each statement's execute/fetch work;
+# metrics.py registers one to split request time into database and other work.
+query_observers = []
+
+# sqlite3.Connection subclass used for new connections (query_tracer.py can swap it)
+connection_factory = sqlite3.Connection
+
+# Seconds between checks of a served path for a new database file
+WATCH_INTERVAL = 1.0
+
+# Seconds a replaced pool waits for its borrowed connections to come back before giving up on them
+DRAIN_TIMEOUT = 30.0
+
+def _notify(seconds, rows):
+    for observer in query_observers:
+        observer(seconds, rows)
+
+def dataset_version(path):
+    """Short fingerprint of a database file's current contents (inode, modification time and size)
+
+    Symlinks are resolved, and the write-ahead log - where commits to a WAL-mode database land
+    until checkpointed - is included.
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    fingerprint = f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+    try:
+        wal = os.stat(path + '-wal')
+        fingerprint += f":{wal.st_mtime_ns}:{wal.st_size}"
+    except FileNotFoundError:
+        pass
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+
+class TimedCursor:
+    """Cursor wrapper that reports fetch time and row counts to the query observers"""
+
+    def __init__(self, cursor, seconds):
+        self._cursor = cursor
+        # Time spent in execute() is reported together with the first fetch
+        self._pending = seconds
+
+    def _report(self, started, rows):
+        _notify(time.perf_counter() - started + self._pending, rows)
+        self._pending = 0.0
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._report(started, len(rows))
+        return rows
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._report(started, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size if size is not None else self._cursor.arraysize)
+        self._report(started, len(rows))
+        return rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            row = next(self._cursor)
+        except StopIteration:
+            self._report(started, 0)
+            raise
+        self._report(started, 1)
+        return row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class PooledConnection:
+    """Connection handed out by a ConnectionPool; close() returns it to the pool"""
+
+    def __init__(self, pool, connection):
+        self._pool = pool
+        self._connection = connection
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        cursor = self._connection.execute(sql, parameters)
+        return TimedCursor(cursor, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        cursor = self._connection.executemany(sql, seq_of_parameters)
+        _notify(time.perf_counter() - started, 0)
+        return cursor
+
+    def close(self):
+        if self._connection is not None:
+            self._pool.release(self._connection)
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+def _identity(path):
+    """(real path, device, inode) of the file a path currently points to"""
+    file = os.path.realpath(path)
+    stat = os.stat(file)
+    return file, stat.st_dev, stat.st_ino
+
+def _identities(path, attach):
+    """Identities of a database path and of the databases attached to it (by schema name)"""
+    return (_identity(path),) + tuple(_identity(attach[schema]) for schema in sorted(attach))
+
+class ConnectionPool:
+    """Keeps up to max_idle open connections to one database file
+
+    attach maps schema name -> path of a database attached read-only to every connection.
+    """
+
+    def __init__(self, path, max_idle=8, attach=None):
+        self.path = path
+        self.max_idle = max_idle
+        self.attach = dict(attach or {})
+        # The files behind the paths when the pool was created; every connection opens these
+        try:
+            self.identity = _identities(path, self.attach)
+        except FileNotFoundError:
+            self.identity = tuple((os.path.abspath(p), None, None)
+                                  for p in [path] + [self.attach[schema] for schema in sorted(self.attach)])
+        self.file = self.identity[0][0]
+        self.attached = {schema: identity[0] for schema, identity in zip(sorted(self.attach), self.identity[1:])}
+        self.retired = False
+        self._idle = []
+        self._lock = threading.Lock()
+        self._drained = threading.Condition(self._lock)
+        self.in_use = 0
+        self.created = 0
+
+    @property
+    def version(self):
+        """dataset_version of the file, combined with those of the attached files"""
+        if not self.attached:
+            return dataset_version(self.file)
+        versions = [dataset_version(self.file)] + [dataset_version(file) for _, file in sorted(self.attached.items())]
+        return hashlib.sha1(':'.join(versions).encode()).hexdigest()[:12]
+
+    def _open(self):
+        # mode=rw so a missing database file is an error instead of a new empty database
+        uri = f"file:{pathname2url(self.file)}?mode=rw"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=connection_factory)
+        connection.row_factory = sqlite3.Row
+        try:
+            for schema, file in sorted(self.attached.items()):
+                connection.execute('ATTACH DATABASE ? AS ' + schema, (f"file:{pathname2url(file)}?mode=ro",))
+        except sqlite3.Error:
+            connection.close()
+            raise
+        with self._lock:
+            self.created += 1
+        return connection
+
+    def connect(self):
+        """Borrow a connection from the pool"""
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+            self.in_use += 1
+        if connection is None:
+            try:
+                connection = self._open()
+            except sqlite3.Error:
+                with self._lock:
+                    self.in_use -= 1
+                raise
+        return PooledConnection(self, connection)
+
+    def release(self, connection):
+        """Return a borrowed connection, discarding it if the pool is full or retired"""
+        if connection.in_transaction:
+            connection.rollback()
+        with self._lock:
+            self.in_use -= 1
+            if self.in_use == 0:
+                self._drained.notify_all()
+            if len(self._idle) < self.max_idle and not self.retired:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def retire(self, timeout=DRAIN_TIMEOUT):
+        """Stop pooling: close idle connections now and borrowed ones as they come back
+
+        Waits up to timeout seconds for the borrowed connections; returns whether all came back.
+        """
+        with self._lock:
+            self.retired = True
+        self.close_idle()
+        with self._lock:
+            return self._drained.wait_for(lambda: self.in_use == 0, timeout)
+
+    def close_idle(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'path': self.path,
+                'file': self.file,
+                'attached': self.attached,
+                'idle': len(self._idle),
+                'in_use': self.in_use,
+                'max_idle': self.max_idle,
+                'created': self.created
+            }
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def _key(path, attach):
+    return (path,) + tuple(sorted(attach.items())) if attach else path
+
+def get_pool(path, attach=None):
+    """Get the shared pool for a database file (and attached databases), creating it on first use"""
+    key = _key(path, attach)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(path, attach=attach)
+        return pool
+
+def all_pools():
+    with _pools_lock:
+        return list(_pools.values())
+
+def served_file(path):
+    """Real file currently served for a database path (what cache loaders should read)"""
+    return get_pool(path).file
+
+# HOT SWAP
+
+_watchers = {}
+_rejected = {}
+
+def switch(path, warmers=(), attach=None):
+    """Swap in a pool for the files path (and attach) now point to, if that changed; returns whether it did
+
+    The new pool opens and checks a connection and each warmer(pool) runs against it before
+    the swap, so requests never see a cold or unreadable file; on failure the current pool
+    stays and those files are not tried again. The old pool is then drained (see retire).
+    """
+    key = _key(path, attach)
+    current = get_pool(path, attach)
+    try:
+        identity = _identities(path, current.attach)
+    except FileNotFoundError:
+        return False
+    if identity == current.identity or _rejected.get(key) == identity:
+        return False
+
+    staged = ConnectionPool(path, current.max_idle, current.attach)
+    try:
+        db = staged.connect()
+        try:
+            db.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+        finally:
+            db.close()
+        for warm in warmers:
+            warm(staged)
+    except Exception as e:
+        _rejected[key] = staged.identity
+        staged.retire(timeout=0)
+        print(f"⚠️  Not switching {path} to {staged.file}: {e}")
+        return False
+
+    with _pools_lock:
+        _pools[key] = staged
+    print(f"🔀 {path} now serves {staged.file} (dataset {staged.version})")
+    if not current.retire():
+        print(f"⚠️  {current.file}: {current.in_use} connections still borrowed after {DRAIN_TIMEOUT:.0f}s")
+    return True
+
+def _watch(path, warmers, interval, attach):
+    while True:
+        time.sleep(interval)
+        try:
+            switch(path, warmers, attach)
+        except Exception as e:
+            print(f"⚠️  Watching {path}: {e}")
+
+def serve(path, warmers=(), interval=WATCH_INTERVAL, attach=None):
+    """Pool currently serving a database path; watches the path for a new file from the first call"""
+    key = _key(path, attach)
+    if key not in _watchers:
+        with _pools_lock:
+            if key not in _watchers:
+                _watchers[key] = threading.Thread(target=_watch, args=(path, list(warmers), interval, attach),
+                                                  name=f"db-watch {path}", daemon=True)
+                _watchers[key].start()
+    return get_pool(path, attach)
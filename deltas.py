@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Year-to-year changes per country for /api/changes
+Each metric is loaded once per dataset version into an in-memory year -> {country: value}
+series (one query). The ranking for a pair of years is computed on first use - absolute and
+percentage change for every country with a value in both years, sorted by each sort key -
+and memoized, so later requests for that pair are a slice of a precomputed list.
+
+Changes are not stored in a table: every pair of years would be needed for arbitrary
+from/to, which grows with years^2 x countries (4.4M rows for the 60-year benchmark dataset).
+
+Usage:
+    python deltas.py 2020 2025 [geography_temporal.db]
+"""
+
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+
+import db_pool
+
+DATABASE = 'geography_temporal.db'
+
+# Metrics with change rankings (countries_temporal columns)
+METRICS = ('population',)
+
+# ?sort= value -> key of a change entry
+SORTS = {
+    'magnitude': lambda change: abs(change['change']),
+    'change': lambda change: change['change'],
+    'percent': lambda change: change['change_percent']
+}
+
+# Pair rankings kept in memory (each holds one entry per country)
+MAX_CACHED_RANKINGS = 128
+
+class ChangesError(Exception):
+    pass
+
+class MetricSeries:
+    """Values of one metric by year and country for one dataset version"""
+
+    def __init__(self, db, metric):
+        if metric not in METRICS:
+            raise ChangesError(f"Unknown metric '{metric}' (expected one of: {', '.join(METRICS)})")
+        self.metric = metric
+        self.values = {}
+        self.names = {}
+        for year, country_id, name, value in db.execute(f'''
+            SELECT year, country_id, name, {metric} FROM countries_temporal
+            WHERE {metric} IS NOT NULL AND {metric} > 0
+            ORDER BY year
+        '''):
+            self.values.setdefault(year, {})[country_id] = value
+            self.names[country_id] = name
+        self.years = sorted(self.values)
+        self._rankings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _changes(self, from_year, to_year):
+        for year in (from_year, to_year):
+            if year not in self.values:
+                raise ChangesError(f"No {self.metric} data for year {year}")
+        before, after = self.values[from_year], self.values[to_year]
+        return [
+            {
+                'country_id': country_id,
+                'name': self.names[country_id],
+                'from_value': before[country_id],
+                'to_value': value,
+                'change': value - before[country_id],
+                'change_percent': round((value - before[country_id]) * 100 / before[country_id], 3)
+            }
+            for country_id, value in after.items() if country_id in before
+        ]
+
+    def ranking(self, from_year, to_year, sort):
+        """All changes between two years, ascending by SORTS[sort] (memoized)"""
+        key = (from_year, to_year, sort)
+        with self._lock:
+            ranking = self._rankings.get(key)
+            if ranking is not None:
+                self._rankings.move_to_end(key)
+                return ranking
+        ranking = sorted(self._changes(from_year, to_year), key=SORTS[sort])
+        with self._lock:
+            self._rankings[key] = ranking
+            while len(self._rankings) > MAX_CACHED_RANKINGS:
+                self._rankings.popitem(last=False)
+        return ranking
+
+    def page(self, from_year, to_year, sort='magnitude', descending=True, limit=10, offset=0):
+        """(one page of the ranking, number of countries ranked)"""
+        ranking = self.ranking(from_year, to_year, sort)
+        if descending:
+            end = max(len(ranking) - offset, 0)
+            start = max(end - limit, 0) if limit >= 0 else 0
+            return ranking[start:end][::-1], len(ranking)
+        return ranking[offset:offset + limit if limit >= 0 else None], len(ranking)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def load(path=DATABASE, metric='population', file=None):
+    """MetricSeries for a database, rebuilt only when its dataset version changes
+
+    Reads the file served for path (db_pool.served_file) unless given the file to read.
+    """
+    file = file or db_pool.served_file(path)
+    key = (path, db_pool.dataset_version(file), metric)
+    series = _cache.get(key)
+    if series is not None:
+        return series
+    with _cache_lock:
+        series = _cache.get(key)
+        if series is None:
+            db = sqlite3.connect(file)
+            try:
+                series = MetricSeries(db, metric)
+            finally:
+                db.close()
+            # The previous version stays: requests still on the old file during a swap read it
+            for stale in [k for k in _cache if k[0] == path and k[2] == metric][:-1]:
+                del _cache[stale]
+            _cache[key] = series
+    return series
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__)
+        return 1
+    from_year, to_year = int(argv[0]), int(argv[1])
+    path = argv[2] if len(argv) > 2 else DATABASE
+    try:
+        changes, total = load(path).page(from_year, to_year, limit=10)
+    except ChangesError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"📈 LARGEST POPULATION CHANGES {from_year} -> {to_year} ({total} countries)")
+    print("-" * 60)
+    for change in changes:
+        print(f"{change['name'][:24]:24} | {change['from_value']:13,} | {change['to_value']:13,} | "
+              f"{change['change']:+13,} | {change['change_percent']:+.2f}%")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Compact storage for the religious and racial/ethnic distributions of countries_temporal
+The fourteen nullable REAL percentage columns of a result set are kept in one flat array of
+doubles (fixed layout per schema, NaN for NULL) instead of two nested dicts per row. Rows
+expose read-only Distribution views into that array; the JSON provider encodes them directly.
+
+A block's values can be viewed as a rows x 14 NumPy matrix without copying (see matrix()),
+which is what the vectorized analytics build on.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+NAN = float('nan')
+
+class DistributionSchema:
+    """Shared category layout for one distribution (column prefix, output keys, order)"""
+
+    __slots__ = ('name', 'prefix', 'categories', 'keys', 'columns', 'positions')
+
+    def __init__(self, name, prefix, categories):
+        self.name = name
+        self.prefix = prefix
+        self.categories = tuple(categories)
+        self.keys = tuple(f'{category}_percent' for category in self.categories)
+        self.columns = tuple(f'{prefix}{key}' for key in self.keys)
+        self.positions = {key: i for i, key in enumerate(self.keys)}
+
+RELIGION = DistributionSchema('religious_distribution', 'religion_',
+                              ['christian', 'muslim', 'hindu', 'buddhist', 'jewish', 'other', 'nonreligious'])
+RACE = DistributionSchema('racial_ethnic_distribution', 'race_',
+                          ['white', 'black', 'asian', 'hispanic', 'native_american', 'pacific_islander', 'other'])
+SCHEMAS = (RELIGION, RACE)
+
+class DemographicsBlock:
+    """Distributions for many rows stored back to back in one array('d')"""
+
+    __slots__ = ('schemas', 'offsets', 'width', 'values', 'rows')
+
+    def __init__(self, schemas=SCHEMAS):
+        self.schemas = tuple(schemas)
+        self.offsets = {}
+        width = 0
+        for schema in self.schemas:
+            self.offsets[schema.name] = width
+            width += len(schema.categories)
+        self.width = width
+        self.values = array('d')
+        self.rows = 0
+
+    def append(self, values):
+        """Store one row's values (laid out schema by schema, None for NULL); returns its row number"""
+        self.values.extend([NAN if value is None else value for value in values])
+        self.rows += 1
+        return self.rows - 1
+
+    def distribution(self, row, schema):
+        return Distribution(self, row * self.width + self.offsets[schema.name], schema)
+
+    def column(self, schema, category):
+        """Every row's value for one category (NaN for NULL)"""
+        start = self.offsets[schema.name] + schema.categories.index(category)
+        return self.values[start::self.width]
+
+    def matrix(self):
+        """rows x width NumPy view of the stored values (no copy)"""
+        import numpy
+        return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(self.rows, self.width)
+
+class Distribution(Mapping):
+    """Read-only {category_percent: value} view of one row in a DemographicsBlock
+
+    NULL and 0.0 read as 0, matching the API's historical `value or 0` output.
+    """
+
+    __slots__ = ('block', 'start', 'schema')
+
+    def __init__(self, block, start, schema):
+        self.block = block
+        self.start = start
+        self.schema = schema
+
+    def __getitem__(self, key):
+        value = self.block.values[self.start + self.schema.positions[key]]
+        return 0 if value != value or value == 0 else value
+
+    def __iter__(self):
+        return iter(self.schema.keys)
+
+    def __len__(self):
+        return len(self.schema.keys)
+
+    def __repr__(self):
+        return f'Distribution({dict(self)!r})'
+
+    def to_dict(self):
+        values = self.block.values[self.start:self.start + len(self.schema.keys)]
+        return {key: 0 if value != value or value == 0 else value for key, value in zip(self.schema.keys, values)}
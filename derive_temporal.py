@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Derive the temporal tables from geography.db and the per-year fact files
+geography.countries is the one source for everything about a country that is the same in
+every year (name, codes, continent, capital, religion and race/ethnicity shares, territories).
+What changes from year to year - populations - lives in data/years/<year>.csv (code_iso2,
+name, population); a year without a file takes countries.population. Each temporal table is
+written by a single INSERT ... SELECT, and check() compares a temporal database with what
+would be derived in a single EXCEPT query. Corrections go into these files (or
+data/country_facts.csv), followed by python build.py.
+
+Usage:
+    python derive_temporal.py check                    # geography_temporal.db against geography.db
+    python derive_temporal.py check --temporal t.db --geography g.db
+    python derive_temporal.py export 2020 2021         # write data/years/ from geography_temporal.db
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+from urllib.request import pathname2url
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+GEOGRAPHY = 'geography.db'
+TEMPORAL = 'geography_temporal.db'
+YEARS_DIR = os.path.join(HERE, 'data', 'years')
+
+# Years held by the temporal database
+YEARS = list(range(2020, 2026))
+
+# countries_temporal columns copied unchanged from geography.countries into every year
+COPIED_COLUMNS = [
+    'capital',
+    'religion_christian_percent', 'religion_muslim_percent', 'religion_hindu_percent',
+    'religion_buddhist_percent', 'religion_jewish_percent', 'religion_other_percent',
+    'religion_nonreligious_percent',
+    'race_white_percent', 'race_black_percent', 'race_asian_percent', 'race_hispanic_percent',
+    'race_native_american_percent', 'race_pacific_islander_percent', 'race_other_percent',
+    'territories'
+]
+
+# Columns compared by check(), in the order of the derived rows
+KEY_COLUMNS = ['year', 'country_id', 'continent_id', 'name', 'code_iso2', 'code_iso3', 'population']
+
+class DerivationError(Exception):
+    pass
+
+def missing_columns(db):
+    """COPIED_COLUMNS the attached geography.countries does not have"""
+    available = {row[0] for row in db.execute("SELECT name FROM pragma_table_info('countries', 'geography')")}
+    return [column for column in COPIED_COLUMNS if column not in available]
+
+def load_year_facts(db, years=YEARS, directory=YEARS_DIR):
+    """Load the population files of the given years into temp.year_facts; returns the years found"""
+    db.execute('''
+        CREATE TEMP TABLE IF NOT EXISTS year_facts (
+            year INTEGER NOT NULL,
+            code_iso2 TEXT NOT NULL,
+            population INTEGER NOT NULL,
+            PRIMARY KEY (year, code_iso2)
+        ) WITHOUT ROWID
+    ''')
+    db.execute('DELETE FROM temp.year_facts')
+    found = []
+    for year in years:
+        path = os.path.join(directory, f'{year}.csv')
+        if not os.path.exists(path):
+            continue
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = [(year, row['code_iso2'], int(row['population'])) for row in csv.DictReader(f) if row['population']]
+        db.executemany('INSERT INTO temp.year_facts (year, code_iso2, population) VALUES (?, ?, ?)', rows)
+        found.append(year)
+    return found
+
+def _derived_sql(years, columns):
+    """SELECT of the countries_temporal rows derived for years (KEY_COLUMNS + columns)"""
+    year_rows = ', '.join(f'({int(year)})' for year in years)
+    return f'''
+        WITH years(year) AS (VALUES {year_rows}),
+             files(year) AS (SELECT DISTINCT year FROM temp.year_facts)
+        SELECT years.year, c.id, c.continent_id, c.name, c.code_iso2, c.code_iso3,
+               CASE WHEN files.year IS NULL THEN c.population ELSE facts.population END,
+               {', '.join(f'c.{column}' for column in columns)}
+        FROM years
+        CROSS JOIN geography.countries c
+        LEFT JOIN files ON files.year = years.year
+        LEFT JOIN temp.year_facts facts ON facts.year = years.year AND facts.code_iso2 = c.code_iso2
+    '''
+
+def derive(db, years=YEARS, directory=YEARS_DIR):
+    """Fill the empty temporal tables from the geography database attached as 'geography'"""
+    missing = missing_columns(db)
+    if missing:
+        raise DerivationError(f"geography.countries has no {', '.join(missing)} - rebuild it "
+                              f"(python build.py --only geography) so data/country_facts.csv is loaded")
+    with_files = load_year_facts(db, years, directory)
+    year_rows = ', '.join(f'({int(year)})' for year in years)
+
+    db.execute(f'''
+        WITH years(year) AS (VALUES {year_rows})
+        INSERT INTO continents_temporal (year, continent_id, name, code)
+        SELECT years.year, cont.id, cont.name, cont.code
+        FROM years, geography.continents cont
+        ORDER BY years.year, cont.id
+    ''')
+    db.execute(f'''
+        INSERT INTO countries_temporal ({', '.join(KEY_COLUMNS + COPIED_COLUMNS)})
+        {_derived_sql(years, COPIED_COLUMNS)}
+        ORDER BY 1, 2
+    ''')
+    countries = db.execute('SELECT COUNT(*) FROM countries_temporal').fetchone()[0]
+    print(f"✅ Derived {countries} country rows for {len(years)} years "
+          f"(populations from files for {', '.join(map(str, with_files)) or 'no years'})")
+
+def check(db, years=YEARS, directory=YEARS_DIR):
+    """Rows where countries_temporal and the derivation disagree, as (side, row) pairs
+
+    side is 'expected' for a derived row the temporal table lacks and 'found' for a temporal
+    row nothing derives; a changed value shows up as one of each. Columns geography.countries
+    does not have are left out of the comparison.
+    """
+    missing = missing_columns(db)
+    columns = [column for column in COPIED_COLUMNS if column not in missing]
+    load_year_facts(db, years, directory)
+    found = f"SELECT {', '.join(KEY_COLUMNS + columns)} FROM main.countries_temporal"
+    rows = db.execute(f'''
+        WITH expected AS ({_derived_sql(years, columns)}),
+             found AS ({found})
+        SELECT 'expected', * FROM (SELECT * FROM expected EXCEPT SELECT * FROM found)
+        UNION ALL
+        SELECT 'found', * FROM (SELECT * FROM found EXCEPT SELECT * FROM expected)
+        ORDER BY 3, 2, 1
+    ''').fetchall()
+    names = KEY_COLUMNS + columns
+    return [(row[0], dict(zip(names, row[1:]))) for row in rows]
+
+def describe(differences):
+    """One line per (year, country) that differs, naming the columns and both values"""
+    pairs = {}
+    for side, row in differences:
+        pairs.setdefault((row['year'], row['country_id']), {})[side] = row
+    lines = []
+    for (year, _), sides in pairs.items():
+        expected, found = sides.get('expected'), sides.get('found')
+        name = (expected or found)['name']
+        if found is None:
+            lines.append(f"{year} {name}: missing from the temporal database")
+        elif expected is None:
+            lines.append(f"{year} {name}: not derived from geography.db")
+        else:
+            changes = [f"{column} {found[column]!r} (expected {expected[column]!r})"
+                       for column in expected if expected[column] != found[column]]
+            lines.append(f"{year} {name}: {', '.join(changes)}")
+    return lines
+
+def _connect_read_only(temporal, geography):
+    db = sqlite3.connect(f"file:{pathname2url(os.path.abspath(temporal))}?mode=ro", uri=True)
+    db.execute('ATTACH DATABASE ? AS geography', (f"file:{pathname2url(os.path.abspath(geography))}?mode=ro",))
+    return db
+
+def export(temporal=TEMPORAL, years=None, directory=YEARS_DIR):
+    """Write data/years/<year>.csv from a temporal database's populations; returns the files"""
+    db = sqlite3.connect(f"file:{pathname2url(os.path.abspath(temporal))}?mode=ro", uri=True)
+    try:
+        if not years:
+            # The latest year's populations belong in geography.db (data/country_facts.csv)
+            years = [row[0] for row in db.execute('SELECT DISTINCT year FROM countries_temporal ORDER BY year')][:-1]
+        os.makedirs(directory, exist_ok=True)
+        written = []
+        for year in years:
+            rows = db.execute('''
+                SELECT code_iso2, name, population FROM countries_temporal
+                WHERE year = ? AND population IS NOT NULL ORDER BY code_iso2
+            ''', (year,)).fetchall()
+            path = os.path.join(directory, f'{year}.csv')
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(['code_iso2', 'name', 'population'])
+                writer.writerows(rows)
+            written.append((path, len(rows)))
+        return written
+    finally:
+        db.close()
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Derive or check the temporal database against geography.db')
+    parser.add_argument('command', choices=['check', 'export'])
+    parser.add_argument('years', nargs='*', type=int, help='years to export (default: all but the latest)')
+    parser.add_argument('--temporal', default=TEMPORAL)
+    parser.add_argument('--geography', default=GEOGRAPHY)
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        for path, count in export(args.temporal, args.years):
+            print(f"✅ Wrote {count} populations to {os.path.relpath(path)}")
+        return 0
+
+    db = _connect_read_only(args.temporal, args.geography)
+    try:
+        skipped = missing_columns(db)
+        differences = check(db)
+    finally:
+        db.close()
+    if skipped:
+        print(f"⚠️  {args.geography} has no {', '.join(skipped)} - not compared")
+    if not differences:
+        print(f"✅ {args.temporal} matches {args.geography} and {os.path.relpath(YEARS_DIR)}")
+        return 0
+    lines = describe(differences)
+    print(f"❌ {len(lines)} temporal rows differ from what {args.geography} derives:")
+    for line in lines:
+        print(f"   {line}")
+    return 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Columnar export of the temporal dataset for analytics
+Streams countries_temporal (optionally filtered by year, continent or country) as CSV, an
+Arrow IPC file (memory-mappable, e.g. pyarrow.memory_map + pyarrow.ipc.open_file) or Parquet.
+Rows are read with fetchmany and written one record batch at a time, so the table is never
+held in Python lists as a whole. Arrow and Parquet need pyarrow (requirements-analytics.txt).
+
+Usage:
+    python export.py parquet countries.parquet [--year 2020] [--continent-id 3] [--country Germany]
+    python export.py arrow countries.arrow
+    python export.py csv countries.csv
+"""
+
+import argparse
+import csv
+import io
+import sqlite3
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+DATABASE = 'geography_temporal.db'
+BATCH_SIZE = 5000
+
+FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'arrow': ('application/vnd.apache.arrow.file', 'arrow'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class ExportError(Exception):
+    pass
+
+def export_columns(db):
+    """[(name, declared type)] of countries_temporal plus the joined continent name"""
+    columns = [(row[1], (row[2] or '').upper()) for row in db.execute('PRAGMA table_info(countries_temporal)')]
+    return columns + [('continent_name', 'TEXT')]
+
+def export_query(db, year=None, continent_id=None, country=None):
+    """SQL and parameters for the full table or a filtered slice"""
+    columns = ', '.join(f'c.{name}' for name, _ in export_columns(db)[:-1])
+    conditions, params = [], []
+    if year is not None:
+        conditions.append('c.year = ?')
+        params.append(year)
+    if continent_id is not None:
+        conditions.append('c.continent_id = ?')
+        params.append(continent_id)
+    if country is not None:
+        conditions.append('c.name = ?')
+        params.append(country)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    sql = f'''
+        SELECT {columns}, cont.name as continent_name
+        FROM countries_temporal c
+        LEFT JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+        {where}
+        ORDER BY c.year, c.name
+    '''
+    return sql, params
+
+def _arrow_type(declared):
+    if 'INT' in declared:
+        return pa.int64()
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return pa.float64()
+    if 'TIMESTAMP' in declared or 'DATETIME' in declared:
+        return pa.timestamp('s')
+    return pa.string()
+
+def arrow_schema(columns):
+    return pa.schema([(name, _arrow_type(declared)) for name, declared in columns])
+
+def _record_batch(schema, rows):
+    values = list(zip(*rows))
+    arrays = []
+    for field, column in zip(schema, values):
+        if pa.types.is_timestamp(field.type):
+            arrays.append(pc.strptime(pa.array(column, type=pa.string()), format=TIMESTAMP_FORMAT,
+                                      unit='s', error_is_null=True))
+        else:
+            arrays.append(pa.array(column, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to a streaming generator"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def iter_export(db, fmt, year=None, continent_id=None, country=None, batch_size=BATCH_SIZE):
+    """Yield the export file in chunks, one record batch at a time"""
+    if fmt not in FORMATS:
+        raise ExportError(f"Unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})")
+    if fmt != 'csv' and pa is None:
+        raise ExportError(f"The {fmt} format requires pyarrow (pip install -r requirements-analytics.txt)")
+
+    columns = export_columns(db)
+    sql, params = export_query(db, year, continent_id, country)
+    cursor = db.execute(sql, params)
+
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([name for name, _ in columns])
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            writer.writerows(rows)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+        return
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pa.ipc.new_file(sink, schema) if fmt == 'arrow' else pq.ParquetWriter(sink, schema)
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            batch = _record_batch(schema, rows)
+            if fmt == 'arrow':
+                writer.write_batch(batch)
+            else:
+                writer.write_batch(batch, row_group_size=batch_size)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+def export_filename(fmt, year=None, continent_id=None, country=None):
+    parts = ['countries_temporal']
+    if year is not None:
+        parts.append(str(year))
+    if continent_id is not None:
+        parts.append(f'continent{continent_id}')
+    if country is not None:
+        parts.append(''.join(ch if ch.isalnum() else '_' for ch in country))
+    return f"{'_'.join(parts)}.{FORMATS[fmt][1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the temporal countries table')
+    parser.add_argument('format', choices=sorted(FORMATS))
+    parser.add_argument('output')
+    parser.add_argument('--year', type=int)
+    parser.add_argument('--continent-id', type=int)
+    parser.add_argument('--country')
+    parser.add_argument('--db', default=DATABASE)
+    args = parser.parse_args()
+
+    db = sqlite3.connect(args.db)
+    written = 0
+    try:
+        with open(args.output, 'wb') as f:
+            for chunk in iter_export(db, args.format, args.year, args.continent_id, args.country):
+                f.write(chunk)
+                written += len(chunk)
+    except ExportError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        db.close()
+
+    print(f"✅ Exported countries_temporal to {args.output} ({written:,} bytes, {args.format})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,261 +0,0 @@
-#!/usr/bin/env python3
-
-import sqlite3
-
-def add_race_ethnicity_data():
-    """Add race/ethnicity data for additional countries"""
-    
-    # Comprehensive race/ethnicity data for major countries
-    # Data sourced from official census data, CIA World Factbook, and national statistics
-    countries_data = {
-        # European Countries
-        'Italy': {
-            'white': 91.5, 'black': 1.0, 'asian': 3.0, 'hispanic': 0.5, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 4.0
-        },
-        'Spain': {
-            'white': 88.0, 'black': 2.0, 'asian': 1.5, 'hispanic': 0.5, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 8.0
-        },
-        'Poland': {
-            'white': 96.9, 'black': 0.1, 'asian': 0.5, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 2.4
-        },
-        'Ukraine': {
-            'white': 77.8, 'black': 0.1, 'asian': 0.8, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 21.2
-        },
-        'Belgium': {
-            'white': 75.2, 'black': 6.0, 'asian': 3.5, 'hispanic': 1.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 14.3
-        },
-        'Austria': {
-            'white': 81.1, 'black': 2.8, 'asian': 6.3, 'hispanic': 0.8, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 9.0
-        },
-        'Switzerland': {
-            'white': 69.2, 'black': 1.0, 'asian': 6.8, 'hispanic': 4.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 19.0
-        },
-        'Sweden': {
-            'white': 80.3, 'black': 1.9, 'asian': 5.1, 'hispanic': 2.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 10.7
-        },
-        'Norway': {
-            'white': 83.2, 'black': 1.8, 'asian': 4.3, 'hispanic': 1.2, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 9.5
-        },
-        'Denmark': {
-            'white': 86.3, 'black': 1.1, 'asian': 4.4, 'hispanic': 0.7, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 7.5
-        },
-        
-        # Asian Countries
-        'Indonesia': {
-            'white': 0.1, 'black': 0.2, 'asian': 95.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.2, 'other': 4.5
-        },
-        'Pakistan': {
-            'white': 0.1, 'black': 0.5, 'asian': 96.4, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 3.0
-        },
-        'Bangladesh': {
-            'white': 0.1, 'black': 0.2, 'asian': 98.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 1.7
-        },
-        'Philippines': {
-            'white': 0.1, 'black': 0.1, 'asian': 95.5, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 3.0, 'other': 1.3
-        },
-        'Vietnam': {
-            'white': 0.1, 'black': 0.1, 'asian': 85.3, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 14.5
-        },
-        'Thailand': {
-            'white': 0.1, 'black': 0.1, 'asian': 95.9, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 3.9
-        },
-        'Myanmar': {
-            'white': 0.1, 'black': 0.1, 'asian': 68.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 31.8
-        },
-        'South Korea': {
-            'white': 0.2, 'black': 0.1, 'asian': 96.0, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 3.6
-        },
-        'Taiwan': {
-            'white': 0.2, 'black': 0.1, 'asian': 95.0, 'hispanic': 0.1, 
-            'native_american': 2.3, 'pacific_islander': 0.0, 'other': 2.3
-        },
-        
-        # Middle Eastern Countries
-        'Iran': {
-            'white': 61.0, 'black': 2.0, 'asian': 2.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 35.0
-        },
-        'Iraq': {
-            'white': 75.0, 'black': 15.0, 'asian': 1.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 9.0
-        },
-        'Saudi Arabia': {
-            'white': 90.0, 'black': 10.0, 'asian': 0.0, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.0
-        },
-        'UAE': {
-            'white': 11.6, 'black': 1.0, 'asian': 59.4, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 28.0
-        },
-        'Jordan': {
-            'white': 98.0, 'black': 1.0, 'asian': 0.5, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.5
-        },
-        
-        # African Countries
-        'Egypt': {
-            'white': 0.1, 'black': 6.0, 'asian': 0.1, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 93.8
-        },
-        'Algeria': {
-            'white': 1.0, 'black': 0.5, 'asian': 0.1, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 98.4
-        },
-        'Morocco': {
-            'white': 1.0, 'black': 3.0, 'asian': 0.1, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 95.9
-        },
-        'Ghana': {
-            'white': 0.1, 'black': 98.5, 'asian': 0.5, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.9
-        },
-        'Tanzania': {
-            'white': 0.1, 'black': 99.0, 'asian': 0.6, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.3
-        },
-        'Uganda': {
-            'white': 0.1, 'black': 99.0, 'asian': 0.5, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.4
-        },
-        'Zimbabwe': {
-            'white': 0.2, 'black': 99.4, 'asian': 0.2, 'hispanic': 0.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 0.2
-        },
-        
-        # Latin American Countries
-        'Venezuela': {
-            'white': 43.6, 'black': 3.6, 'asian': 0.7, 'hispanic': 51.6, 
-            'native_american': 2.8, 'pacific_islander': 0.0, 'other': 0.0
-        },
-        'Ecuador': {
-            'white': 6.1, 'black': 7.2, 'asian': 0.3, 'hispanic': 71.9, 
-            'native_american': 7.0, 'pacific_islander': 0.0, 'other': 7.5
-        },
-        'Bolivia': {
-            'white': 5.0, 'black': 0.2, 'asian': 0.3, 'hispanic': 68.0, 
-            'native_american': 20.0, 'pacific_islander': 0.0, 'other': 6.5
-        },
-        'Uruguay': {
-            'white': 87.7, 'black': 4.6, 'asian': 0.2, 'hispanic': 0.0, 
-            'native_american': 2.4, 'pacific_islander': 0.0, 'other': 5.1
-        },
-        'Paraguay': {
-            'white': 20.0, 'black': 0.5, 'asian': 2.0, 'hispanic': 75.0, 
-            'native_american': 1.5, 'pacific_islander': 0.0, 'other': 1.0
-        },
-        
-        # Eastern European Countries
-        'Russia': {
-            'white': 81.0, 'black': 0.1, 'asian': 3.9, 'hispanic': 0.1, 
-            'native_american': 0.2, 'pacific_islander': 0.0, 'other': 14.7
-        },
-        'Romania': {
-            'white': 83.4, 'black': 0.1, 'asian': 0.2, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 16.2
-        },
-        'Czech Republic': {
-            'white': 90.4, 'black': 0.4, 'asian': 1.0, 'hispanic': 0.2, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 8.0
-        },
-        'Hungary': {
-            'white': 85.6, 'black': 0.3, 'asian': 0.7, 'hispanic': 0.2, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 13.2
-        },
-        'Bulgaria': {
-            'white': 76.9, 'black': 0.2, 'asian': 0.4, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 22.4
-        },
-        
-        # Other Notable Countries
-        'Finland': {
-            'white': 93.4, 'black': 0.6, 'asian': 2.2, 'hispanic': 0.3, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 3.5
-        },
-        'Portugal': {
-            'white': 95.0, 'black': 1.4, 'asian': 1.0, 'hispanic': 0.5, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 2.1
-        },
-        'Greece': {
-            'white': 91.6, 'black': 0.7, 'asian': 3.0, 'hispanic': 0.4, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 4.3
-        },
-        'Ireland': {
-            'white': 82.2, 'black': 1.3, 'asian': 2.1, 'hispanic': 1.0, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 13.4
-        },
-        'Croatia': {
-            'white': 90.4, 'black': 0.2, 'asian': 0.6, 'hispanic': 0.1, 
-            'native_american': 0.0, 'pacific_islander': 0.0, 'other': 8.7
-        }
-    }
-    
-    conn = sqlite3.connect('geography_temporal.db')
-    cursor = conn.cursor()
-    
-    years = [2020, 2021, 2022, 2023, 2024, 2025]
-    countries_updated = 0
-    records_updated = 0
-    
-    print("🌍 Adding race/ethnicity data for additional countries...")
-    print("=" * 60)
-    
-    for country_name, data in countries_data.items():
-        # Check if country exists in database
-        cursor.execute('SELECT COUNT(*) FROM countries_temporal WHERE name = ?', (country_name,))
-        if cursor.fetchone()[0] == 0:
-            print(f"⚠️  Country '{country_name}' not found in database - skipping")
-            continue
-            
-        # Check if country already has race/ethnicity data
-        cursor.execute('SELECT COUNT(*) FROM countries_temporal WHERE name = ? AND race_white_percent IS NOT NULL', (country_name,))
-        if cursor.fetchone()[0] > 0:
-            print(f"ℹ️  Country '{country_name}' already has race/ethnicity data - skipping")
-            continue
-        
-        # Update all years for this country
-        for year in years:
-            cursor.execute('''
-                UPDATE countries_temporal 
-                SET race_white_percent = ?, race_black_percent = ?, race_asian_percent = ?,
-                    race_hispanic_percent = ?, race_native_american_percent = ?, 
-                    race_pacific_islander_percent = ?, race_other_percent = ?
-                WHERE name = ? AND year = ?
-            ''', (
-                data['white'], data['black'], data['asian'], data['hispanic'],
-                data['native_american'], data['pacific_islander'], data['other'],
-                country_name, year
-            ))
-            records_updated += cursor.rowcount
-        
-        countries_updated += 1
-        print(f"✅ {country_name}: White {data['white']}%, Black {data['black']}%, Asian {data['asian']}%, Hispanic {data['hispanic']}%")
-    
-    conn.commit()
-    conn.close()
-    
-    print("=" * 60)
-    print(f"🎉 RACE/ETHNICITY DATA UPDATE COMPLETE!")
-    print(f"📊 Countries updated: {countries_updated}")
-    print(f"📈 Total records updated: {records_updated}")
-    print(f"🕐 Data applied to years: {', '.join(map(str, years))}")
-
-if __name__ == "__main__":
-    add_race_ethnicity_data() 
\ No newline at end of file
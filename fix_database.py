@@ -4,7 +4,10 @@ Fix the geography database by removing fake countries and getting better data
 """
 
 import sqlite3
-import requests
+
+import source_cache
+
+RESTCOUNTRIES_URL = 'https://restcountries.com/v3.1/all?fields=name,cca2,cca3,capital,currencies,region,subregion'
 
 def get_db():
     """Get database connection"""
@@ -12,9 +15,11 @@ def get_db():
     db.row_factory = sqlite3.Row
     return db
 
-def remove_fake_antarctica_countries():
+def remove_fake_antarctica_countries(db=None):
     """Remove territories that aren't real countries from Antarctica"""
-    db = get_db()
+    own_connection = db is None
+    if own_connection:
+        db = get_db()
     
     # These are territories/research stations, not countries
     fake_countries = [
@@ -31,8 +36,9 @@ def remove_fake_antarctica_countries():
         if cursor.rowcount > 0:
             print(f"  ✓ Removed: {country}")
     
-    db.commit()
-    db.close()
+    if own_connection:
+        db.commit()
+        db.close()
 
 def get_better_country_data():
     """Get comprehensive country data from a better source"""
@@ -40,9 +46,7 @@ def get_better_country_data():
     
     try:
         # REST Countries API has all UN recognized countries
-        response = requests.get('https://restcountries.com/v3.1/all?fields=name,cca2,cca3,capital,currencies,region,subregion', timeout=15)
-        response.raise_for_status()
-        countries = response.json()
+        countries = source_cache.from_env(timeout=15).get_json(RESTCOUNTRIES_URL)
         
         print(f"  ✓ Found {len(countries)} countries from REST Countries API")
         return countries
@@ -71,17 +75,19 @@ def map_region_to_continent(region, subregion):
     
     return region_mapping.get(region, 'AS')  # Default to Asia
 
-def add_missing_countries(countries_data):
-    """Add missing countries from the better data source"""
-    db = get_db()
+def add_missing_countries(countries_data, db=None):
+    """Add missing countries from the better data source (in the caller's transaction when given a connection)"""
+    own_connection = db is None
+    if own_connection:
+        db = get_db()
     
     # Get continent mapping
     cursor = db.execute('SELECT id, code FROM continents')
-    continent_mapping = {row['code']: row['id'] for row in cursor.fetchall()}
+    continent_mapping = {row[1]: row[0] for row in cursor.fetchall()}
     
     # Get existing countries
     cursor = db.execute('SELECT code_iso2 FROM countries')
-    existing_countries = {row['code_iso2'] for row in cursor.fetchall()}
+    existing_countries = {row[0] for row in cursor.fetchall()}
     
     print(f"\n🌍 Adding missing countries...")
     added_count = 0
@@ -139,8 +145,9 @@ def add_missing_countries(countries_data):
         except sqlite3.IntegrityError as e:
             print(f"  ⚠️ Skipped {country_name}: {e}")
     
-    db.commit()
-    db.close()
+    if own_connection:
+        db.commit()
+        db.close()
     
     return added_count
 
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unified Geography API Gateway
+Serves the geography, temporal and cross-database APIs from one Flask app:
+    /v1/geography/...    app.py (web interface at /v1/geography/)
+    /v1/temporal/...     temporal_app.py (web interface at /v1/temporal/)
+    /v1/query/...        query_app.py
+One process holds one set of connection pools (db_pool), in-process caches (bootstrap
+snapshot, analytics, deltas, interpolation) and serializers (response_formats) for all three,
+instead of three servers each loading their own. Deploy it with any WSGI server, e.g.
+    gunicorn -w 4 -b 0.0.0.0:8000 gateway:app
+Each worker process watches the database files and hot-swaps to a new build on its own, and
+brings the temporal database up to the latest schema the first time it serves it
+(api_common.ensure_migrated), so no separate migration step is needed.
+
+Usage:
+    python gateway.py            # development server on port 8000
+"""
+
+import os
+from flask import jsonify, make_response
+import api_common
+import app as geography_app
+import query_app
+import temporal_app
+
+API_VERSION = 'v1'
+
+# (name, module) of each mounted API; its blueprint is served under /<API_VERSION>/<name>
+APIS = [
+    ('geography', geography_app),
+    ('temporal', temporal_app),
+    ('query', query_app),
+]
+
+def create_app():
+    """Gateway app with every API blueprint mounted under its versioned prefix"""
+    gateway = api_common.create_app(__name__, [(module.api, f'/{API_VERSION}/{name}') for name, module in APIS])
+    gateway.add_url_rule('/', 'index', index)
+    gateway.add_url_rule('/health', 'health', health)
+    return gateway
+
+def index():
+    """Mounted APIs and their prefixes"""
+    return jsonify({
+        'version': API_VERSION,
+        'apis': {name: f'/{API_VERSION}/{name}' for name, _ in APIS}
+    })
+
+def health():
+    """Health of every mounted API (503 if any is unhealthy)"""
+    apis = {}
+    for name, module in APIS:
+        response = make_response(module.health())
+        apis[name] = response.get_json(silent=True) or {'status': 'unhealthy'}
+        apis[name]['status_code'] = response.status_code
+    healthy = all(check['status_code'] == 200 for check in apis.values())
+    return jsonify({'status': 'healthy' if healthy else 'unhealthy', 'apis': apis}), 200 if healthy else 503
+
+app = create_app()
+
+if __name__ == '__main__':
+    print("🌐 Starting Geography API Gateway...")
+
+    for path in (app.config['GEOGRAPHY_DATABASE'], app.config['TEMPORAL_DATABASE']):
+        if not os.path.exists(path):
+            print(f"❌ {path} not found! Please run build.py first.")
+            exit(1)
+
+    api_common.ensure_migrated(app.config['TEMPORAL_DATABASE'])
+
+    print("\n" + "="*60)
+    print("🚀 Geography API Gateway Ready!")
+    for name, _ in APIS:
+        print(f"   {name:10} http://localhost:8000/{API_VERSION}/{name}/")
+    print("="*60 + "\n")
+
+    app.run(debug=True, host='0.0.0.0', port=8000)
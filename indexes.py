@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Managed index set for the temporal database
+Declares the indexes that cover the real access patterns of countries_temporal (timeline and
+enrichment lookups by name, per-year listings by continent, population rankings, joins with
+geography.db by ISO2 code), and a check that fails when one of them is missing or a registered
+hot query falls back to a full scan. Migrations carry their own fixed copy of the indexes they
+create (0004_managed_indexes.py, 0006_code_iso2_index.py): a new entry here needs a new
+migration, and check --fix only repairs a database by hand.
+
+Usage:
+    python migrate.py upgrade [geography_temporal.db]
+    python indexes.py check [geography_temporal.db] [--fix]
+"""
+
+import sqlite3
+import sys
+
+import query_tracer
+
+DATABASE = 'geography_temporal.db'
+
+# (index name, table, columns)
+INDEX_SPECS = [
+    # Country timeline (WHERE name = ? ORDER BY year) and the enrichment/population updates
+    ('idx_countries_name_year', 'countries_temporal', ('name', 'year')),
+    # Per-year listings, by-continent listings ordered by name, continent stats joins
+    ('idx_countries_year_continent_name', 'countries_temporal', ('year', 'continent_id', 'name')),
+    # Per-year name search ordered by name (without it the planner skip-scans name_year)
+    ('idx_countries_year_name', 'countries_temporal', ('year', 'name')),
+    # Per-year counts and population rankings
+    ('idx_countries_year_population', 'countries_temporal', ('year', 'population')),
+    # Joins with geography.db on the shared ISO2 code (query_app.py)
+    ('idx_countries_code_iso2_year', 'countries_temporal', ('code_iso2', 'year')),
+]
+
+# Indexes made redundant by INDEX_SPECS (their columns are a prefix of a managed index)
+SUPERSEDED_INDEXES = ['idx_countries_year']
+
+# (description, SQL, sample parameters) for queries that must be served by an index
+HOT_QUERIES = [
+    ('country timeline', '''
+        SELECT year, population, capital, territories FROM countries_temporal
+        WHERE name = ? ORDER BY year
+    ''', ('Germany',)),
+    ('enrichment update by name', 'UPDATE countries_temporal SET capital = ? WHERE name = ?', ('Berlin', 'Germany')),
+    ('population update by year and name', '''
+        UPDATE countries_temporal SET population = ? WHERE name = ? AND year = ?
+    ''', (1, 'Germany', 2024)),
+    ('countries for a year', '''
+        SELECT c.*, cont.name as continent_name
+        FROM countries_temporal c
+        JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+        WHERE c.year = ?
+        ORDER BY cont.name, c.name
+    ''', (2025,)),
+    ('countries by continent', '''
+        SELECT c.*, cont.name as continent_name
+        FROM countries_temporal c
+        JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+        WHERE c.continent_id = ? AND c.year = ?
+        ORDER BY c.name
+    ''', (3, 2025)),
+    ('country search in a year', '''
+        SELECT c.*, cont.name as continent_name
+        FROM countries_temporal c
+        JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+        WHERE c.name LIKE ? AND c.year = ?
+        ORDER BY c.name
+    ''', ('%an%', 2025)),
+    ('country by ISO2 code in a year', '''
+        SELECT population, capital FROM countries_temporal WHERE code_iso2 = ? AND year = ?
+    ''', ('DE', 2025)),
+    ('country count for a year', 'SELECT COUNT(*) FROM countries_temporal WHERE year = ?', (2025,)),
+    ('continent stats', '''
+        SELECT cont.name, COUNT(c.country_id) as country_count
+        FROM continents_temporal cont
+        LEFT JOIN countries_temporal c ON cont.continent_id = c.continent_id AND cont.year = c.year
+        WHERE cont.year = ?
+        GROUP BY cont.continent_id, cont.name
+    ''', (2025,)),
+    ('top populations', '''
+        SELECT name, population FROM countries_temporal
+        WHERE year = ? AND population IS NOT NULL AND population > 0
+        ORDER BY population DESC LIMIT 10
+    ''', (2025,)),
+]
+
+def ensure_indexes(db):
+    """Create missing managed indexes and drop superseded ones; returns (created, dropped) name lists"""
+    existing = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    created = []
+    for name, table, columns in INDEX_SPECS:
+        if name not in existing:
+            db.execute(f"CREATE INDEX {name} ON {table}({', '.join(columns)})")
+            created.append(name)
+    dropped = [name for name in SUPERSEDED_INDEXES if name in existing]
+    for name in dropped:
+        db.execute(f"DROP INDEX {name}")
+    return created, dropped
+
+def full_scans(db, sql, parameters):
+    """Plan steps of a statement that scan a whole table or index"""
+    rows = db.execute('EXPLAIN QUERY PLAN ' + sql, parameters).fetchall()
+    return [row[3] for row in rows if query_tracer.is_full_scan(row[3])]
+
+def missing_indexes(db):
+    """Names of managed indexes the database does not have"""
+    existing = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return [name for name, _, _ in INDEX_SPECS if name not in existing]
+
+def check_hot_queries(db):
+    """[(description, scans)] for every registered hot query that falls back to a full scan"""
+    failures = []
+    for description, sql, parameters in HOT_QUERIES:
+        scans = full_scans(db, sql, parameters)
+        if scans:
+            failures.append((description, scans))
+    return failures
+
+def main(argv):
+    fix = '--fix' in argv
+    argv = [arg for arg in argv if arg != '--fix']
+    if not argv or argv[0] != 'check':
+        print(__doc__)
+        return 1
+    path = argv[1] if len(argv) > 1 else DATABASE
+
+    db = sqlite3.connect(path)
+    try:
+        print(f"🔎 Hot query plan check for {path}")
+        if fix:
+            with db:
+                created, dropped = ensure_indexes(db)
+                if created or dropped:
+                    db.execute('ANALYZE')
+            for name in created:
+                print(f"   🏗️  created {name}")
+            for name in dropped:
+                print(f"   🗑️  dropped {name}")
+        missing = missing_indexes(db)
+        failures = check_hot_queries(db)
+    finally:
+        db.close()
+    for name in missing:
+        print(f"   ❌ missing managed index {name}")
+    if failures:
+        for description, scans in failures:
+            print(f"   ❌ {description}: {'; '.join(scans)}")
+        print(f"\n{len(failures)} of {len(HOT_QUERIES)} hot queries fall back to a full scan - run: python migrate.py upgrade {path}")
+        return 1
+    if missing:
+        print(f"\n{len(missing)} managed indexes missing - add a migration for them, or run: python indexes.py check {path} --fix")
+        return 1
+    print(f"   ✅ all {len(HOT_QUERIES)} hot queries use an index")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Population estimates for arbitrary years and dates
+countries_temporal holds one population per country and calendar year. A stored value for
+year Y is treated as the population at time Y.0; a fractional year (2019.5) or a date
+(2021-07-01 -> 2021.496) is answered from the stored points around it:
+
+    linear       straight line between the two surrounding points
+    exponential  constant growth rate between them: p0 * (p1 / p0) ** fraction
+
+Outside the stored range the nearest interval's trend is extended (same absolute change per
+year for linear, same growth rate for exponential) for at most MAX_EXTRAPOLATION_YEARS;
+further out there is no estimate. A country with a single stored point is held constant.
+
+Series are laid out on the dataset's year grid with the surrounding known points precomputed
+per slot, so a lookup is constant time. They are built from the population series deltas.py
+already caches per dataset version.
+"""
+
+import math
+from datetime import date
+
+import deltas
+
+METHODS = ('linear', 'exponential')
+
+MAX_EXTRAPOLATION_YEARS = 5
+
+class InterpolationError(Exception):
+    pass
+
+def fractional_year(value):
+    """'2019.5' -> 2019.5 and '2021-07-01' (ISO date) -> 2021.496 (start of year + day fraction)"""
+    try:
+        year = float(value)
+    except (TypeError, ValueError):
+        pass
+    else:
+        if not math.isfinite(year):
+            raise InterpolationError(f"Expected a finite year, got {value!r}")
+        return year
+    try:
+        day = date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise InterpolationError(f"Expected a year (e.g. 2019.5) or an ISO date (e.g. 2021-07-01), got {value!r}")
+    days_in_year = (date(day.year + 1, 1, 1) - date(day.year, 1, 1)).days
+    return day.year + (day.timetuple().tm_yday - 1) / days_in_year
+
+class _CountrySeries:
+    """One country's values on the year grid, with the nearest known slot on either side"""
+
+    __slots__ = ('values', 'previous', 'following', 'first', 'last')
+
+    def __init__(self, values):
+        self.values = values
+        known = [i for i, value in enumerate(values) if value is not None]
+        self.first, self.last = known[0], known[-1]
+        self.previous, self.following = [], [None] * len(values)
+        latest = None
+        for i, value in enumerate(values):
+            if value is not None:
+                latest = i
+            self.previous.append(latest)
+        upcoming = None
+        for i in range(len(values) - 1, -1, -1):
+            if values[i] is not None:
+                upcoming = i
+            self.following[i] = upcoming
+
+class PopulationSeries:
+    """Per-country population series of one dataset version, on a common annual grid"""
+
+    def __init__(self, metric_series):
+        years = metric_series.years
+        if not years:
+            raise InterpolationError("No population data to interpolate from")
+        self.start = years[0]
+        self.years = years
+        size = years[-1] - years[0] + 1
+        grid = {}
+        for year, values in metric_series.values.items():
+            for country_id, value in values.items():
+                grid.setdefault(country_id, [None] * size)[year - self.start] = value
+        self.countries = {country_id: _CountrySeries(values) for country_id, values in grid.items()}
+
+    def nearest_year(self, t):
+        """Stored year whose rows describe the countries at time t"""
+        return min(self.years, key=lambda year: (abs(year - t), year))
+
+    def estimate(self, country_id, t, method='linear'):
+        """(population, 'stored' | 'interpolated' | 'extrapolated') at time t, or (None, None)"""
+        if method not in METHODS:
+            raise InterpolationError(f"Unknown method '{method}' (expected one of: {', '.join(METHODS)})")
+        if not math.isfinite(t):
+            raise InterpolationError(f"Expected a finite year, got {t!r}")
+        series = self.countries.get(country_id)
+        if series is None:
+            return None, None
+        position = t - self.start
+
+        if position < series.first or position > series.last:
+            # Extend the first or last stored interval
+            if position < series.first:
+                low = series.first
+                high = series.following[low + 1] if low + 1 < len(series.values) else None
+                distance = series.first - position
+            else:
+                high = series.last
+                low = series.previous[high - 1] if high > 0 else None
+                distance = position - series.last
+            if distance > MAX_EXTRAPOLATION_YEARS:
+                return None, None
+            if low is None or high is None:
+                return series.values[series.first], 'extrapolated'
+            return self._between(series, low, high, position, method), 'extrapolated'
+
+        index = math.floor(position)
+        if index == position and series.values[index] is not None:
+            return series.values[index], 'stored'
+        low = series.previous[index]
+        high = series.following[min(index + 1, len(series.values) - 1)]
+        return self._between(series, low, high, position, method), 'interpolated'
+
+    @staticmethod
+    def _between(series, low, high, position, method):
+        p0, p1 = series.values[low], series.values[high]
+        fraction = (position - low) / (high - low)
+        if method == 'exponential':
+            value = p0 * (p1 / p0) ** fraction
+        else:
+            value = p0 + (p1 - p0) * fraction
+        return max(round(value), 0)
+
+# path -> [(MetricSeries, PopulationSeries)] for the current and previous dataset version
+_cache = {}
+
+def load(path, file=None):
+    """PopulationSeries for a database, rebuilt when its dataset version changes"""
+    metric_series = deltas.load(path, 'population', file)
+    entries = _cache.get(path, [])
+    for cached, series in entries:
+        if cached is metric_series:
+            return series
+    series = PopulationSeries(metric_series)
+    _cache[path] = entries[-1:] + [(metric_series, series)]
+    return series
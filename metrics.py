@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Request-level performance metrics for the Flask apps
+Records per-route latency, database vs serialization time, rows returned, response size
+and cache hit ratios, and serves them in Prometheus text format on /metrics.
+
+Usage:
+    import metrics
+    metrics.init_app(app)
+"""
+
+import threading
+import time
+
+from flask import Response, current_app, g, has_app_context, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+import db_pool
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+ROW_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+class MetricsRegistry:
+    """Thread-safe store of histograms and counters keyed by metric name and labels"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._help = {}
+
+    def observe(self, name, labels, value, buckets=LATENCY_BUCKETS, help_text=''):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+                self._help.setdefault(name, help_text)
+            histogram.observe(value)
+
+    def inc(self, name, labels, amount=1, help_text=''):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            self._help.setdefault(name, help_text)
+
+    def counter_value(self, name, **labels):
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def render(self):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            help_texts = dict(self._help)
+
+        seen = set()
+        for (name, labels), histogram in histograms:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {help_texts.get(name, '')}")
+                lines.append(f"# TYPE {name} histogram")
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                lines.append(f"{name}_bucket{_format_labels(labels, le=_format_number(bound))} {count}")
+            lines.append(f"{name}_bucket{_format_labels(labels, le='+Inf')} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_number(histogram.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {help_texts.get(name, '')}")
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(labels)} {_format_number(value)}")
+
+        lines.extend(_cache_ratio_lines(counters))
+        lines.extend(_pool_lines())
+        return '\n'.join(lines) + '\n'
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+def _cache_ratio_lines(counters):
+    totals = {}
+    for (name, labels), value in counters:
+        if name != 'geo_cache_requests_total':
+            continue
+        label_map = dict(labels)
+        key = (label_map.get('app', ''), label_map.get('cache', ''))
+        hits, total = totals.get(key, (0, 0))
+        if label_map.get('result') == 'hit':
+            hits += value
+        totals[key] = (hits, total + value)
+
+    if not totals:
+        return []
+    lines = ['# HELP geo_cache_hit_ratio Fraction of cache lookups served from cache',
+             '# TYPE geo_cache_hit_ratio gauge']
+    for (app_name, cache), (hits, total) in sorted(totals.items()):
+        lines.append(f"geo_cache_hit_ratio{_format_labels([('app', app_name), ('cache', cache)])} {hits / total!r}")
+    return lines
+
+def _pool_lines():
+    lines = ['# HELP geo_db_pool_connections Pooled SQLite connections by state',
+             '# TYPE geo_db_pool_connections gauge']
+    for pool in db_pool.all_pools():
+        stats = pool.stats()
+        # A path can have several pools (plain and with databases attached); the schemas tell them apart
+        attached = ','.join(sorted(pool.attach))
+        for state in ('idle', 'in_use'):
+            labels = [('database', stats['path']), ('attached', attached), ('state', state)]
+            lines.append(f"geo_db_pool_connections{_format_labels(labels)} {stats[state]}")
+    return lines
+
+REGISTRY = MetricsRegistry()
+
+# HOOKS
+
+def _observe_query(seconds, rows):
+    if has_request_context():
+        g._metrics_db_seconds = g.get('_metrics_db_seconds', 0.0) + seconds
+        g._metrics_rows = g.get('_metrics_rows', 0) + rows
+
+def observe_serialization(seconds):
+    if has_request_context():
+        g._metrics_serialize_seconds = g.get('_metrics_serialize_seconds', 0.0) + seconds
+
+def _app_label():
+    return current_app.import_name if has_app_context() else 'none'
+
+def record_cache(cache, hit):
+    """Count a lookup in a named in-process cache (feeds geo_cache_hit_ratio)"""
+    REGISTRY.inc('geo_cache_requests_total', {'app': _app_label(), 'cache': cache,
+                                              'result': 'hit' if hit else 'miss'},
+                 help_text='Cache lookups by result')
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Default Flask JSON provider that records how long encoding takes"""
+
+    def dumps(self, obj, **kwargs):
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            observe_serialization(time.perf_counter() - started)
+
+def _before_request():
+    g._metrics_started = time.perf_counter()
+
+def _after_request(response):
+    started = g.get('_metrics_started')
+    if started is None:
+        return response
+
+    labels = {
+        'app': current_app.import_name,
+        'route': request.url_rule.rule if request.url_rule is not None else 'unmatched',
+        'method': request.method
+    }
+    REGISTRY.observe('geo_http_request_duration_seconds', dict(labels, status=str(response.status_code)),
+                     time.perf_counter() - started, help_text='Request latency by route')
+    REGISTRY.observe('geo_db_duration_seconds', labels, g.get('_metrics_db_seconds', 0.0),
+                     help_text='Time spent executing and fetching SQL per request')
+    REGISTRY.observe('geo_serialization_duration_seconds', labels, g.get('_metrics_serialize_seconds', 0.0),
+                     help_text='Time spent encoding response bodies per request')
+    REGISTRY.observe('geo_db_rows_returned', labels, g.get('_metrics_rows', 0), buckets=ROW_BUCKETS,
+                     help_text='Rows fetched from SQLite per request')
+    if not response.is_streamed:
+        REGISTRY.observe('geo_http_response_bytes', labels, response.calculate_content_length() or 0,
+                         buckets=BYTE_BUCKETS, help_text='Response body size')
+    return response
+
+def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+def init_app(app):
+    """Install the timing hooks, the timed JSON provider and the /metrics route on an app"""
+    if _observe_query not in db_pool.query_observers:
+        db_pool.query_observers.append(_observe_query)
+    app.json = TimedJSONProvider(app)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
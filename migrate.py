@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Versioned schema migrations for the temporal database
+Migrations are numbered Python files in migrations/temporal/ (NNNN_description.py) that
+define upgrade(db). Pending migrations run in order inside one transaction, and the
+single-row schema_version table records how far a database has been migrated, so the
+startup check is one SELECT instead of PRAGMA probes.
+
+Databases are switched to WAL mode before migrating, so readers keep seeing the old schema
+until the migration transaction commits (including table rebuilds, see rebuild_table).
+
+Usage:
+    python migrate.py status [geography_temporal.db]
+    python migrate.py upgrade [geography_temporal.db]
+"""
+
+import importlib.util
+import os
+import re
+import sqlite3
+import sys
+
+DATABASE = 'geography_temporal.db'
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations', 'temporal')
+
+MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.py$')
+
+class MigrationError(Exception):
+    pass
+
+def available_migrations(directory=MIGRATIONS_DIR):
+    """[(version, name, path)] of every migration file, in order"""
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    versions = [version for version, _, _ in migrations]
+    if len(set(versions)) != len(versions):
+        raise MigrationError(f"Duplicate migration numbers in {directory}")
+    return migrations
+
+def latest_version(directory=MIGRATIONS_DIR):
+    migrations = available_migrations(directory)
+    return migrations[-1][0] if migrations else 0
+
+def current_version(db):
+    """Schema version recorded in the database (0 if it has never been migrated)"""
+    try:
+        row = db.execute('SELECT version FROM schema_version WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+def is_current(path=DATABASE, directory=MIGRATIONS_DIR):
+    """Fast startup check: one row read, no schema probing"""
+    db = sqlite3.connect(path)
+    try:
+        return current_version(db) >= latest_version(directory)
+    finally:
+        db.close()
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location(f"migration_{os.path.basename(path)[:-3]}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def _pending(db, directory):
+    version = current_version(db)
+    return [migration for migration in available_migrations(directory) if migration[0] > version]
+
+def apply_pending(db, directory=MIGRATIONS_DIR):
+    """Apply pending migrations in the caller's transaction; returns the names applied"""
+    pending = _pending(db, directory)
+    if not pending:
+        return []
+    db.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    for number, name, migration_path in pending:
+        _load(migration_path).upgrade(db)
+    db.execute('''
+        INSERT INTO schema_version (id, version) VALUES (1, ?)
+        ON CONFLICT(id) DO UPDATE SET version = excluded.version, applied_at = CURRENT_TIMESTAMP
+    ''', (pending[-1][0],))
+    return [f"{number:04d}_{name}" for number, name, _ in pending]
+
+def upgrade(path=DATABASE, directory=MIGRATIONS_DIR):
+    """Apply all pending migrations in one transaction; returns the names applied"""
+    db = sqlite3.connect(path, isolation_level=None)
+    try:
+        if not _pending(db, directory):
+            return []
+
+        db.execute('PRAGMA journal_mode = WAL')
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            applied = apply_pending(db, directory)
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+
+        # Fold the WAL back into the main file so file-based dataset fingerprints see the change
+        db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return applied
+    finally:
+        db.close()
+
+# HELPERS FOR MIGRATION FILES
+
+def column_names(db, table):
+    return [row[1] for row in db.execute(f'PRAGMA table_info({table})')]
+
+def add_columns(db, table, columns):
+    """Add [(name, type)] columns that are not there yet (databases created before versioning)"""
+    existing = set(column_names(db, table))
+    for name, column_type in columns:
+        if name not in existing:
+            db.execute(f'ALTER TABLE {table} ADD COLUMN {name} {column_type}')
+
+def rebuild_table(db, table, create_sql, column_map=None):
+    """Recreate a table with a new definition and copy its rows over
+
+    create_sql is the new CREATE TABLE statement written for the table's final name;
+    column_map maps new column -> SQL expression over the old table (defaults to copying
+    same-named columns). Indexes, triggers and views on the table are recreated. Must run
+    inside the migration transaction: readers (WAL mode) see the old table until commit.
+    """
+    temporary = f'{table}__rebuild'
+    dependents = db.execute('''
+        SELECT type, name, sql FROM sqlite_master
+        WHERE sql IS NOT NULL AND type IN ('index', 'trigger', 'view') AND (tbl_name = ? OR type = 'view')
+        ORDER BY rowid
+    ''', (table,)).fetchall()
+
+    new_create = re.sub(rf'^\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?["`]?{re.escape(table)}["`]?',
+                        f'CREATE TABLE {temporary}', create_sql, count=1, flags=re.IGNORECASE)
+    if new_create == create_sql:
+        raise MigrationError(f"create_sql must be a CREATE TABLE {table} statement")
+    db.execute(new_create)
+
+    old_columns = set(column_names(db, table))
+    if column_map is None:
+        column_map = {name: name for name in column_names(db, temporary) if name in old_columns}
+    targets = ', '.join(column_map)
+    sources = ', '.join(column_map.values())
+    db.execute(f'INSERT INTO {temporary} ({targets}) SELECT {sources} FROM {table}')
+
+    for kind, name, _ in dependents:
+        if kind == 'view':
+            db.execute(f'DROP VIEW {name}')
+    db.execute(f'DROP TABLE {table}')
+    db.execute(f'ALTER TABLE {temporary} RENAME TO {table}')
+    for kind, name, sql in dependents:
+        if kind == 'index' and name.startswith('sqlite_autoindex'):
+            continue
+        db.execute(sql)
+
+def main(argv):
+    command = argv[0] if argv else 'status'
+    path = argv[1] if len(argv) > 1 else DATABASE
+    if command not in ('status', 'upgrade'):
+        print(__doc__)
+        return 1
+    if not os.path.exists(path):
+        print(f"❌ Database not found: {path}")
+        return 1
+
+    if command == 'upgrade':
+        applied = upgrade(path)
+        print(f"🏗️  Schema migration for {path}")
+        for name in applied:
+            print(f"   ✅ applied {name}")
+        if not applied:
+            print("   ✅ already up to date")
+        return 0
+
+    db = sqlite3.connect(path)
+    version = current_version(db)
+    db.close()
+    latest = latest_version()
+    print(f"📋 {path}: schema version {version} of {latest}")
+    for number, name, _ in available_migrations():
+        print(f"   {'✅' if number <= version else '⏳'} {number:04d}_{name}")
+    return 0 if version >= latest else 2
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
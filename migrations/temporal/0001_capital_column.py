@@ -0,0 +1,6 @@
+"""Capital city per country and year (previously added by add_capitals_to_temporal.py)"""
+
+from migrate import add_columns
+
+def upgrade(db):
+    add_columns(db, 'countries_temporal', [('capital', 'TEXT')])
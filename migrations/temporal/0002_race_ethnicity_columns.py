@@ -0,0 +1,8 @@
+"""Racial/ethnic distribution percentages (previously added by add_race_ethnicity_to_temporal.py)"""
+
+from migrate import add_columns
+
+RACE_COLUMNS = ['white', 'black', 'asian', 'hispanic', 'native_american', 'pacific_islander', 'other']
+
+def upgrade(db):
+    add_columns(db, 'countries_temporal', [(f'race_{name}_percent', 'REAL') for name in RACE_COLUMNS])
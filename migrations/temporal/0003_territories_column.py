@@ -0,0 +1,6 @@
+"""Comma-separated territories/administrative divisions (previously added by add_territories_field.py)"""
+
+from migrate import add_columns
+
+def upgrade(db):
+    add_columns(db, 'countries_temporal', [('territories', 'TEXT')])
@@ -0,0 +1,19 @@
+"""Indexes for the countries_temporal access patterns of the time (see indexes.py), with fresh planner statistics"""
+
+# (index name, columns) on countries_temporal
+INDEXES = [
+    ('idx_countries_name_year', ('name', 'year')),
+    ('idx_countries_year_continent_name', ('year', 'continent_id', 'name')),
+    ('idx_countries_year_name', ('year', 'name')),
+    ('idx_countries_year_population', ('year', 'population')),
+]
+
+# A prefix of idx_countries_year_continent_name
+SUPERSEDED = ['idx_countries_year']
+
+def upgrade(db):
+    for name, columns in INDEXES:
+        db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON countries_temporal({', '.join(columns)})")
+    for name in SUPERSEDED:
+        db.execute(f"DROP INDEX IF EXISTS {name}")
+    db.execute('ANALYZE')
@@ -0,0 +1,42 @@
+"""Precomputed population-weighted demographic rollups per continent and world (rollups.py)"""
+
+# (coverage column prefix, percentage columns) of each distribution at the time of this migration
+DISTRIBUTIONS = [
+    ('religion_', ['religion_christian_percent', 'religion_muslim_percent', 'religion_hindu_percent',
+                   'religion_buddhist_percent', 'religion_jewish_percent', 'religion_other_percent',
+                   'religion_nonreligious_percent']),
+    ('race_', ['race_white_percent', 'race_black_percent', 'race_asian_percent', 'race_hispanic_percent',
+               'race_native_american_percent', 'race_pacific_islander_percent', 'race_other_percent']),
+]
+
+WORLD = 0
+
+def upgrade(db):
+    definitions, targets, aggregates = [], [], []
+    for prefix, columns in DISTRIBUTIONS:
+        definitions.extend(f'{column} REAL' for column in columns)
+        definitions.extend([f'{prefix}countries INTEGER NOT NULL DEFAULT 0',
+                            f'{prefix}population_covered INTEGER NOT NULL DEFAULT 0'])
+        targets.extend(columns + [f'{prefix}countries', f'{prefix}population_covered'])
+        aggregates.extend(f'SUM(CASE WHEN population > 0 THEN population * {column} END) * 1.0 / '
+                          f'SUM(CASE WHEN population > 0 AND {column} IS NOT NULL THEN population END)'
+                          for column in columns)
+        aggregates.append(f'COUNT({columns[0]})')
+        aggregates.append(f'COALESCE(SUM(CASE WHEN population > 0 AND {columns[0]} IS NOT NULL THEN population END), 0)')
+
+    db.execute(f'''
+        CREATE TABLE IF NOT EXISTS demographic_rollups (
+            year INTEGER NOT NULL,
+            continent_id INTEGER NOT NULL,
+            {', '.join(definitions)},
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (year, continent_id)
+        )
+    ''')
+    db.execute('DELETE FROM demographic_rollups')
+    db.execute(f'''
+        INSERT INTO demographic_rollups (year, continent_id, {', '.join(targets)})
+        SELECT year, continent_id, {', '.join(aggregates)} FROM countries_temporal GROUP BY year, continent_id
+        UNION ALL
+        SELECT year, {WORLD}, {', '.join(aggregates)} FROM countries_temporal GROUP BY year
+    ''')
@@ -0,0 +1,5 @@
+"""countries_temporal(code_iso2, year) index for joins with geography.db (query_app.py)"""
+
+def upgrade(db):
+    db.execute('CREATE INDEX IF NOT EXISTS idx_countries_code_iso2_year ON countries_temporal(code_iso2, year)')
+    db.execute('ANALYZE')
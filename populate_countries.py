@@ -4,9 +4,13 @@ Populate all world countries into the geography database
 Uses country.io API for comprehensive country data
 """
 
-import requests
-import sqlite3
+import argparse
 import json
+import os
+import sqlite3
+import time
+
+import source_cache
 
 def get_db():
     """Get database connection"""
@@ -14,39 +18,66 @@ def get_db():
     db.row_factory = sqlite3.Row
     return db
 
-def get_continent_mapping():
+def get_continent_mapping(db=None):
     """Get mapping of continent codes to our database IDs"""
-    db = get_db()
+    own_connection = db is None
+    if own_connection:
+        db = get_db()
     cursor = db.execute('SELECT id, code FROM continents')
-    continents = {row['code']: row['id'] for row in cursor.fetchall()}
-    db.close()
+    continents = {row[1]: row[0] for row in cursor.fetchall()}
+    if own_connection:
+        db.close()
     return continents
 
-def download_country_data():
-    """Download country data from country.io API"""
-    print("📡 Downloading country data from country.io...")
-    
-    # Download all the data files
-    urls = {
-        'names': 'https://country.io/names.json',
-        'continents': 'https://country.io/continent.json', 
-        'iso3': 'https://country.io/iso3.json',
-        'capitals': 'https://country.io/capital.json',
-        'currencies': 'https://country.io/currency.json',
-        'phones': 'https://country.io/phone.json'
-    }
-    
+COUNTRY_IO_BASE_URL = 'https://country.io'
+
+# Data key -> country.io feed (a JSON object keyed by ISO 3166-1 alpha-2 code)
+COUNTRY_IO_FEEDS = {
+    'names': 'names.json',
+    'continents': 'continent.json',
+    'iso3': 'iso3.json',
+    'capitals': 'capital.json',
+    'currencies': 'currency.json',
+    'phones': 'phone.json'
+}
+
+def download_country_data(base_url=None, fixtures_dir=None):
+    """Download the country.io feeds concurrently (or read them from a fixtures directory)
+
+    base_url points the stage at a mirror or local mock server (default: GEO_COUNTRY_IO_URL
+    or country.io); fixtures_dir holds the feed files by name and skips the network entirely.
+    """
     data = {}
+    if fixtures_dir:
+        print(f"📂 Reading country data from {fixtures_dir}...")
+        for key, feed in COUNTRY_IO_FEEDS.items():
+            try:
+                with open(os.path.join(fixtures_dir, feed)) as f:
+                    data[key] = json.load(f)
+                print(f"  ✓ {key}: {len(data[key])} countries")
+            except (OSError, ValueError) as e:
+                print(f"  ✗ Error reading {key}: {e}")
+                data[key] = {}
+        return data
+
+    base_url = (base_url or os.environ.get('GEO_COUNTRY_IO_URL') or COUNTRY_IO_BASE_URL).rstrip('/')
+    print(f"📡 Downloading country data from {base_url}...")
+    urls = {key: f"{base_url}/{feed}" for key, feed in COUNTRY_IO_FEEDS.items()}
+
+    # All six feeds in flight at once on one pooled session with retries/backoff
+    started = time.perf_counter()
+    sources = source_cache.from_env(timeout=10)
+    payloads, errors = sources.fetch_many(urls.values())
     for key, url in urls.items():
         try:
-            print(f"  Downloading {key}...")
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data[key] = response.json()
+            if url in errors:
+                raise errors[url]
+            data[key] = json.loads(payloads[url])
             print(f"  ✓ {key}: {len(data[key])} countries")
-        except Exception as e:
+        except (source_cache.SourceUnavailable, ValueError) as e:
             print(f"  ✗ Error downloading {key}: {e}")
             data[key] = {}
+    print(f"  ⏱️  {len(urls)} feeds in {time.perf_counter() - started:.2f}s")
     
     return data
 
@@ -84,15 +115,17 @@ def map_continent_code(continent_code, continent_mapping):
     # Default to Asia if unknown
     return continent_mapping.get('AS', 1)
 
-def populate_countries(country_data, continent_mapping):
-    """Populate countries into the database"""
-    db = get_db()
+def populate_countries(country_data, continent_mapping, db=None):
+    """Populate countries into the database (in the caller's transaction when given a connection)"""
+    own_connection = db is None
+    if own_connection:
+        db = get_db()
     
     print(f"\n🌍 Populating {len(country_data['names'])} countries...")
     
     # Get existing countries to avoid duplicates
     cursor = db.execute('SELECT code_iso2 FROM countries')
-    existing_countries = {row['code_iso2'] for row in cursor.fetchall()}
+    existing_countries = {row[0] for row in cursor.fetchall()}
     
     added_count = 0
     skipped_count = 0
@@ -139,8 +172,9 @@ def populate_countries(country_data, continent_mapping):
             print(f"  ⚠️ Skipped {country_name} ({iso2_code}): {e}")
             skipped_count += 1
     
-    db.commit()
-    db.close()
+    if own_connection:
+        db.commit()
+        db.close()
     
     print(f"\n✅ Country population complete!")
     print(f"   Added: {added_count} countries")
@@ -174,6 +208,11 @@ def show_statistics():
     db.close()
 
 def main():
+    parser = argparse.ArgumentParser(description='Populate world countries from the country.io feeds')
+    parser.add_argument('--base-url', help='country.io mirror or local mock server (default: GEO_COUNTRY_IO_URL)')
+    parser.add_argument('--fixtures', help='directory with names.json, continent.json, ... to use instead')
+    args = parser.parse_args()
+
     print("🌍 World Countries Database Populator")
     print("=" * 50)
     
@@ -187,7 +226,7 @@ def main():
         return
     
     # Download country data
-    country_data = download_country_data()
+    country_data = download_country_data(args.base_url, args.fixtures)
     
     if not country_data['names']:
         print("✗ No country data downloaded. Check your internet connection.")
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Cross-Database Query Service
+Joins geography.db (states/provinces, cities) with geography_temporal.db (per-year country
+metrics) in single SQL queries: every pooled connection opens the temporal database and
+ATTACHes geography.db as schema 'geography', joined on the shared ISO2 code.
+"""
+
+import sqlite3
+import os
+from flask import Blueprint, request, jsonify
+import api_common
+import db_pool
+from api_common import get_page_args
+
+# Routes of the cross-database API (mounted at / by this module's app, at /v1/query by gateway.py)
+api = Blueprint('query', __name__)
+
+def served_pool():
+    """Pool for the temporal database with geography.db attached (both hot-swapped, see db_pool)"""
+    return db_pool.serve(api_common.temporal_database(),
+                         attach={'geography': api_common.database('GEOGRAPHY_DATABASE')})
+
+def get_db():
+    """Get a pooled connection to both databases (geography.db tables are geography.<table>)"""
+    return served_pool().connect()
+
+def get_population_filter():
+    """(year, min_population, max_population, continent_id) from the query string"""
+    return (request.args.get('year', 2025, type=int),
+            request.args.get('min_population', type=int),
+            request.args.get('max_population', type=int),
+            request.args.get('continent_id', type=int))
+
+# Countries of a year matching get_population_filter(); a NULL bound means no bound
+COUNTRY_FILTER = '''
+    ct.year = :year
+    AND (:min_population IS NULL OR ct.population >= :min_population)
+    AND (:max_population IS NULL OR ct.population <= :max_population)
+    AND (:continent_id IS NULL OR ct.continent_id = :continent_id)
+'''
+
+def paged(db, sql, parameters, offset, limit):
+    """Rows of one page of a query plus the total row count (from COUNT(*) OVER () on the page)"""
+    rows = [dict(row) for row in db.execute(f'''
+        SELECT *, COUNT(*) OVER () AS _total FROM ({sql}) LIMIT :limit OFFSET :offset
+    ''', {**parameters, 'limit': limit, 'offset': offset}).fetchall()]
+    if rows:
+        total = rows[0]['_total']
+    elif offset:
+        total = db.execute(f'SELECT COUNT(*) FROM ({sql})', parameters).fetchone()[0]
+    else:
+        total = 0
+    for row in rows:
+        del row['_total']
+    return rows, total
+
+# API ENDPOINTS
+
+@api.route('/api/subdivisions', methods=['GET'])
+def get_subdivisions():
+    """States/provinces of the countries whose population in a year is within a range
+
+    ?year=2025&min_population=100000000 (also max_population, continent_id, type, offset, limit);
+    largest countries first.
+    """
+    year, min_population, max_population, continent_id = get_population_filter()
+    subdivision_type = request.args.get('type')
+    offset, limit = get_page_args()
+
+    db = get_db()
+    subdivisions, total = paged(db, f'''
+        SELECT s.id, s.name, s.code, s.type,
+               ct.name AS country_name, ct.code_iso2, ct.continent_id, ct.population AS country_population
+        FROM countries_temporal ct
+        JOIN geography.countries co ON co.code_iso2 = ct.code_iso2
+        JOIN geography.states_provinces s ON s.country_id = co.id
+        WHERE {COUNTRY_FILTER}
+          AND (:type IS NULL OR s.type = :type)
+        ORDER BY ct.population DESC, ct.name, s.name
+    ''', {'year': year, 'min_population': min_population, 'max_population': max_population,
+          'continent_id': continent_id, 'type': subdivision_type}, offset, limit)
+    db.close()
+
+    return jsonify({
+        'subdivisions': subdivisions,
+        'count': len(subdivisions),
+        'total': total,
+        'offset': offset,
+        'year': year,
+        'min_population': min_population,
+        'max_population': max_population
+    })
+
+@api.route('/api/countries', methods=['GET'])
+def get_countries():
+    """Countries of a year with their population and geography.db subdivision and city counts
+
+    ?year=2025&min_population=...&max_population=...&continent_id=...&min_subdivisions=...;
+    largest countries first.
+    """
+    year, min_population, max_population, continent_id = get_population_filter()
+    min_subdivisions = request.args.get('min_subdivisions', type=int)
+    offset, limit = get_page_args()
+
+    db = get_db()
+    countries, total = paged(db, f'''
+        SELECT * FROM (
+            SELECT ct.country_id, ct.name, ct.code_iso2, ct.code_iso3, ct.continent_id, ct.capital, ct.population,
+                   (SELECT COUNT(*) FROM geography.states_provinces s WHERE s.country_id = co.id) AS subdivisions,
+                   (SELECT COUNT(*) FROM geography.states_provinces s
+                    JOIN geography.cities ci ON ci.state_province_id = s.id
+                    WHERE s.country_id = co.id) AS cities
+            FROM countries_temporal ct
+            LEFT JOIN geography.countries co ON co.code_iso2 = ct.code_iso2
+            WHERE {COUNTRY_FILTER}
+        )
+        WHERE :min_subdivisions IS NULL OR subdivisions >= :min_subdivisions
+        ORDER BY population DESC, name
+    ''', {'year': year, 'min_population': min_population, 'max_population': max_population,
+          'continent_id': continent_id, 'min_subdivisions': min_subdivisions}, offset, limit)
+    db.close()
+
+    return jsonify({
+        'countries': countries,
+        'count': len(countries),
+        'total': total,
+        'offset': offset,
+        'year': year
+    })
+
+@api.route('/api/countries/<code_iso2>/subdivisions', methods=['GET'])
+def get_country_subdivisions(code_iso2):
+    """A country's metrics for a year together with its states/provinces and their cities"""
+    year = request.args.get('year', 2025, type=int)
+    code_iso2 = code_iso2.upper()
+
+    db = get_db()
+    country = db.execute('''
+        SELECT country_id, name, code_iso2, code_iso3, continent_id, capital, population
+        FROM countries_temporal
+        WHERE code_iso2 = ? AND year = ?
+    ''', (code_iso2, year)).fetchone()
+    if country is None:
+        db.close()
+        return jsonify({'error': f"No country with ISO2 code '{code_iso2}' in {year}"}), 404
+
+    cursor = db.execute('''
+        SELECT s.id, s.name, s.code, s.type, s.capital, COUNT(ci.id) AS cities
+        FROM geography.countries co
+        JOIN geography.states_provinces s ON s.country_id = co.id
+        LEFT JOIN geography.cities ci ON ci.state_province_id = s.id
+        WHERE co.code_iso2 = ?
+        GROUP BY s.id
+        ORDER BY s.name
+    ''', (code_iso2,))
+    subdivisions = [dict(row) for row in cursor.fetchall()]
+    db.close()
+
+    return jsonify({
+        'country': dict(country),
+        'subdivisions': subdivisions,
+        'count': len(subdivisions),
+        'year': year
+    })
+
+@api.route('/health')
+def health():
+    """Check that both databases answer queries; report pool state and dataset version"""
+    pool = served_pool()
+    try:
+        db = pool.connect()
+        db.execute('SELECT COUNT(*) FROM countries_temporal').fetchone()
+        db.execute('SELECT COUNT(*) FROM geography.countries').fetchone()
+        db.close()
+        version = pool.version
+    except (sqlite3.Error, OSError) as e:
+        return jsonify({'status': 'unhealthy', 'database': 'error', 'error': str(e), 'pool': pool.stats()}), 503
+
+    return jsonify({
+        'status': 'healthy',
+        'database': 'temporal + geography',
+        'dataset_version': version,
+        'pool': pool.stats()
+    })
+
+app = api_common.create_app(__name__, [(api, '')])
+
+if __name__ == '__main__':
+    print("🔗 Starting Cross-Database Query Service...")
+
+    for path in (app.config['TEMPORAL_DATABASE'], app.config['GEOGRAPHY_DATABASE']):
+        if not os.path.exists(path):
+            print(f"❌ {path} not found! Please run build.py first.")
+            exit(1)
+
+    api_common.ensure_migrated(app.config['TEMPORAL_DATABASE'])
+
+    print("\n" + "="*60)
+    print("🚀 Cross-Database Query Service Ready!")
+    print("🔍 Subdivisions by population: http://localhost:5002/api/subdivisions?min_population=100000000")
+    print("="*60 + "\n")
+
+    app.run(debug=True, host='0.0.0.0', port=5002)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Opt-in SQL tracer: slow-query log plus EXPLAIN QUERY PLAN capture
+Wraps sqlite3 connections so every statement is timed (execute through the last fetch).
+Statements slower than the threshold are logged with their parameters, and any statement
+whose plan contains a full-table SCAN gets that plan attached. An aggregated report then
+lists which queries scan which tables and would benefit from an index.
+
+Enable it in the web apps with environment variables:
+    GEO_QUERY_TRACE=trace.jsonl   # JSON-lines log of traced statements ('1' = log to stderr only)
+    GEO_SLOW_QUERY_MS=50          # slow-query threshold in milliseconds
+
+Trace an ETL script and print the report when it finishes:
+    python query_tracer.py run verify_capitals.py
+
+Summarize a trace log:
+    python query_tracer.py report trace.jsonl
+"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import runpy
+import sqlite3
+import sys
+import threading
+import time
+
+import db_pool
+
+logger = logging.getLogger('query_tracer')
+
+DEFAULT_THRESHOLD_MS = 50.0
+
+# Statements EXPLAIN QUERY PLAN is meaningful for
+EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT', 'REPLACE')
+
+def normalize_sql(sql):
+    """Collapse whitespace so the same statement aggregates under one key"""
+    return ' '.join(sql.split())
+
+def is_full_scan(detail):
+    """True for plan steps that visit every row of a table or index"""
+    return detail.startswith('SCAN ') and not detail.startswith('SCAN CONSTANT ROW')
+
+def candidate_columns(sql):
+    """Columns compared against bound parameters - a rough hint at which index would help"""
+    columns = re.findall(r'(?:\b\w+\.)?\b(\w+)\s*(?:=|<=|>=|<|>|\bIN\b|\bLIKE\b)\s*\(?\?', sql, re.IGNORECASE)
+    return sorted(set(columns))
+
+class QueryTracer:
+    """Collects timings and query plans for traced statements"""
+
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, log_path=None):
+        self.threshold_ms = threshold_ms
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._plans = {}
+        self._stats = {}
+
+    def explain(self, connection, sql, parameters):
+        """EXPLAIN QUERY PLAN for a statement, cached per normalized SQL text"""
+        key = normalize_sql(sql)
+        with self._lock:
+            if key in self._plans:
+                return self._plans[key]
+
+        plan = []
+        if key.upper().startswith(EXPLAINABLE):
+            try:
+                rows = sqlite3.Connection.execute(connection, 'EXPLAIN QUERY PLAN ' + sql, parameters).fetchall()
+                plan = [row[3] for row in rows]
+            except sqlite3.Error:
+                plan = []
+
+        with self._lock:
+            self._plans[key] = plan
+        return plan
+
+    def record(self, connection, sql, parameters, seconds):
+        key = normalize_sql(sql)
+        plan = self.explain(connection, sql, parameters)
+        scans = [detail for detail in plan if is_full_scan(detail)]
+        elapsed_ms = seconds * 1000.0
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {'sql': key, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                            'slow': 0, 'scans': scans, 'plan': plan}
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            slow = elapsed_ms >= self.threshold_ms
+            if slow:
+                stats['slow'] += 1
+
+        if slow:
+            logger.warning("Slow query (%.1f ms): %s params=%r%s", elapsed_ms, key, _jsonable(parameters),
+                           f" plan={plan}" if scans else '')
+        if self.log_path:
+            entry = {'ts': time.time(), 'ms': round(elapsed_ms, 3), 'sql': key, 'params': _jsonable(parameters),
+                     'slow': slow, 'scans': scans}
+            if scans:
+                entry['plan'] = plan
+            with self._lock, open(self.log_path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def report(self):
+        """Aggregated statistics per statement, slowest total first"""
+        with self._lock:
+            entries = [dict(stats) for stats in self._stats.values()]
+        return build_report(entries)
+
+def build_report(entries):
+    """Sort aggregated statements and mark the ones that need an index"""
+    for entry in entries:
+        entry['needs_index'] = bool(entry['scans'])
+        entry['candidate_columns'] = candidate_columns(entry['sql']) if entry['scans'] else []
+        entry['avg_ms'] = entry['total_ms'] / entry['count'] if entry['count'] else 0.0
+    return sorted(entries, key=lambda entry: (not entry['needs_index'], -entry['total_ms']))
+
+def format_report(report):
+    lines = ["🔎 QUERY TRACE REPORT", "=" * 60]
+    needs_index = [entry for entry in report if entry['needs_index']]
+    lines.append(f"Statements traced: {len(report)} | Full scans: {len(needs_index)}")
+    for entry in report:
+        marker = "❌ SCAN" if entry['needs_index'] else "✅"
+        lines.append("-" * 60)
+        lines.append(f"{marker} {entry['count']}x total {entry['total_ms']:.1f} ms, "
+                     f"avg {entry['avg_ms']:.2f} ms, max {entry['max_ms']:.1f} ms, slow {entry['slow']}")
+        lines.append(f"   {entry['sql'][:200]}")
+        for detail in entry['scans']:
+            lines.append(f"   plan: {detail}")
+        if entry['candidate_columns']:
+            lines.append(f"   index candidates: {', '.join(entry['candidate_columns'])}")
+    return '\n'.join(lines)
+
+def _jsonable(parameters):
+    if isinstance(parameters, dict):
+        return {key: _jsonable(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_jsonable(value) for value in parameters]
+    if isinstance(parameters, bytes):
+        return f"<{len(parameters)} bytes>"
+    return parameters
+
+# TRACING CONNECTION
+
+TRACER = QueryTracer()
+
+class TracingCursor(sqlite3.Cursor):
+    """Cursor that times each statement from execute() until its rows are consumed"""
+
+    _trace = None
+
+    def _finish(self):
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            TRACER.record(self.connection, *trace)
+
+    def _timed(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            if self._trace is not None:
+                self._trace[2] += time.perf_counter() - started
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        self._trace = [sql, parameters, 0.0]
+        self._timed(super().execute, sql, parameters)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        seq_of_parameters = list(seq_of_parameters)
+        self._trace = [sql, seq_of_parameters[0] if seq_of_parameters else (), 0.0]
+        self._timed(super().executemany, sql, seq_of_parameters)
+        self._finish()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(super().fetchmany, size if size is not None else self.arraysize)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+class TracingConnection(sqlite3.Connection):
+    """Connection whose cursors (including execute() shortcuts) are traced"""
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TracingCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+_original_connect = sqlite3.connect
+
+def _traced_connect(*args, **kwargs):
+    kwargs.setdefault('factory', TracingConnection)
+    return _original_connect(*args, **kwargs)
+
+def install(threshold_ms=DEFAULT_THRESHOLD_MS, log_path=None):
+    """Trace every connection opened from now on (pooled and plain sqlite3.connect)"""
+    TRACER.threshold_ms = threshold_ms
+    TRACER.log_path = log_path
+    db_pool.connection_factory = TracingConnection
+    sqlite3.connect = _traced_connect
+    return TRACER
+
+def install_from_env():
+    """Install the tracer if GEO_QUERY_TRACE is set (used by the web apps at import time)"""
+    target = os.environ.get('GEO_QUERY_TRACE')
+    if not target or target == '0':
+        return None
+    threshold_ms = float(os.environ.get('GEO_SLOW_QUERY_MS', DEFAULT_THRESHOLD_MS))
+    return install(threshold_ms, log_path=None if target == '1' else target)
+
+# COMMAND LINE
+
+def report_from_log(path):
+    """Aggregate a JSON-lines trace log into the same report as QueryTracer.report()"""
+    stats = {}
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            aggregate = stats.get(entry['sql'])
+            if aggregate is None:
+                aggregate = stats[entry['sql']] = {'sql': entry['sql'], 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                                   'slow': 0, 'scans': entry.get('scans', []),
+                                                   'plan': entry.get('plan', [])}
+            aggregate['count'] += 1
+            aggregate['total_ms'] += entry['ms']
+            aggregate['max_ms'] = max(aggregate['max_ms'], entry['ms'])
+            aggregate['slow'] += 1 if entry.get('slow') else 0
+    return build_report(list(stats.values()))
+
+def main(argv):
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    if len(argv) >= 2 and argv[0] == 'report':
+        print(format_report(report_from_log(argv[1])))
+        return 0
+    if len(argv) >= 2 and argv[0] == 'run':
+        install(float(os.environ.get('GEO_SLOW_QUERY_MS', DEFAULT_THRESHOLD_MS)),
+                os.environ.get('GEO_QUERY_TRACE') or None)
+        atexit.register(lambda: print('\n' + format_report(TRACER.report())))
+        sys.argv = argv[1:]
+        runpy.run_path(argv[1], run_name='__main__')
+        return 0
+    print(__doc__)
+    return 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
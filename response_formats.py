@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Compact response formats for the Flask apps
+Every jsonify() response is content-negotiated: clients sending Accept: application/msgpack
+or application/cbor get a binary encoding of the same payload (JSON stays the default).
+Adding ?shape=columnar turns lists of objects into {"columns": [...], "rows": [[...]]},
+so keys such as race_native_american_percent are sent once instead of once per row;
+nested objects inside rows become dotted columns (religious_distribution.muslim_percent).
+
+msgpack and cbor2 are optional (requirements-analytics.txt); formats whose library is not
+installed are simply not offered during negotiation.
+
+Usage:
+    import response_formats
+    response_formats.init_app(app)   # after metrics.init_app(app)
+"""
+
+import time
+from collections.abc import Mapping
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+from demographics import Distribution
+from metrics import TimedJSONProvider, observe_serialization
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPES = ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack')
+CBOR_MIMETYPE = 'application/cbor'
+
+def available_mimetypes():
+    """Offered response types, JSON first so wildcard Accept headers keep getting JSON"""
+    offers = [JSON_MIMETYPE]
+    if msgpack is not None:
+        offers.extend(MSGPACK_MIMETYPES)
+    if cbor2 is not None:
+        offers.append(CBOR_MIMETYPE)
+    return offers
+
+def _flatten(obj, prefix=''):
+    """Flatten nested dicts (and mappings such as demographics.Distribution) into dotted keys"""
+    flat = {}
+    for key, value in obj.items():
+        if isinstance(value, Mapping) and value:
+            flat.update(_flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+def columnar(obj):
+    """Rewrite every list of dicts in a payload as {'columns': [...], 'rows': [[...], ...]}"""
+    if isinstance(obj, dict):
+        return {key: columnar(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        if obj and all(isinstance(item, dict) for item in obj):
+            rows = [_flatten(item) for item in obj]
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            return {
+                'columns': columns,
+                'rows': [[columnar(row.get(column)) for column in columns] for row in rows]
+            }
+        return [columnar(item) for item in obj]
+    return obj
+
+class NegotiatingJSONProvider(TimedJSONProvider):
+    """JSON provider whose response() honours Accept (msgpack/CBOR) and ?shape=columnar"""
+
+    @staticmethod
+    def default(value):
+        """Encode read-only mappings (compact demographic distributions) as objects"""
+        if isinstance(value, Distribution):
+            return value.to_dict()
+        if isinstance(value, Mapping):
+            return dict(value)
+        return DefaultJSONProvider.default(value)
+
+    def response(self, *args, **kwargs):
+        if not has_request_context():
+            return super().response(*args, **kwargs)
+
+        shape = request.args.get('shape')
+        mimetype = request.accept_mimetypes.best_match(available_mimetypes(), default=JSON_MIMETYPE)
+        if mimetype == JSON_MIMETYPE and shape != 'columnar':
+            response = super().response(*args, **kwargs)
+            response.vary.add('Accept')
+            return response
+
+        obj = self._prepare_response_obj(args, kwargs)
+        if shape == 'columnar':
+            obj = columnar(obj)
+
+        if mimetype == JSON_MIMETYPE:
+            response = self._app.response_class(f"{self.dumps(obj, separators=(',', ':'))}\n", mimetype=mimetype)
+        else:
+            started = time.perf_counter()
+            if mimetype == CBOR_MIMETYPE:
+                body = cbor2.dumps(obj, default=lambda encoder, value: encoder.encode(self.default(value)))
+            else:
+                body = msgpack.packb(obj, default=self.default)
+            observe_serialization(time.perf_counter() - started)
+            response = self._app.response_class(body, mimetype=mimetype)
+
+        response.vary.add('Accept')
+        if shape == 'columnar':
+            response.headers['X-Response-Shape'] = 'columnar'
+        return response
+
+def init_app(app):
+    """Replace the app's JSON provider with the negotiating one"""
+    app.json = NegotiatingJSONProvider(app)
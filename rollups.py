@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Population-weighted demographic rollups per continent and for the world
+demographic_rollups holds, per year and continent (continent_id 0 = world), the population-
+weighted average of every religion_*/race_* percentage column. Each category is averaged over
+the countries that report it and have a population, together with how many countries and
+people the distribution covers. build.py calls refresh() in the transaction that derives the
+temporal tables, so /api/stats reads a handful of precomputed rows instead of clients pulling
+every country and rolling up themselves.
+
+Usage:
+    python rollups.py [geography_temporal.db]      # recompute every year
+"""
+
+import sqlite3
+import sys
+
+from demographics import SCHEMAS
+
+DATABASE = 'geography_temporal.db'
+TABLE = 'demographic_rollups'
+WORLD = 0
+
+def _coverage_columns(schema):
+    return f'{schema.prefix}countries', f'{schema.prefix}population_covered'
+
+def create_table(db):
+    columns = []
+    for schema in SCHEMAS:
+        columns.extend(f'{column} REAL' for column in schema.columns)
+        countries, covered = _coverage_columns(schema)
+        columns.extend([f'{countries} INTEGER NOT NULL DEFAULT 0', f'{covered} INTEGER NOT NULL DEFAULT 0'])
+    db.execute(f'''
+        CREATE TABLE IF NOT EXISTS {TABLE} (
+            year INTEGER NOT NULL,
+            continent_id INTEGER NOT NULL,
+            {', '.join(columns)},
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (year, continent_id)
+        )
+    ''')
+
+def _aggregates():
+    """SELECT-list expressions computing every rollup column over a group of countries"""
+    expressions = []
+    for schema in SCHEMAS:
+        for column in schema.columns:
+            expressions.append(
+                f'SUM(CASE WHEN population > 0 THEN population * {column} END) * 1.0 / '
+                f'SUM(CASE WHEN population > 0 AND {column} IS NOT NULL THEN population END)'
+            )
+        # A distribution's columns are filled together, so its first column stands for coverage
+        first = schema.columns[0]
+        expressions.append(f'COUNT({first})')
+        expressions.append(f'COALESCE(SUM(CASE WHEN population > 0 AND {first} IS NOT NULL THEN population END), 0)')
+    return ', '.join(expressions)
+
+def _rollup_columns():
+    columns = []
+    for schema in SCHEMAS:
+        columns.extend(schema.columns)
+        columns.extend(_coverage_columns(schema))
+    return columns
+
+def refresh(db, years=None):
+    """Recompute the rollups of some years (default: all); runs in the caller's transaction"""
+    create_table(db)
+    if years is None:
+        where, params = '', []
+        db.execute(f'DELETE FROM {TABLE}')
+    else:
+        years = list(years)
+        placeholders = ', '.join('?' for _ in years)
+        where, params = f'WHERE year IN ({placeholders})', years
+        db.execute(f'DELETE FROM {TABLE} {where}', params)
+
+    targets = ', '.join(['year', 'continent_id'] + _rollup_columns())
+    aggregates = _aggregates()
+    db.execute(f'''
+        INSERT INTO {TABLE} ({targets})
+        SELECT year, continent_id, {aggregates} FROM countries_temporal {where} GROUP BY year, continent_id
+        UNION ALL
+        SELECT year, {WORLD}, {aggregates} FROM countries_temporal {where} GROUP BY year
+    ''', params + params)
+
+def _region(row, continent_id, name):
+    region = {'continent_id': continent_id, 'name': name}
+    for schema in SCHEMAS:
+        distribution = {key: None if row[column] is None else round(row[column], 2)
+                        for key, column in zip(schema.keys, schema.columns)}
+        countries, covered = _coverage_columns(schema)
+        distribution['countries'] = row[countries]
+        distribution['population_covered'] = row[covered]
+        region[schema.name] = distribution
+    return region
+
+def query(db, year):
+    """{'world': region, 'by_continent': [region, ...]} for one year (None if never computed)"""
+    try:
+        cursor = db.execute(f'''
+            SELECT r.*, cont.name AS continent_name
+            FROM {TABLE} r
+            LEFT JOIN continents_temporal cont ON cont.continent_id = r.continent_id AND cont.year = r.year
+            WHERE r.year = ?
+            ORDER BY r.continent_id
+        ''', (year,))
+    except sqlite3.OperationalError:
+        # Database not migrated to the rollups schema yet
+        return None
+    names = [description[0] for description in cursor.description]
+    rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+    if not rows:
+        return None
+
+    world = None
+    continents = []
+    for row in rows:
+        if row['continent_id'] == WORLD:
+            world = _region(row, None, 'World')
+        else:
+            continents.append(_region(row, row['continent_id'], row['continent_name']))
+    return {'world': world, 'by_continent': continents}
+
+def main(argv):
+    path = argv[0] if argv else DATABASE
+    db = sqlite3.connect(path)
+    try:
+        with db:
+            refresh(db)
+        count, years = db.execute(f'SELECT COUNT(*), COUNT(DISTINCT year) FROM {TABLE}').fetchone()
+    finally:
+        db.close()
+    print(f"✅ Recomputed {count} demographic rollups for {years} years in {path}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
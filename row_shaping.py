@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Row shaping for the temporal countries API
+Turns flat countries_temporal rows into the API shape (nested religious, racial/ethnic and
+administrative-division objects). Column positions are resolved once per result schema, so
+each row costs a few index lookups instead of dict copies, .get() calls and key deletions.
+The distributions of a result set share one DemographicsBlock (see demographics.py); rows
+hold Distribution views into it rather than two dicts each.
+
+See benchmarks/bench_row_shaping.py for the measurements behind this layout.
+"""
+
+from operator import itemgetter
+
+from demographics import RACE, RELIGION, DemographicsBlock
+
+_shapers = {}
+
+def _getter(indexes):
+    """itemgetter that always returns a tuple (itemgetter with one index returns the bare item)"""
+    if not indexes:
+        return lambda row: ()
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indexes)
+
+def _distribution_indexes(columns, schema):
+    """Column index per category of a distribution, in schema order (None if the column is missing)"""
+    return [columns.index(column) if column in columns else None for column in schema.columns]
+
+def country_shaper(columns):
+    """Build a function that shapes one row with the given column names into an API dict
+
+    The returned shape(row, block) stores the row's distributions in block.
+    """
+    columns = list(columns)
+    has_religion = 'religion_christian_percent' in columns
+    has_race = 'race_white_percent' in columns
+
+    # Flattened religion_*/race_* columns are replaced by the nested objects
+    kept = [(i, name) for i, name in enumerate(columns)
+            if not (has_religion and name.startswith('religion_')) and not (has_race and name.startswith('race_'))]
+    kept_keys = [name for _, name in kept]
+    kept_values = _getter([i for i, _ in kept])
+
+    # Block layout is religion then race; absent distributions are stored as NULLs and not emitted
+    indexes = ((_distribution_indexes(columns, RELIGION) if has_religion else [None] * len(RELIGION.keys)) +
+               (_distribution_indexes(columns, RACE) if has_race else [None] * len(RACE.keys)))
+    if None in indexes:
+        present = _getter([i for i in indexes if i is not None])
+        slots = [i is not None for i in indexes]
+
+        def demographic_values(row):
+            values = iter(present(row))
+            return [next(values) if slot else None for slot in slots]
+    else:
+        demographic_values = _getter(indexes)
+    territories_index = columns.index('territories') if 'territories' in columns else None
+
+    def shape(row, block):
+        country = dict(zip(kept_keys, kept_values(row)))
+        if has_religion or has_race:
+            position = block.append(demographic_values(row))
+            if has_religion:
+                country['religious_distribution'] = block.distribution(position, RELIGION)
+            if has_race:
+                country['racial_ethnic_distribution'] = block.distribution(position, RACE)
+        if territories_index is not None:
+            territories = row[territories_index]
+            territories_list = [t.strip() for t in territories.split(',')] if territories else []
+            country['administrative_divisions'] = {
+                'territories': territories_list,
+                'count': len(territories_list)
+            }
+        return country
+
+    return shape
+
+def shape_countries(cursor):
+    """Fetch and shape every row of an executed countries query"""
+    columns = tuple(description[0] for description in cursor.description)
+    shape = _shapers.get(columns)
+    if shape is None:
+        shape = _shapers[columns] = country_shaper(columns)
+    block = DemographicsBlock()
+    return [shape(row, block) for row in cursor.fetchall()]
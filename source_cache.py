@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for the datasets the population scripts download
+Fetched payloads are stored once under their SHA-256 (objects/ab/abcdef...) with an index
+of url -> checksum, ETag and Last-Modified. Later runs revalidate with conditional requests
+(304 = reuse the stored bytes) and fall back to the stored copy when the network fails.
+
+A snapshot directory has the same layout and is meant to be vendored: entries found there
+are always served from it, so rebuilds are deterministic, and with offline mode no request
+is made at all. Several sources can be fetched concurrently with fetch_many().
+
+Environment (see from_env):
+    GEO_SOURCE_CACHE      cache directory (default .source_cache)
+    GEO_SOURCE_SNAPSHOT   vendored snapshot directory to replay from
+    GEO_SOURCE_OFFLINE    1 = never touch the network
+
+Usage:
+    python source_cache.py status
+    python source_cache.py snapshot sources/       # copy every cached entry into a snapshot dir
+    python source_cache.py clear
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_CACHE_DIR = '.source_cache'
+INDEX_FILE = 'index.json'
+
+# Connection pool size and retry policy of the default session
+POOL_SIZE = 8
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class SourceUnavailable(Exception):
+    pass
+
+def _atomic_write(path, data):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+def pooled_session(pool_size=POOL_SIZE, retries=RETRIES, backoff_factor=BACKOFF_FACTOR):
+    """requests.Session with keep-alive pools sized for concurrent fetches and retries with backoff"""
+    session = requests.Session()
+    retry = Retry(total=retries, connect=retries, read=retries, backoff_factor=backoff_factor,
+                  status_forcelist=RETRY_STATUSES, allowed_methods=frozenset(['GET', 'HEAD']),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class _Store:
+    """index.json plus checksum-named objects in one directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.lock = threading.Lock()
+        try:
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        except FileNotFoundError:
+            self.index = {}
+
+    def _object_path(self, checksum):
+        return os.path.join(self.directory, 'objects', checksum[:2], checksum)
+
+    def read(self, url):
+        """(payload, entry) for a url, or (None, entry-or-None) if missing or corrupt"""
+        entry = self.index.get(url)
+        if entry is None:
+            return None, None
+        try:
+            with open(self._object_path(entry['sha256']), 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            return None, entry
+        if hashlib.sha256(payload).hexdigest() != entry['sha256']:
+            return None, entry
+        return payload, entry
+
+    def write(self, url, payload, etag=None, last_modified=None, content_type=None):
+        checksum = hashlib.sha256(payload).hexdigest()
+        object_path = self._object_path(checksum)
+        if not os.path.exists(object_path):
+            _atomic_write(object_path, payload)
+        entry = {
+            'sha256': checksum,
+            'size': len(payload),
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': content_type,
+            'fetched_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        }
+        with self.lock:
+            self.index[url] = entry
+            _atomic_write(self.index_path, json.dumps(self.index, indent=2, sort_keys=True).encode())
+        return entry
+
+class SourceCache:
+    """Fetch source datasets through the snapshot, the local cache and then the network"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, snapshot_dir=None, offline=False, session=None, timeout=30):
+        self.cache = _Store(cache_dir)
+        self.snapshot = _Store(snapshot_dir) if snapshot_dir else None
+        self.offline = offline
+        self.session = session or pooled_session()
+        self.timeout = timeout
+        # Payloads already resolved in this process (fetch_many followed by get)
+        self._resolved = {}
+
+    def get(self, url):
+        """Payload bytes for a url; raises SourceUnavailable if it cannot be had"""
+        payload = self._resolved.get(url)
+        if payload is not None:
+            return payload
+
+        if self.snapshot is not None:
+            payload, _ = self.snapshot.read(url)
+            if payload is not None:
+                self._resolved[url] = payload
+                return payload
+
+        cached, entry = self.cache.read(url)
+        if self.offline:
+            if cached is None:
+                raise SourceUnavailable(f"{url} is not in the snapshot or cache (offline mode)")
+            self._resolved[url] = cached
+            return cached
+
+        headers = {}
+        if cached is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cached is not None:
+                payload = cached
+            else:
+                response.raise_for_status()
+                payload = response.content
+                self.cache.write(url, payload, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                                 response.headers.get('Content-Type'))
+        except requests.RequestException as e:
+            if cached is None:
+                raise SourceUnavailable(f"{url}: {e}") from e
+            print(f"⚠️  {url}: {e} - using cached copy from {entry['fetched_at']}")
+            payload = cached
+
+        self._resolved[url] = payload
+        return payload
+
+    def get_text(self, url, encoding='utf-8'):
+        return self.get(url).decode(encoding)
+
+    def get_json(self, url):
+        return json.loads(self.get(url))
+
+    def fetch_many(self, urls, max_workers=POOL_SIZE):
+        """Resolve several urls concurrently; returns ({url: payload}, {url: error})"""
+        urls = list(dict.fromkeys(urls))
+        results, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+            futures = {url: pool.submit(self.get, url) for url in urls}
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except SourceUnavailable as e:
+                    errors[url] = e
+        return results, errors
+
+def from_env(session=None, timeout=30):
+    """SourceCache configured from GEO_SOURCE_CACHE / GEO_SOURCE_SNAPSHOT / GEO_SOURCE_OFFLINE"""
+    return SourceCache(
+        cache_dir=os.environ.get('GEO_SOURCE_CACHE', DEFAULT_CACHE_DIR),
+        snapshot_dir=os.environ.get('GEO_SOURCE_SNAPSHOT') or None,
+        offline=os.environ.get('GEO_SOURCE_OFFLINE', '') not in ('', '0'),
+        session=session,
+        timeout=timeout
+    )
+
+def snapshot(cache_dir, snapshot_dir):
+    """Copy every valid cache entry into a snapshot directory; returns the urls copied"""
+    source, target = _Store(cache_dir), _Store(snapshot_dir)
+    copied = []
+    for url in sorted(source.index):
+        payload, entry = source.read(url)
+        if payload is None:
+            continue
+        target.write(url, payload, entry.get('etag'), entry.get('last_modified'), entry.get('content_type'))
+        copied.append(url)
+    return copied
+
+def main(argv):
+    command = argv[0] if argv else 'status'
+    cache_dir = os.environ.get('GEO_SOURCE_CACHE', DEFAULT_CACHE_DIR)
+
+    if command == 'status':
+        store = _Store(cache_dir)
+        print(f"📦 Source cache {cache_dir}: {len(store.index)} entries")
+        for url, entry in sorted(store.index.items()):
+            payload, _ = store.read(url)
+            state = '✅' if payload is not None else '❌'
+            print(f"   {state} {entry['sha256'][:12]} {entry['size']:>10,} B  {entry['fetched_at']}  {url}")
+        return 0
+
+    if command == 'snapshot' and len(argv) > 1:
+        copied = snapshot(cache_dir, argv[1])
+        print(f"✅ Wrote {len(copied)} sources to snapshot {argv[1]}")
+        return 0
+
+    if command == 'clear':
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        print(f"🗑️  Removed {cache_dir}")
+        return 0
+
+    print(__doc__)
+    return 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -6,36 +6,174 @@ Temporal Geographical Database Manager
 
 import sqlite3
 import os
-from flask import Flask, request, jsonify, render_template_string
+from flask import Blueprint, Response, request, jsonify, render_template_string
 from datetime import datetime
 import json
+import analytics
+import api_common
+import db_pool
+import deltas
+import export
+import interpolation
+import metrics
+import rollups
+from api_common import MAX_PAGE_SIZE, get_page_args
+from row_shaping import shape_countries
+from ui_scripts import VIRTUAL_LIST_CSS, VIRTUAL_LIST_JS, SEARCH_CLIENT_JS
 
-app = Flask(__name__)
-app.config['DATABASE'] = 'geography_temporal.db'
+# Routes of the temporal API (mounted at / by this module's app, at /v1/temporal by gateway.py)
+api = Blueprint('temporal', __name__)
+
+def served_pool():
+    """Pool for the database file being served (swapped for a new build once its caches are warm)"""
+    return db_pool.serve(api_common.temporal_database(), warmers=[warm_caches])
 
 def get_db():
-    """Get database connection"""
-    db = sqlite3.connect(app.config['DATABASE'])
-    db.row_factory = sqlite3.Row  # Enable dict-like access to rows
-    return db
+    """Get a pooled database connection (rows support dict-like access; close() returns it to the pool)"""
+    return served_pool().connect()
 
-# API ENDPOINTS
+# QUERY HELPERS
+# Shared by the API endpoints and the bootstrap snapshot embedded in the web interface
 
-@app.route('/api/years', methods=['GET'])
-def get_available_years():
-    """Get all available years in the database"""
-    db = get_db()
+def query_years(db):
+    """Get the /api/years payload"""
     cursor = db.execute('SELECT DISTINCT year FROM continents_temporal ORDER BY year DESC')
     years = [row[0] for row in cursor.fetchall()]
-    db.close()
-    
-    return jsonify({
+
+    return {
         'years': years,
         'count': len(years),
         'latest': years[0] if years else None
-    })
+    }
+
+def query_countries(db, year, offset=0, limit=-1):
+    """Get the /api/countries payload for a year (optionally one page of it)"""
+    cursor = db.execute('''
+        SELECT c.*, cont.name as continent_name
+        FROM countries_temporal c
+        JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
+        WHERE c.year = ?
+        ORDER BY cont.name, c.name
+        LIMIT ? OFFSET ?
+    ''', (year, limit, offset))
+
+    countries = shape_countries(cursor)
+
+    if limit < 0 and offset == 0:
+        total = len(countries)
+    else:
+        total = db.execute('SELECT COUNT(*) FROM countries_temporal WHERE year = ?', (year,)).fetchone()[0]
+
+    return {
+        'countries': countries,
+        'count': len(countries),
+        'total': total,
+        'offset': offset,
+        'year': year
+    }
+
+def query_stats(db, year):
+    """Get the /api/stats payload for a year"""
+    # Get continent counts
+    cursor = db.execute('''
+        SELECT cont.name, COUNT(c.country_id) as country_count,
+               SUM(CASE WHEN c.population IS NOT NULL THEN 1 ELSE 0 END) as countries_with_population
+        FROM continents_temporal cont
+        LEFT JOIN countries_temporal c ON cont.continent_id = c.continent_id AND cont.year = c.year
+        WHERE cont.year = ?
+        GROUP BY cont.continent_id, cont.name
+        ORDER BY country_count DESC
+    ''', (year,))
+
+    continent_stats = [dict(row) for row in cursor.fetchall()]
+
+    # Get overall stats
+    cursor = db.execute('''
+        SELECT
+            COUNT(*) as total_countries,
+            SUM(CASE WHEN population IS NOT NULL THEN 1 ELSE 0 END) as countries_with_population,
+            SUM(CASE WHEN population IS NOT NULL THEN population ELSE 0 END) as total_population
+        FROM countries_temporal
+        WHERE year = ?
+    ''', (year,))
+
+    overall_stats = dict(cursor.fetchone())
+
+    return {
+        'year': year,
+        'overall': overall_stats,
+        'by_continent': continent_stats,
+        # Population-weighted religion/race shares, precomputed at ingest (rollups.py)
+        'demographics': rollups.query(db, year)
+    }
+
+# BOOTSTRAP SNAPSHOT
+# The web interface needs years, countries and stats before its first render. Instead of
+# three sequential API round-trips, the index route inlines them from this snapshot, which
+# is rebuilt only when the database file changes.
+
+_bootstrap_cache = {}
+
+# Rows per page the web interface's country list fetches (the snapshot holds the first page)
+COUNTRY_PAGE_SIZE = 100
+
+def database_signature(pool=None):
+    """Identify the served database contents by path and file fingerprint"""
+    pool = pool or served_pool()
+    return (pool.path, pool.version)
+
+def build_bootstrap_snapshot(db):
+    """Initial UI state (years, first page of the latest year's countries, stats) read from one connection"""
+    years = query_years(db)
+    year = years['latest'] or 2025
+    return {
+        'year': year,
+        'years': years,
+        'countries': query_countries(db, year, 0, COUNTRY_PAGE_SIZE),
+        'stats': query_stats(db, year)
+    }
+
+def get_bootstrap_snapshot(pool=None):
+    """Get the initial UI state (years, latest year's countries and stats)"""
+    pool = pool or served_pool()
+    signature = database_signature(pool)
+    snapshot = _bootstrap_cache.get(signature)
+    metrics.record_cache('bootstrap', snapshot is not None)
+    if snapshot is not None:
+        return snapshot
+
+    db = pool.connect()
+    try:
+        snapshot = build_bootstrap_snapshot(db)
+    finally:
+        db.close()
+
+    # The previous version stays: requests still on the old file during a swap read it
+    for stale in list(_bootstrap_cache)[:-1]:
+        del _bootstrap_cache[stale]
+    _bootstrap_cache[signature] = snapshot
+    return snapshot
+
+def warm_caches(pool):
+    """Fill the in-process caches from a newly built database file before it is swapped in"""
+    path = pool.path
+    get_bootstrap_snapshot(pool)
+    interpolation.load(path, pool.file)
+    if analytics.np is not None:
+        analytics.load(path, pool.file)
 
-@app.route('/api/continents', methods=['GET'])
+# API ENDPOINTS
+
+@api.route('/api/years', methods=['GET'])
+def get_available_years():
+    """Get all available years in the database"""
+    db = get_db()
+    years = query_years(db)
+    db.close()
+
+    return jsonify(years)
+
+@api.route('/api/continents', methods=['GET'])
 def get_continents():
     """Get all continents for a specific year"""
     year = request.args.get('year', 2025, type=int)
@@ -56,80 +194,59 @@ def get_continents():
         'year': year
     })
 
-@app.route('/api/countries', methods=['GET'])
+@api.route('/api/countries', methods=['GET'])
 def get_all_countries():
     """Get all countries with continent info for a specific year"""
+    if request.args.get('interpolate') in ('1', 'true'):
+        return get_interpolated_countries()
+
     year = request.args.get('year', 2025, type=int)
+    offset, limit = get_page_args()
     
     db = get_db()
-    cursor = db.execute('''
-        SELECT c.*, cont.name as continent_name 
-        FROM countries_temporal c 
-        JOIN continents_temporal cont ON c.continent_id = cont.continent_id AND c.year = cont.year
-        WHERE c.year = ?
-        ORDER BY cont.name, c.name
-    ''', (year,))
-    
-    countries = []
-    for row in cursor.fetchall():
-        country = dict(row)
-        # Group religious data into a nested object for cleaner API response
-        if 'religion_christian_percent' in country:
-            country['religious_distribution'] = {
-                'christian_percent': country.get('religion_christian_percent', 0) or 0,
-                'muslim_percent': country.get('religion_muslim_percent', 0) or 0,
-                'hindu_percent': country.get('religion_hindu_percent', 0) or 0,
-                'buddhist_percent': country.get('religion_buddhist_percent', 0) or 0,
-                'jewish_percent': country.get('religion_jewish_percent', 0) or 0,
-                'other_percent': country.get('religion_other_percent', 0) or 0,
-                'nonreligious_percent': country.get('religion_nonreligious_percent', 0) or 0
-            }
-            # Remove individual religion fields to clean up response
-            for key in list(country.keys()):
-                if key.startswith('religion_'):
-                    del country[key]
-        
-        # Group race/ethnicity data into a nested object for cleaner API response
-        if 'race_white_percent' in country:
-            country['racial_ethnic_distribution'] = {
-                'white_percent': country.get('race_white_percent', 0) or 0,
-                'black_percent': country.get('race_black_percent', 0) or 0,
-                'asian_percent': country.get('race_asian_percent', 0) or 0,
-                'hispanic_percent': country.get('race_hispanic_percent', 0) or 0,
-                'native_american_percent': country.get('race_native_american_percent', 0) or 0,
-                'pacific_islander_percent': country.get('race_pacific_islander_percent', 0) or 0,
-                'other_percent': country.get('race_other_percent', 0) or 0
-            }
-            # Remove individual race fields to clean up response
-            for key in list(country.keys()):
-                if key.startswith('race_'):
-                    del country[key]
-        
-        # Handle territories data
-        if 'territories' in country and country['territories']:
-            territories_list = [t.strip() for t in country['territories'].split(',')]
-            country['administrative_divisions'] = {
-                'territories': territories_list,
-                'count': len(territories_list)
-            }
-            # Keep territories field for backward compatibility but also provide structured data
-        elif 'territories' in country:
-            country['administrative_divisions'] = {
-                'territories': [],
-                'count': 0
-            }
-        
-        countries.append(country)
-    
+    countries = query_countries(db, year, offset, limit)
     db.close()
     
-    return jsonify({
-        'countries': countries,
-        'count': len(countries),
-        'year': year
-    })
+    return jsonify(countries)
+
+def get_interpolated_countries():
+    """Countries at a fractional year or date (?year=2019.5 or ?date=2021-07-01) with estimated populations
+
+    Rows come from the nearest stored year; populations are interpolated/extrapolated
+    (?method=linear|exponential, see interpolation.py) and marked in population_source.
+    """
+    method = request.args.get('method', 'linear')
+    offset, limit = get_page_args()
+    try:
+        t = interpolation.fractional_year(request.args.get('date') or request.args.get('year', '2025'))
+        series = interpolation.load(api_common.temporal_database())
+        if method not in interpolation.METHODS:
+            raise interpolation.InterpolationError(
+                f"Unknown method '{method}' (expected one of: {', '.join(interpolation.METHODS)})")
+    except interpolation.InterpolationError as e:
+        return jsonify({'error': str(e)}), 400
 
-@app.route('/api/continents/<int:continent_id>/countries', methods=['GET'])
+    base_year = series.nearest_year(t)
+    db = get_db()
+    payload = query_countries(db, base_year, offset, limit)
+    db.close()
+
+    for country in payload['countries']:
+        population, source = series.estimate(country['country_id'], t, method)
+        if population is None and t == base_year and country['population'] is not None:
+            # Stored values the series skips (zero populations) still answer their own year
+            population, source = country['population'], 'stored'
+        country['population'], country['population_source'] = population, source
+
+    payload['year'] = t
+    payload['interpolation'] = {
+        'method': method,
+        'base_year': base_year,
+        'max_extrapolation_years': interpolation.MAX_EXTRAPOLATION_YEARS
+    }
+    return jsonify(payload)
+
+@api.route('/api/continents/<int:continent_id>/countries', methods=['GET'])
 def get_countries_by_continent(continent_id):
     """Get all countries in a continent for a specific year"""
     year = request.args.get('year', 2025, type=int)
@@ -153,7 +270,7 @@ def get_countries_by_continent(continent_id):
         'year': year
     })
 
-@app.route('/api/country/<name>/timeline', methods=['GET'])
+@api.route('/api/country/<name>/timeline', methods=['GET'])
 def get_country_timeline(name):
     """Get a country's data across all years"""
     db = get_db()
@@ -179,7 +296,7 @@ def get_country_timeline(name):
         'years': len(timeline)
     })
 
-@app.route('/api/search', methods=['GET'])
+@api.route('/api/search', methods=['GET'])
 def search_locations():
     """Search for locations by name in a specific year"""
     query = request.args.get('q', '').strip()
@@ -225,45 +342,114 @@ def search_locations():
         'total_results': total_results
     })
 
-@app.route('/api/stats', methods=['GET'])
+@api.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get database statistics for a specific year"""
     year = request.args.get('year', 2025, type=int)
     
     db = get_db()
-    
-    # Get continent counts
-    cursor = db.execute('''
-        SELECT cont.name, COUNT(c.country_id) as country_count,
-               SUM(CASE WHEN c.population IS NOT NULL THEN 1 ELSE 0 END) as countries_with_population
-        FROM continents_temporal cont
-        LEFT JOIN countries_temporal c ON cont.continent_id = c.continent_id AND cont.year = c.year
-        WHERE cont.year = ?
-        GROUP BY cont.continent_id, cont.name
-        ORDER BY country_count DESC
-    ''', (year,))
-    
-    continent_stats = [dict(row) for row in cursor.fetchall()]
-    
-    # Get overall stats
-    cursor = db.execute('''
-        SELECT 
-            COUNT(*) as total_countries,
-            SUM(CASE WHEN population IS NOT NULL THEN 1 ELSE 0 END) as countries_with_population,
-            SUM(CASE WHEN population IS NOT NULL THEN population ELSE 0 END) as total_population
-        FROM countries_temporal 
-        WHERE year = ?
-    ''', (year,))
-    
-    overall_stats = dict(cursor.fetchone())
+    stats = query_stats(db, year)
     db.close()
-    
+
+    return jsonify(stats)
+
+def analytics_response(compute):
+    """jsonify compute(matrix) over the cached analytics matrix; errors become JSON (501 without numpy)"""
+    try:
+        return jsonify(compute(analytics.load(api_common.temporal_database())))
+    except analytics.AnalyticsError as e:
+        return jsonify({'error': str(e)}), 501 if analytics.np is None else 404
+
+@api.route('/api/analytics/totals', methods=['GET'])
+def get_analytics_totals():
+    """World and continent population totals and coverage for every year"""
+    return analytics_response(lambda matrix: {'years': analytics.totals(matrix)})
+
+@api.route('/api/analytics/growth', methods=['GET'])
+def get_analytics_growth():
+    """Year-over-year growth rates, plus the fastest growing/shrinking countries of one year"""
+    year = request.args.get('year', type=int)
+    n = min(max(request.args.get('n', 10, type=int), 1), MAX_PAGE_SIZE)
+    return analytics_response(lambda matrix: analytics.growth(matrix, year, n))
+
+@api.route('/api/analytics/demographics', methods=['GET'])
+def get_analytics_demographics():
+    """Population-weighted religion and race/ethnicity shares per continent and world"""
+    year = request.args.get('year', type=int)
+    return analytics_response(lambda matrix: {'years': analytics.demographic_averages(matrix, year)})
+
+@api.route('/api/analytics/top', methods=['GET'])
+def get_analytics_top():
+    """Most populous countries of every year (or ?year=)"""
+    year = request.args.get('year', type=int)
+    n = min(max(request.args.get('n', 10, type=int), 1), MAX_PAGE_SIZE)
+    return analytics_response(lambda matrix: {'years': analytics.top_countries(matrix, n, year)})
+
+@api.route('/api/changes', methods=['GET'])
+def get_changes():
+    """Per-country change of a metric between two years, sorted (default: largest magnitude first)"""
+    metric = request.args.get('metric', 'population')
+    sort = request.args.get('sort', 'magnitude')
+    order = request.args.get('order', 'desc')
+    offset, limit = get_page_args()
+    if limit < 0:
+        limit = request.args.get('limit', 10, type=int)
+    if metric not in deltas.METRICS or sort not in deltas.SORTS or order not in ('asc', 'desc'):
+        return jsonify({'error': f"Expected metric in {list(deltas.METRICS)}, sort in {list(deltas.SORTS)}, "
+                                 f"order in ['asc', 'desc']"}), 400
+
+    try:
+        series = deltas.load(api_common.temporal_database(), metric)
+        from_year = request.args.get('from', series.years[0] if series.years else None, type=int)
+        to_year = request.args.get('to', series.years[-1] if series.years else None, type=int)
+        changes, total = series.page(from_year, to_year, sort, order == 'desc', limit, offset)
+    except deltas.ChangesError as e:
+        return jsonify({'error': str(e)}), 404
+
     return jsonify({
-        'year': year,
-        'overall': overall_stats,
-        'by_continent': continent_stats
+        'metric': metric,
+        'from': from_year,
+        'to': to_year,
+        'sort': sort,
+        'order': order,
+        'changes': changes,
+        'count': len(changes),
+        'total': total,
+        'offset': offset
     })
 
+@api.route('/api/export', methods=['GET'])
+def export_countries():
+    """Stream the temporal countries table (or a year/continent/country slice) as CSV, Arrow or Parquet"""
+    fmt = request.args.get('format', 'csv')
+    filters = {
+        'year': request.args.get('year', type=int),
+        'continent_id': request.args.get('continent_id', type=int),
+        'country': request.args.get('country')
+    }
+
+    db = get_db()
+    chunks = export.iter_export(db, fmt, **filters)
+    try:
+        # Start the export here so format/dependency errors become a JSON error, not a broken stream
+        first = next(chunks, b'')
+    except export.ExportError as e:
+        db.close()
+        status = 400 if fmt not in export.FORMATS else 501
+        return jsonify({'error': str(e)}), status
+
+    def generate():
+        try:
+            yield first
+            yield from chunks
+        finally:
+            db.close()
+
+    mimetype = export.FORMATS[fmt][0]
+    filename = export.export_filename(fmt, **filters)
+    return Response(generate(), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
 # WEB INTERFACE HTML TEMPLATE
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -416,6 +602,7 @@ HTML_TEMPLATE = """
         }
         .error { color: #dc3545; padding: 20px; text-align: center; }
         .loading { text-align: center; padding: 40px; color: #6c757d; }
+{{ virtual_list_css|safe }}
     </style>
 </head>
 <body>
@@ -461,37 +648,46 @@ HTML_TEMPLATE = """
     </div>
 
     <script>
-        let currentYear = 2025;
+{{ virtual_list_js|safe }}
+{{ search_client_js|safe }}
+        // Where this page's API is mounted ('' standalone, /v1/temporal in the gateway)
+        const API_BASE = {{ api_base|tojson }};
+        
+        // Initial state inlined by the server so the first render needs no API round-trips
+        const BOOTSTRAP = {{ bootstrap|tojson }};
+        const COUNTRY_PAGE_SIZE = {{ country_page_size }};
+        let currentYear = BOOTSTRAP.year;
         
         // Initialize the application
         document.addEventListener('DOMContentLoaded', function() {
-            loadAvailableYears();
+            document.getElementById('current-year').textContent = `Year: ${currentYear}`;
+            renderYears(BOOTSTRAP.years);
+            loadCountries();
+            renderStats(BOOTSTRAP.stats);
         });
         
         function loadAvailableYears() {
-            fetch('/api/years')
+            fetch(`${API_BASE}/api/years`)
                 .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('year-buttons');
-                    container.innerHTML = '';
-                    
-                    data.years.forEach(year => {
-                        const btn = document.createElement('button');
-                        btn.className = `year-btn ${year === currentYear ? 'active' : ''}`;
-                        btn.textContent = year;
-                        btn.onclick = () => selectYear(year);
-                        container.appendChild(btn);
-                    });
-                    
-                    // Load initial data
-                    loadCountries();
-                    loadStats();
-                })
+                .then(renderYears)
                 .catch(error => {
                     console.error('Error loading years:', error);
                 });
         }
         
+        function renderYears(data) {
+            const container = document.getElementById('year-buttons');
+            container.innerHTML = '';
+            
+            data.years.forEach(year => {
+                const btn = document.createElement('button');
+                btn.className = `year-btn ${year === currentYear ? 'active' : ''}`;
+                btn.textContent = year;
+                btn.onclick = () => selectYear(year);
+                container.appendChild(btn);
+            });
+        }
+        
         function selectYear(year) {
             currentYear = year;
             document.getElementById('current-year').textContent = `Year: ${year}`;
@@ -526,215 +722,226 @@ HTML_TEMPLATE = """
         }
         
         function loadCountries() {
-            document.getElementById('countries-container').innerHTML = '<div class="loading">Loading countries...</div>';
+            const container = document.getElementById('countries-container');
+            container.classList.remove('loading');
+            loadPagedList(container, `${API_BASE}/api/countries?year=${currentYear}`, 'countries', {
+                // Fixed height for paged rows: name, population and capital, religion, race, territories, timeline link
+                rowHeight: 166,
+                pageSize: COUNTRY_PAGE_SIZE,
+                firstPage: currentYear === BOOTSTRAP.year ? BOOTSTRAP.countries : null,
+                renderRow: renderCountryRow
+            }).catch(error => {
+                container.innerHTML = '<div class="error">Error loading countries</div>';
+            });
+        }
+        
+        function renderCountryRow(country) {
+            // Build religious distribution display
+            let religionText = '';
+            if (country.religious_distribution) {
+                const religions = [];
+                const rd = country.religious_distribution;
+                if (rd.christian_percent > 0) religions.push(`Christian: ${rd.christian_percent}%`);
+                if (rd.muslim_percent > 0) religions.push(`Muslim: ${rd.muslim_percent}%`);
+                if (rd.hindu_percent > 0) religions.push(`Hindu: ${rd.hindu_percent}%`);
+                if (rd.buddhist_percent > 0) religions.push(`Buddhist: ${rd.buddhist_percent}%`);
+                if (rd.jewish_percent > 0) religions.push(`Jewish: ${rd.jewish_percent}%`);
+                if (rd.other_percent > 0) religions.push(`Other: ${rd.other_percent}%`);
+                if (rd.nonreligious_percent > 0) religions.push(`Non-religious: ${rd.nonreligious_percent}%`);
+                religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
+            }
             
-            fetch(`/api/countries?year=${currentYear}`)
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('countries-container');
-                    container.innerHTML = '';
-                    
-                    // Group countries by continent
-                    const continents = {};
-                    data.countries.forEach(country => {
-                        if (!continents[country.continent_name]) {
-                            continents[country.continent_name] = [];
-                        }
-                        continents[country.continent_name].push(country);
-                    });
-                    
-                    // Display by continent
-                    Object.keys(continents).sort().forEach(continentName => {
-                        const section = document.createElement('div');
-                        section.innerHTML = `<h4>${continentName} (${continents[continentName].length} countries)</h4>`;
-                        
-                        continents[continentName].forEach(country => {
-                            const div = document.createElement('div');
-                            div.className = 'location';
-                            
-                            // Build religious distribution display
-                            let religionText = '';
-                            if (country.religious_distribution) {
-                                const religions = [];
-                                const rd = country.religious_distribution;
-                                if (rd.christian_percent > 0) religions.push(`Christian: ${rd.christian_percent}%`);
-                                if (rd.muslim_percent > 0) religions.push(`Muslim: ${rd.muslim_percent}%`);
-                                if (rd.hindu_percent > 0) religions.push(`Hindu: ${rd.hindu_percent}%`);
-                                if (rd.buddhist_percent > 0) religions.push(`Buddhist: ${rd.buddhist_percent}%`);
-                                if (rd.jewish_percent > 0) religions.push(`Jewish: ${rd.jewish_percent}%`);
-                                if (rd.other_percent > 0) religions.push(`Other: ${rd.other_percent}%`);
-                                if (rd.nonreligious_percent > 0) religions.push(`Non-religious: ${rd.nonreligious_percent}%`);
-                                religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
-                            }
-                            
-                            // Build race/ethnicity distribution display
-                            let raceText = '';
-                            if (country.racial_ethnic_distribution) {
-                                const races = [];
-                                const red = country.racial_ethnic_distribution;
-                                if (red.white_percent > 0) races.push(`White: ${red.white_percent}%`);
-                                if (red.black_percent > 0) races.push(`Black: ${red.black_percent}%`);
-                                if (red.asian_percent > 0) races.push(`Asian: ${red.asian_percent}%`);
-                                if (red.hispanic_percent > 0) races.push(`Hispanic: ${red.hispanic_percent}%`);
-                                if (red.native_american_percent > 0) races.push(`Native: ${red.native_american_percent}%`);
-                                if (red.pacific_islander_percent > 0) races.push(`Pacific: ${red.pacific_islander_percent}%`);
-                                if (red.other_percent > 0) races.push(`Other: ${red.other_percent}%`);
-                                raceText = races.length > 0 ? `<br><small style="color: #666;">🌍 ${races.join(', ')}</small>` : '';
-                            }
-                            
-                            // Build territories/administrative divisions display
-                            let territoriesText = '';
-                            if (country.administrative_divisions && country.administrative_divisions.count > 0) {
-                                const count = country.administrative_divisions.count;
-                                const firstFew = country.administrative_divisions.territories.slice(0, 3).join(', ');
-                                const remaining = count > 3 ? ` (+${count - 3} more)` : '';
-                                territoriesText = `<br><small style="color: #666;">🏛️ Territories (${count}): ${firstFew}${remaining}</small>`;
-                            }
-                            
-                            const populationText = country.population ? country.population.toLocaleString() : 'No data';
-                            const capitalText = country.capital ? `<br><small>🏛️ Capital: ${country.capital}</small>` : '';
-                            
-                            div.innerHTML = `
-                                <strong>${country.name}</strong> (${country.code_iso2 || 'N/A'})<br>
-                                <small>Population: ${populationText}</small>
-                                ${capitalText}
-                                ${religionText}
-                                ${raceText}
-                                ${territoriesText}
-                                <br><small style="color: #007bff; cursor: pointer;" onclick="loadCountryTimeline('${country.name}')">📊 View Timeline</small>
-                            `;
-                            section.appendChild(div);
-                        });
-                        container.appendChild(section);
-                    });
-                })
-                .catch(error => {
-                    document.getElementById('countries-container').innerHTML = '<div class="error">Error loading countries</div>';
-                });
+            // Build race/ethnicity distribution display
+            let raceText = '';
+            if (country.racial_ethnic_distribution) {
+                const races = [];
+                const red = country.racial_ethnic_distribution;
+                if (red.white_percent > 0) races.push(`White: ${red.white_percent}%`);
+                if (red.black_percent > 0) races.push(`Black: ${red.black_percent}%`);
+                if (red.asian_percent > 0) races.push(`Asian: ${red.asian_percent}%`);
+                if (red.hispanic_percent > 0) races.push(`Hispanic: ${red.hispanic_percent}%`);
+                if (red.native_american_percent > 0) races.push(`Native: ${red.native_american_percent}%`);
+                if (red.pacific_islander_percent > 0) races.push(`Pacific: ${red.pacific_islander_percent}%`);
+                if (red.other_percent > 0) races.push(`Other: ${red.other_percent}%`);
+                raceText = races.length > 0 ? `<br><small style="color: #666;">🌍 ${races.join(', ')}</small>` : '';
+            }
+            
+            // Build territories/administrative divisions display
+            let territoriesText = '';
+            if (country.administrative_divisions && country.administrative_divisions.count > 0) {
+                const count = country.administrative_divisions.count;
+                const firstFew = country.administrative_divisions.territories.slice(0, 3).join(', ');
+                const remaining = count > 3 ? ` (+${count - 3} more)` : '';
+                territoriesText = `<br><small style="color: #666;">🏛️ Territories (${count}): ${firstFew}${remaining}</small>`;
+            }
+            
+            const populationText = country.population ? country.population.toLocaleString() : 'No data';
+            const capitalText = country.capital ? ` | 🏛️ Capital: ${country.capital}` : '';
+            
+            return `
+                <div class="location">
+                    <strong>${country.name}</strong> (${country.code_iso2 || 'N/A'}) <small style="color: #666;">${country.continent_name}</small><br>
+                    <small>Population: ${populationText}${capitalText}</small>
+                    ${religionText}
+                    ${raceText}
+                    ${territoriesText}
+                    <br><small style="color: #007bff; cursor: pointer;" onclick="loadCountryTimeline('${country.name}')">📊 View Timeline</small>
+                </div>
+            `;
         }
         
         function loadStats() {
+            if (currentYear === BOOTSTRAP.year) {
+                renderStats(BOOTSTRAP.stats);
+                return;
+            }
+            
             document.getElementById('stats-container').innerHTML = '<div class="loading">Loading statistics...</div>';
             
-            fetch(`/api/stats?year=${currentYear}`)
+            fetch(`${API_BASE}/api/stats?year=${currentYear}`)
                 .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('stats-container');
-                    container.innerHTML = '';
-                    
-                    // Overall stats
-                    const overallDiv = document.createElement('div');
-                    overallDiv.innerHTML = `<h3>📊 Overall Statistics for ${data.year}</h3>`;
-                    
-                    const statsGrid = document.createElement('div');
-                    statsGrid.className = 'stats-grid';
-                    
-                    const totalCountriesCard = document.createElement('div');
-                    totalCountriesCard.className = 'stat-card';
-                    totalCountriesCard.innerHTML = `
-                        <div class="stat-number">${data.overall.total_countries}</div>
-                        <div>Total Countries</div>
-                    `;
-                    
-                    const withPopulationCard = document.createElement('div');
-                    withPopulationCard.className = 'stat-card';
-                    withPopulationCard.innerHTML = `
-                        <div class="stat-number">${data.overall.countries_with_population}</div>
-                        <div>Countries with Population Data</div>
-                    `;
-                    
-                    const totalPopulationCard = document.createElement('div');
-                    totalPopulationCard.className = 'stat-card';
-                    totalPopulationCard.innerHTML = `
-                        <div class="stat-number">${data.overall.total_population.toLocaleString()}</div>
-                        <div>Total Population</div>
-                    `;
-                    
-                    statsGrid.appendChild(totalCountriesCard);
-                    statsGrid.appendChild(withPopulationCard);
-                    statsGrid.appendChild(totalPopulationCard);
-                    
-                    container.appendChild(overallDiv);
-                    container.appendChild(statsGrid);
-                    
-                    // By continent stats
-                    const continentDiv = document.createElement('div');
-                    continentDiv.innerHTML = `<h3>🌍 By Continent</h3>`;
-                    
-                    data.by_continent.forEach(continent => {
-                        const div = document.createElement('div');
-                        div.className = 'location';
-                        div.innerHTML = `
-                            <strong>${continent.name}</strong><br>
-                            <small>Countries: ${continent.country_count} | With Population Data: ${continent.countries_with_population}</small>
-                        `;
-                        continentDiv.appendChild(div);
-                    });
-                    
-                    container.appendChild(continentDiv);
-                })
+                .then(renderStats)
                 .catch(error => {
                     document.getElementById('stats-container').innerHTML = '<div class="error">Error loading statistics</div>';
                 });
         }
         
+        function renderStats(data) {
+            const container = document.getElementById('stats-container');
+            container.innerHTML = '';
+            
+            // Overall stats
+            const overallDiv = document.createElement('div');
+            overallDiv.innerHTML = `<h3>📊 Overall Statistics for ${data.year}</h3>`;
+            
+            const statsGrid = document.createElement('div');
+            statsGrid.className = 'stats-grid';
+            
+            const totalCountriesCard = document.createElement('div');
+            totalCountriesCard.className = 'stat-card';
+            totalCountriesCard.innerHTML = `
+                <div class="stat-number">${data.overall.total_countries}</div>
+                <div>Total Countries</div>
+            `;
+            
+            const withPopulationCard = document.createElement('div');
+            withPopulationCard.className = 'stat-card';
+            withPopulationCard.innerHTML = `
+                <div class="stat-number">${data.overall.countries_with_population}</div>
+                <div>Countries with Population Data</div>
+            `;
+            
+            const totalPopulationCard = document.createElement('div');
+            totalPopulationCard.className = 'stat-card';
+            totalPopulationCard.innerHTML = `
+                <div class="stat-number">${data.overall.total_population.toLocaleString()}</div>
+                <div>Total Population</div>
+            `;
+            
+            statsGrid.appendChild(totalCountriesCard);
+            statsGrid.appendChild(withPopulationCard);
+            statsGrid.appendChild(totalPopulationCard);
+            
+            container.appendChild(overallDiv);
+            container.appendChild(statsGrid);
+            
+            // By continent stats
+            const continentDiv = document.createElement('div');
+            continentDiv.innerHTML = `<h3>🌍 By Continent</h3>`;
+            
+            data.by_continent.forEach(continent => {
+                const div = document.createElement('div');
+                div.className = 'location';
+                div.innerHTML = `
+                    <strong>${continent.name}</strong><br>
+                    <small>Countries: ${continent.country_count} | With Population Data: ${continent.countries_with_population}</small>
+                `;
+                continentDiv.appendChild(div);
+            });
+            
+            container.appendChild(continentDiv);
+        }
+        
+        const searchClient = new SearchClient({
+            url: (query, year) => `${API_BASE}/api/search?q=${encodeURIComponent(query)}&year=${year}`,
+            narrow: (data, query) => {
+                const results = {
+                    continents: data.results.continents.filter(item => matchesQuery(item.name, query)),
+                    countries: data.results.countries.filter(item => matchesQuery(item.name, query))
+                };
+                return Object.assign({}, data, {
+                    query: query,
+                    results: results,
+                    total_results: results.continents.length + results.countries.length
+                });
+            }
+        });
+        
+        // Timelines match the country name exactly, so they are cached but never narrowed
+        const timelineClient = new SearchClient({
+            url: countryName => `${API_BASE}/api/country/${encodeURIComponent(countryName)}/timeline`,
+            normalize: countryName => countryName
+        });
+        
         function performSearch() {
             const query = document.getElementById('searchInput').value.trim();
             if (query.length < 2) {
+                searchClient.cancel();
                 document.getElementById('search-results').innerHTML = '';
                 return;
             }
             
-            fetch(`/api/search?q=${encodeURIComponent(query)}&year=${currentYear}`)
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('search-results');
-                    container.innerHTML = '';
-                    
-                    if (data.total_results === 0) {
-                        container.innerHTML = `<div>No results found for "${query}" in ${data.year}</div>`;
-                        return;
-                    }
+            searchClient.search(query, currentYear, data => renderSearchResults(query, data));
+        }
+        
+        function renderSearchResults(query, data) {
+            const container = document.getElementById('search-results');
+            container.innerHTML = '';
+            
+            if (data.total_results === 0) {
+                container.innerHTML = `<div>No results found for "${query}" in ${data.year}</div>`;
+                return;
+            }
+            
+            ['continents', 'countries'].forEach(category => {
+                if (data.results[category].length > 0) {
+                    const section = document.createElement('div');
+                    section.innerHTML = `<h4>${category.toUpperCase()} (${data.results[category].length})</h4>`;
                     
-                    ['continents', 'countries'].forEach(category => {
-                        if (data.results[category].length > 0) {
-                            const section = document.createElement('div');
-                            section.innerHTML = `<h4>${category.toUpperCase()} (${data.results[category].length})</h4>`;
-                            
-                            data.results[category].forEach(item => {
-                                const div = document.createElement('div');
-                                div.className = 'location';
-                                
-                                if (category === 'countries') {
-                                    const populationText = item.population ? item.population.toLocaleString() : 'No data';
-                                    const capitalText = item.capital ? ` | Capital: ${item.capital}` : '';
-                                    div.innerHTML = `
-                                        <strong>${item.name}</strong> (${item.code_iso2 || 'N/A'})<br>
-                                        <small>Continent: ${item.continent_name} | Population: ${populationText}${capitalText}</small>
-                                        <br><small style="color: #007bff; cursor: pointer;" onclick="loadCountryTimeline('${item.name}')">📊 View Timeline</small>
-                                    `;
-                                } else {
-                                    div.innerHTML = `
-                                        <strong>${item.name}</strong><br>
-                                        <small>Code: ${item.code || 'N/A'}</small>
-                                    `;
-                                }
-                                section.appendChild(div);
-                            });
-                            container.appendChild(section);
+                    data.results[category].forEach(item => {
+                        const div = document.createElement('div');
+                        div.className = 'location';
+                        
+                        if (category === 'countries') {
+                            const populationText = item.population ? item.population.toLocaleString() : 'No data';
+                            const capitalText = item.capital ? ` | Capital: ${item.capital}` : '';
+                            div.innerHTML = `
+                                <strong>${item.name}</strong> (${item.code_iso2 || 'N/A'})<br>
+                                <small>Continent: ${item.continent_name} | Population: ${populationText}${capitalText}</small>
+                                <br><small style="color: #007bff; cursor: pointer;" onclick="loadCountryTimeline('${item.name}')">📊 View Timeline</small>
+                            `;
+                        } else {
+                            div.innerHTML = `
+                                <strong>${item.name}</strong><br>
+                                <small>Code: ${item.code || 'N/A'}</small>
+                            `;
                         }
+                        section.appendChild(div);
                     });
-                });
+                    container.appendChild(section);
+                }
+            });
         }
         
         function loadTimeline() {
             const country = document.getElementById('timelineInput').value.trim();
             if (country.length < 2) {
+                timelineClient.cancel();
                 document.getElementById('timeline-container').innerHTML = '';
                 return;
             }
             
-            loadCountryTimeline(country);
+            timelineClient.search(country, '', data => renderTimeline(country, data), () => showTimelineError(country));
         }
         
         function loadCountryTimeline(countryName) {
@@ -742,89 +949,114 @@ HTML_TEMPLATE = """
             showTab('timeline');
             document.getElementById('timelineInput').value = countryName;
             
-            fetch(`/api/country/${encodeURIComponent(countryName)}/timeline`)
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('timeline-container');
-                    container.innerHTML = '';
-                    
-                    if (data.timeline.length === 0) {
-                        container.innerHTML = `<div>No data found for "${countryName}"</div>`;
-                        return;
-                    }
-                    
-                    const header = document.createElement('div');
-                    header.innerHTML = `<h3>📈 ${data.country} Timeline (${data.years} years)</h3>`;
-                    container.appendChild(header);
-                    
-                    data.timeline.forEach(yearData => {
-                        const div = document.createElement('div');
-                        div.className = 'location';
-                        
-                        const populationText = yearData.population ? yearData.population.toLocaleString() : 'No data';
-                        const capitalText = yearData.capital ? `<br><small>🏛️ Capital: ${yearData.capital}</small>` : '';
-                        
-                        // Build religious data if available
-                        let religionText = '';
-                        if (yearData.religion_christian_percent !== null) {
-                            const religions = [];
-                            if (yearData.religion_christian_percent > 0) religions.push(`Christian: ${yearData.religion_christian_percent}%`);
-                            if (yearData.religion_muslim_percent > 0) religions.push(`Muslim: ${yearData.religion_muslim_percent}%`);
-                            if (yearData.religion_hindu_percent > 0) religions.push(`Hindu: ${yearData.religion_hindu_percent}%`);
-                            if (yearData.religion_buddhist_percent > 0) religions.push(`Buddhist: ${yearData.religion_buddhist_percent}%`);
-                            if (yearData.religion_jewish_percent > 0) religions.push(`Jewish: ${yearData.religion_jewish_percent}%`);
-                            if (yearData.religion_other_percent > 0) religions.push(`Other: ${yearData.religion_other_percent}%`);
-                            if (yearData.religion_nonreligious_percent > 0) religions.push(`Non-religious: ${yearData.religion_nonreligious_percent}%`);
-                            religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
-                        }
-                        
-                        // Build race/ethnicity data if available
-                        let raceText = '';
-                        if (yearData.race_white_percent !== null) {
-                            const races = [];
-                            if (yearData.race_white_percent > 0) races.push(`White: ${yearData.race_white_percent}%`);
-                            if (yearData.race_black_percent > 0) races.push(`Black: ${yearData.race_black_percent}%`);
-                            if (yearData.race_asian_percent > 0) races.push(`Asian: ${yearData.race_asian_percent}%`);
-                            if (yearData.race_hispanic_percent > 0) races.push(`Hispanic: ${yearData.race_hispanic_percent}%`);
-                            if (yearData.race_native_american_percent > 0) races.push(`Native: ${yearData.race_native_american_percent}%`);
-                            if (yearData.race_pacific_islander_percent > 0) races.push(`Pacific: ${yearData.race_pacific_islander_percent}%`);
-                            if (yearData.race_other_percent > 0) races.push(`Other: ${yearData.race_other_percent}%`);
-                            raceText = races.length > 0 ? `<br><small style="color: #666;">🌍 ${races.join(', ')}</small>` : '';
-                        }
-                        
-                        div.innerHTML = `
-                            <strong>${yearData.year}</strong><br>
-                            <small>Population: ${populationText}</small>
-                            ${capitalText}
-                            ${religionText}
-                            ${raceText}
-                        `;
-                        container.appendChild(div);
-                    });
-                })
-                .catch(error => {
-                    document.getElementById('timeline-container').innerHTML = `<div class="error">Error loading timeline for "${countryName}"</div>`;
-                });
+            timelineClient.run(countryName, '', data => renderTimeline(countryName, data), () => showTimelineError(countryName));
+        }
+        
+        function showTimelineError(countryName) {
+            document.getElementById('timeline-container').innerHTML = `<div class="error">Error loading timeline for "${countryName}"</div>`;
+        }
+        
+        function renderTimeline(countryName, data) {
+            const container = document.getElementById('timeline-container');
+            container.innerHTML = '';
+            
+            if (data.timeline.length === 0) {
+                container.innerHTML = `<div>No data found for "${countryName}"</div>`;
+                return;
+            }
+            
+            const header = document.createElement('div');
+            header.innerHTML = `<h3>📈 ${data.country} Timeline (${data.years} years)</h3>`;
+            container.appendChild(header);
+            
+            data.timeline.forEach(yearData => {
+                const div = document.createElement('div');
+                div.className = 'location';
+                
+                const populationText = yearData.population ? yearData.population.toLocaleString() : 'No data';
+                const capitalText = yearData.capital ? `<br><small>🏛️ Capital: ${yearData.capital}</small>` : '';
+                
+                // Build religious data if available
+                let religionText = '';
+                if (yearData.religion_christian_percent !== null) {
+                    const religions = [];
+                    if (yearData.religion_christian_percent > 0) religions.push(`Christian: ${yearData.religion_christian_percent}%`);
+                    if (yearData.religion_muslim_percent > 0) religions.push(`Muslim: ${yearData.religion_muslim_percent}%`);
+                    if (yearData.religion_hindu_percent > 0) religions.push(`Hindu: ${yearData.religion_hindu_percent}%`);
+                    if (yearData.religion_buddhist_percent > 0) religions.push(`Buddhist: ${yearData.religion_buddhist_percent}%`);
+                    if (yearData.religion_jewish_percent > 0) religions.push(`Jewish: ${yearData.religion_jewish_percent}%`);
+                    if (yearData.religion_other_percent > 0) religions.push(`Other: ${yearData.religion_other_percent}%`);
+                    if (yearData.religion_nonreligious_percent > 0) religions.push(`Non-religious: ${yearData.religion_nonreligious_percent}%`);
+                    religionText = religions.length > 0 ? `<br><small style="color: #666;">🕊️ ${religions.join(', ')}</small>` : '';
+                }
+                
+                // Build race/ethnicity data if available
+                let raceText = '';
+                if (yearData.race_white_percent !== null) {
+                    const races = [];
+                    if (yearData.race_white_percent > 0) races.push(`White: ${yearData.race_white_percent}%`);
+                    if (yearData.race_black_percent > 0) races.push(`Black: ${yearData.race_black_percent}%`);
+                    if (yearData.race_asian_percent > 0) races.push(`Asian: ${yearData.race_asian_percent}%`);
+                    if (yearData.race_hispanic_percent > 0) races.push(`Hispanic: ${yearData.race_hispanic_percent}%`);
+                    if (yearData.race_native_american_percent > 0) races.push(`Native: ${yearData.race_native_american_percent}%`);
+                    if (yearData.race_pacific_islander_percent > 0) races.push(`Pacific: ${yearData.race_pacific_islander_percent}%`);
+                    if (yearData.race_other_percent > 0) races.push(`Other: ${yearData.race_other_percent}%`);
+                    raceText = races.length > 0 ? `<br><small style="color: #666;">🌍 ${races.join(', ')}</small>` : '';
+                }
+                
+                div.innerHTML = `
+                    <strong>${yearData.year}</strong><br>
+                    <small>Population: ${populationText}</small>
+                    ${capitalText}
+                    ${religionText}
+                    ${raceText}
+                `;
+                container.appendChild(div);
+            });
         }
     </script>
 </body>
 </html>
 """
 
-@app.route('/')
+@api.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return render_template_string(HTML_TEMPLATE, bootstrap=get_bootstrap_snapshot(), api_base=api_common.api_base(),
+                                  country_page_size=COUNTRY_PAGE_SIZE,
+                                  virtual_list_css=VIRTUAL_LIST_CSS, virtual_list_js=VIRTUAL_LIST_JS,
+                                  search_client_js=SEARCH_CLIENT_JS)
 
-@app.route('/health')
+@api.route('/health')
 def health():
-    return jsonify({'status': 'healthy', 'database': 'temporal', 'type': '3D with time dimension'})
+    """Check that the database answers queries; report pool state and dataset version"""
+    pool = served_pool()
+    try:
+        db = pool.connect()
+        latest_year = db.execute('SELECT MAX(year) FROM continents_temporal').fetchone()[0]
+        db.close()
+        version = pool.version
+    except (sqlite3.Error, OSError) as e:
+        return jsonify({'status': 'unhealthy', 'database': 'error', 'error': str(e), 'pool': pool.stats()}), 503
+    
+    return jsonify({
+        'status': 'healthy',
+        'database': 'temporal',
+        'type': '3D with time dimension',
+        'latest_year': latest_year,
+        'dataset_version': version,
+        'pool': pool.stats()
+    })
+
+app = api_common.create_app(__name__, [(api, '')])
 
 if __name__ == '__main__':
     print("🕐 Starting Temporal Geography Database...")
     
-    if not os.path.exists(app.config['DATABASE']):
-        print("❌ Temporal database not found! Please run create_temporal_database.py first.")
+    if not os.path.exists(app.config['TEMPORAL_DATABASE']):
+        print("❌ Temporal database not found! Please run build.py first (python build.py --only temporal).")
         exit(1)
+
+    api_common.ensure_migrated(app.config['TEMPORAL_DATABASE'])
     
     print("\n" + "="*60)
     print("🚀 Temporal Geography Database Server Ready!")
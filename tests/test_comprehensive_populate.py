@@ -0,0 +1,40 @@
+"""ComprehensiveGeographyPopulator.insert_countries matches stored countries by name and ISO3 code"""
+
+import os
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import comprehensive_populate
+
+def database():
+    db = sqlite3.connect(':memory:')
+    with open(os.path.join(ROOT, 'database_schema.sql')) as f:
+        db.executescript(f.read())
+    db.execute("INSERT OR IGNORE INTO continents (id, name, code) VALUES (3, 'Europe', 'EU')")
+    return db
+
+def country(name, code_iso3, code_iso2):
+    return (name, code_iso3, code_iso2, 3, None, None, None)
+
+def test_existing_country_keeps_its_id():
+    db = database()
+    populator = comprehensive_populate.ComprehensiveGeographyPopulator()
+    [(germany_id, _, _)] = populator.insert_countries(db, [country('Germany', 'DEU', 'DE')])
+
+    stored = populator.insert_countries(db, [country('Germany', 'DEU', 'DE'), country('France', 'FRA', 'FR')])
+
+    assert (germany_id, 'DEU', 'DE') in stored
+    assert [code for _, code, _ in stored] == ['DEU', 'FRA']
+
+def test_iso3_code_stored_under_another_name_is_left_out():
+    db = database()
+    populator = comprehensive_populate.ComprehensiveGeographyPopulator()
+    populator.insert_countries(db, [country('Czech Republic', 'CZE', 'CZ')])
+
+    stored = populator.insert_countries(db, [country('Czechia', 'CZE', 'CZ'), country('Austria', 'AUT', 'AT')])
+
+    assert [code for _, code, _ in stored] == ['AUT']
+    assert db.execute("SELECT name FROM countries WHERE code_iso3 = 'CZE'").fetchone()[0] == 'Czech Republic'
@@ -0,0 +1,35 @@
+"""Non-finite years are rejected by interpolation.py and /api/countries?interpolate=1"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import interpolation
+import temporal_app
+
+NON_FINITE = ['nan', 'NaN', 'inf', '-inf', 'Infinity', '1e400']
+
+@pytest.mark.parametrize('value', NON_FINITE)
+def test_fractional_year_rejects_non_finite(value):
+    with pytest.raises(interpolation.InterpolationError):
+        interpolation.fractional_year(value)
+
+def test_fractional_year_accepts_years_and_dates():
+    assert interpolation.fractional_year('2019.5') == 2019.5
+    assert interpolation.fractional_year('2021-01-01') == 2021.0
+
+def test_estimate_rejects_non_finite():
+    series = interpolation.load(os.path.join(ROOT, temporal_app.app.config['TEMPORAL_DATABASE']))
+    country_id = next(iter(series.countries))
+    with pytest.raises(interpolation.InterpolationError):
+        series.estimate(country_id, float('nan'))
+
+@pytest.mark.parametrize('value', NON_FINITE)
+def test_interpolated_countries_non_finite_year_is_400(value):
+    response = temporal_app.app.test_client().get(f'/api/countries?year={value}&interpolate=1')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -0,0 +1,38 @@
+"""benchmarks/synthetic_data.py builds datasets from analyzed and migrated source databases"""
+
+import os
+import shutil
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import migrate
+import synthetic_data
+
+def analyzed_copy(name, directory):
+    path = os.path.join(directory, name)
+    shutil.copy(os.path.join(ROOT, name), path)
+    db = sqlite3.connect(path)
+    db.execute('ANALYZE')
+    db.close()
+    return path
+
+def test_datasets_from_analyzed_sources(tmp_path, monkeypatch):
+    geography = analyzed_copy('geography.db', tmp_path)
+    temporal = analyzed_copy('geography_temporal.db', tmp_path)
+    migrate.upgrade(temporal)
+    monkeypatch.setattr(synthetic_data, 'SOURCE_GEOGRAPHY_DB', geography)
+    monkeypatch.setattr(synthetic_data, 'SOURCE_TEMPORAL_DB', temporal)
+
+    geography_path, temporal_path = synthetic_data.ensure_datasets(str(tmp_path / 'data'), 1)
+
+    plan = synthetic_data.scale_plan(1)
+    db = sqlite3.connect(geography_path)
+    assert db.execute('SELECT COUNT(*) FROM countries').fetchone()[0] == plan['countries']
+    db.close()
+    db = sqlite3.connect(temporal_path)
+    assert db.execute('SELECT COUNT(*) FROM countries_temporal').fetchone()[0] == plan['countries'] * plan['years']
+    assert migrate.current_version(db) == migrate.latest_version()
+    db.close()
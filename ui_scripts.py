@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Shared client-side scripts for the web interfaces
+Inlined into the HTML templates of app.py and temporal_app.py
+"""
+
+# Windowed list rendering: only the rows inside the scroll viewport (plus a small
+# overscan) exist in the DOM, so long lists stay responsive however many rows they hold.
+VIRTUAL_LIST_CSS = """
+        .virtual-scroll { position: relative; max-height: 70vh; overflow-y: auto; }
+        .virtual-row { box-sizing: border-box; overflow: hidden; padding: 4px 0; }
+        .virtual-row .location { margin: 0; height: 100%; box-sizing: border-box; overflow: hidden; }
+        .virtual-row small { display: inline-block; max-width: 100%; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; vertical-align: top; }
+        .virtual-row h4 { margin: 0; padding-top: 12px; }
+"""
+
+VIRTUAL_LIST_JS = """
+        // Rows come either from a local array (options.items) or from a paginated API
+        // (options.total plus options.fetchPage(offset, limit) returning a Promise of rows).
+        // rowHeight is a number, or a function of the item for local arrays.
+        class VirtualList {
+            constructor(container, options) {
+                this.container = container;
+                this.renderRow = options.renderRow;
+                this.rowHeight = options.rowHeight;
+                this.pageSize = options.pageSize || 100;
+                this.maxPages = options.maxPages || 50;
+                this.overscan = options.overscan || 8;
+                this.fetchPage = options.fetchPage || null;
+                this.retryDelay = options.retryDelay || 2000;
+                this.pages = new Map();
+                this.pending = new Set();
+                this.frame = null;
+
+                container.innerHTML = '';
+                container.classList.add('virtual-scroll');
+                this.spacer = document.createElement('div');
+                this.spacer.style.position = 'relative';
+                this.window = document.createElement('div');
+                this.window.style.position = 'absolute';
+                this.window.style.left = '0';
+                this.window.style.right = '0';
+                this.spacer.appendChild(this.window);
+                container.appendChild(this.spacer);
+
+                this.setItems(options.items, options.total);
+                if (container._virtualScroll) container.removeEventListener('scroll', container._virtualScroll);
+                container._virtualScroll = () => this.schedule();
+                container.addEventListener('scroll', container._virtualScroll, { passive: true });
+            }
+
+            setItems(items, total) {
+                this.items = items || null;
+                this.total = items ? items.length : total;
+                this.offsets = null;
+                if (this.items && typeof this.rowHeight === 'function') {
+                    this.offsets = new Float64Array(this.total + 1);
+                    for (let i = 0; i < this.total; i++) {
+                        this.offsets[i + 1] = this.offsets[i] + this.rowHeight(this.items[i]);
+                    }
+                }
+                this.spacer.style.height = `${this.offsetOf(this.total)}px`;
+            }
+
+            offsetOf(index) {
+                return this.offsets ? this.offsets[index] : index * this.rowHeight;
+            }
+
+            heightOf(index) {
+                return this.offsets ? this.offsets[index + 1] - this.offsets[index] : this.rowHeight;
+            }
+
+            indexAt(y) {
+                if (!this.offsets) return Math.floor(y / this.rowHeight);
+                let low = 0, high = this.total;
+                while (low < high) {
+                    const mid = (low + high) >> 1;
+                    if (this.offsets[mid + 1] <= y) low = mid + 1; else high = mid;
+                }
+                return low;
+            }
+
+            item(index) {
+                if (this.items) return this.items[index];
+                const page = this.pages.get(Math.floor(index / this.pageSize));
+                return page ? page[index % this.pageSize] : undefined;
+            }
+
+            ensurePages(first, last) {
+                if (!this.fetchPage) return;
+                for (let p = Math.floor(first / this.pageSize); p <= Math.floor(last / this.pageSize); p++) {
+                    if (this.pages.has(p) || this.pending.has(p)) continue;
+                    this.pending.add(p);
+                    this.fetchPage(p * this.pageSize, this.pageSize)
+                        .then(rows => {
+                            this.pages.set(p, rows);
+                            // Drop the oldest pages so memory stays bounded on very long lists
+                            while (this.pages.size > this.maxPages) {
+                                this.pages.delete(this.pages.keys().next().value);
+                            }
+                            this.pending.delete(p);
+                            this.schedule();
+                        })
+                        .catch(error => {
+                            // Rows of a failed page keep showing "Loading..." until the retry renders them
+                            console.error(`Error loading rows ${p * this.pageSize}-${(p + 1) * this.pageSize - 1}:`, error);
+                            setTimeout(() => {
+                                this.pending.delete(p);
+                                this.schedule();
+                            }, this.retryDelay);
+                        });
+                }
+            }
+
+            schedule() {
+                if (this.frame !== null) return;
+                this.frame = requestAnimationFrame(() => {
+                    this.frame = null;
+                    this.render();
+                });
+            }
+
+            render() {
+                if (this.total === 0) {
+                    this.window.innerHTML = '';
+                    return;
+                }
+                const top = this.container.scrollTop;
+                const bottom = top + (this.container.clientHeight || window.innerHeight);
+                const first = Math.max(0, this.indexAt(top) - this.overscan);
+                const last = Math.min(this.total - 1, this.indexAt(bottom) + this.overscan);
+                this.ensurePages(first, last);
+
+                let html = '';
+                for (let i = first; i <= last; i++) {
+                    const item = this.item(i);
+                    const content = item === undefined ? '<div class="location">Loading...</div>' : this.renderRow(item, i);
+                    html += `<div class="virtual-row" style="height: ${this.heightOf(i)}px">${content}</div>`;
+                }
+                this.window.style.top = `${this.offsetOf(first)}px`;
+                this.window.innerHTML = html;
+            }
+        }
+
+        // Build a VirtualList over a paginated endpoint returning {<key>: [...], total: N};
+        // options.firstPage is an already fetched first page (e.g. from an inlined snapshot)
+        function loadPagedList(container, url, key, options) {
+            const pageSize = options.pageSize || 100;
+            const separator = url.includes('?') ? '&' : '?';
+            const fetchPage = (offset, limit) => fetch(`${url}${separator}offset=${offset}&limit=${limit}`)
+                .then(response => {
+                    if (!response.ok) throw new Error(`${response.status} ${response.statusText}`);
+                    return response.json();
+                });
+
+            const first = options.firstPage ? Promise.resolve(options.firstPage) : fetchPage(0, pageSize);
+            return first.then(data => {
+                const list = new VirtualList(container, Object.assign({}, options, {
+                    total: data.total,
+                    pageSize: pageSize,
+                    fetchPage: (offset, limit) => fetchPage(offset, limit).then(page => page[key])
+                }));
+                list.pages.set(0, data[key]);
+                list.render();
+                return list;
+            });
+        }
+"""
+
+# Search-as-you-type: requests are debounced, superseded requests are aborted, recent
+# results are kept in a small LRU, and a query that extends an earlier one is answered by
+# filtering that earlier result locally (the search endpoints match on substrings, so the
+# results for "ger" contain every result for "germ").
+SEARCH_CLIENT_JS = """
+        class SearchClient {
+            constructor(options) {
+                this.url = options.url;              // (query, scope) => request URL
+                this.narrow = options.narrow || null; // (data, query) => data filtered to the longer query
+                this.normalize = options.normalize || (query => query.toLowerCase());
+                this.delay = options.delay || 250;
+                this.capacity = options.capacity || 50;
+                this.cache = new Map();
+                this.timer = null;
+                this.controller = null;
+                this.latest = null;
+            }
+
+            // Debounced entry point for input events
+            search(query, scope, callback, onError) {
+                clearTimeout(this.timer);
+                this.timer = setTimeout(() => this.run(query, scope, callback, onError), this.delay);
+            }
+
+            // Immediate lookup (cache, local narrowing, then network)
+            run(query, scope, callback, onError) {
+                clearTimeout(this.timer);
+                const key = `${scope}|${this.normalize(query)}`;
+                this.latest = key;
+
+                let data = this.lookup(key);
+                if (data === undefined && this.narrow) {
+                    data = this.narrowCached(query, scope);
+                    if (data !== undefined) this.remember(key, data);
+                }
+                if (data !== undefined) {
+                    this.abort();
+                    callback(data);
+                    return Promise.resolve(data);
+                }
+
+                this.abort();
+                const controller = new AbortController();
+                this.controller = controller;
+                return fetch(this.url(query, scope), { signal: controller.signal })
+                    .then(response => response.json())
+                    .then(data => {
+                        this.remember(key, data);
+                        if (this.latest === key) callback(data);
+                        return data;
+                    })
+                    .catch(error => {
+                        if (error.name !== 'AbortError' && this.latest === key && onError) onError(error);
+                    })
+                    .finally(() => {
+                        if (this.controller === controller) this.controller = null;
+                    });
+            }
+
+            abort() {
+                if (this.controller) this.controller.abort();
+                this.controller = null;
+            }
+
+            cancel() {
+                clearTimeout(this.timer);
+                this.abort();
+                this.latest = null;
+            }
+
+            lookup(key) {
+                if (!this.cache.has(key)) return undefined;
+                const data = this.cache.get(key);
+                this.cache.delete(key);
+                this.cache.set(key, data);
+                return data;
+            }
+
+            remember(key, data) {
+                this.cache.delete(key);
+                this.cache.set(key, data);
+                while (this.cache.size > this.capacity) {
+                    this.cache.delete(this.cache.keys().next().value);
+                }
+            }
+
+            // Find the longest cached query in the same scope that the new query contains
+            narrowCached(query, scope) {
+                const lowered = this.normalize(query);
+                const prefix = `${scope}|`;
+                let best = null;
+                for (const key of this.cache.keys()) {
+                    if (!key.startsWith(prefix)) continue;
+                    const cached = key.slice(prefix.length);
+                    if (cached && lowered.includes(cached) && (best === null || cached.length > best.length)) {
+                        best = cached;
+                    }
+                }
+                if (best === null) return undefined;
+                return this.narrow(this.lookup(prefix + best), query);
+            }
+        }
+
+        function matchesQuery(value, query) {
+            return value !== null && value !== undefined && String(value).toLowerCase().includes(query.toLowerCase());
+        }
+"""